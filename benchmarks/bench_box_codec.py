@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*- #
+#
+# benchmarks/bench_box_codec.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping Benchmark: Binary Box Codec against JSON and Pickle.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import io
+import json
+import pickle
+import timeit
+
+# ------------------------ Wrapping Library ------------------------ #
+
+from wrapping.box_extension import Box, BoxCodec, FrozenBox
+
+# ------------------------ Benchmark ------------------------ #
+
+RECORDS = [
+    Box(
+        {
+            "id": index,
+            "name": "user_{}".format(index),
+            "score": index / 7,
+            "active": index % 3 == 0,
+            "tags": ["a", "b", "c"][: index % 4],
+            "address": {"city": "city_{}".format(index % 50), "zip": 10000 + index},
+        }
+    )
+    for index in range(10000)
+]
+
+
+def _codec_dump(codec):
+    """
+    :param codec:
+    :return: Stream holding every record.
+    """
+    stream = io.BytesIO()
+    codec.dump(RECORDS, stream)
+    return stream.getvalue()
+
+
+def main(number=3):
+    """Run Benchmark."""
+    codec = BoxCodec()
+    frozen = BoxCodec(FrozenBox)
+    encoded = _codec_dump(codec)
+    lines = "\n".join(json.dumps(record.to_dict()) for record in RECORDS)
+    pickled = pickle.dumps(RECORDS, protocol=pickle.HIGHEST_PROTOCOL)
+    cases = {
+        "codec dump": (lambda: _codec_dump(codec), len(encoded)),
+        "codec load": (lambda: list(codec.load(io.BytesIO(encoded))), None),
+        "codec frozen": (lambda: list(frozen.load(io.BytesIO(encoded))), None),
+        "json dump": (
+            lambda: "\n".join(json.dumps(record.to_dict()) for record in RECORDS),
+            len(lines.encode("utf-8")),
+        ),
+        "json load": (
+            lambda: [Box(json.loads(line)) for line in lines.split("\n")],
+            None,
+        ),
+        "json frozen": (
+            lambda: [FrozenBox(json.loads(line)) for line in lines.split("\n")],
+            None,
+        ),
+        "pickle dump": (
+            lambda: pickle.dumps(RECORDS, protocol=pickle.HIGHEST_PROTOCOL),
+            len(pickled),
+        ),
+        "pickle load": (lambda: pickle.loads(pickled), None),
+    }
+    print("{:<14}{:>12}{:>12}".format("case", "ms", "bytes"))
+    for name, (case, size) in cases.items():
+        elapsed = timeit.timeit(case, number=number) / number
+        print("{:<14}{:>12.1f}{:>12}".format(name, elapsed * 1e3, size or ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*- #
+#
+# benchmarks/bench_box_defaults.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping Benchmark: Box Construction with Large Class Defaults.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import timeit
+import tracemalloc
+
+# ------------------------ External Library ------------------------ #
+
+import box
+
+# ------------------------ Wrapping Library ------------------------ #
+
+from wrapping.box_extension import Box
+
+# ------------------------ Benchmark ------------------------ #
+
+DEFAULTS = {"key_{}".format(index): index for index in range(10000)}
+
+
+class Layered(Box, defaults=DEFAULTS):
+    """Box with 10k layered defaults."""
+
+
+class Point(Box, defaults={"x": 0.0, "y": 0.0, "z": 0.0, "label": ""}):
+    """Fixed-Schema Box."""
+
+
+PointRecord = Point.compile_record()
+
+
+def merged(**overrides):
+    """Build Box by Copying every Default, as Box.__init__ used to."""
+    return box.Box(dict(DEFAULTS, **overrides))
+
+
+def memory(factory, count=100):
+    """Measure Average Memory per Instance.
+    :param factory: Instance factory.
+    :param count: Number of live instances.
+    :return: Bytes per instance.
+    """
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del instances
+    return used / count
+
+
+def main(number=200):
+    """Run Benchmark."""
+    cases = {
+        "merged": lambda: merged(key_1=-1, extra=True),
+        "layered": lambda: Layered(key_1=-1, extra=True),
+    }
+    print("{:<10}{:>16}{:>18}".format("case", "construct us", "bytes/instance"))
+    for name, factory in cases.items():
+        elapsed = timeit.timeit(factory, number=number) / number
+        print("{:<10}{:>16.1f}{:>18.0f}".format(name, elapsed * 1e6, memory(factory)))
+    instance = Layered(key_1=-1)
+    lookup = timeit.timeit(lambda: instance.key_9999, number=100000) / 100000
+    print("layered default attribute lookup: {:.3f} us".format(lookup * 1e6))
+    compiled = {
+        "box": lambda: Point(x=1.0, y=2.0),
+        "record": lambda: PointRecord(x=1.0, y=2.0),
+    }
+    print(
+        "{:<10}{:>16}{:>18}{:>12}".format(
+            "point", "construct us", "bytes/instance", "get ns"
+        )
+    )
+    for name, factory in compiled.items():
+        elapsed = timeit.timeit(factory, number=number) / number
+        point = factory()
+        get = timeit.timeit(lambda: point.x, number=100000) / 100000
+        print(
+            "{:<10}{:>16.1f}{:>18.0f}{:>12.0f}".format(
+                name, elapsed * 1e6, memory(factory, 10000), get * 1e9
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
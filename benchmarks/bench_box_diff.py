@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*- #
+#
+# benchmarks/bench_box_diff.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping Benchmark: Propagating Small Changes to Large Boxes.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import json
+import timeit
+
+# ------------------------ Wrapping Library ------------------------ #
+
+from wrapping.box_extension import FrozenBox, box_diff, box_patch
+
+# ------------------------ Benchmark ------------------------ #
+
+CONFIG = FrozenBox(
+    {
+        "section_{}".format(section): {
+            "entry_{}".format(entry): {"value": entry} for entry in range(100)
+        }
+        for section in range(200)
+    }
+)
+
+
+def main(number=20):
+    """Run Benchmark."""
+    new = CONFIG.evolve({("section_7", "entry_3", "value"): -1})
+    delta = box_diff(CONFIG, new)
+    cases = {
+        "resend tree": lambda: FrozenBox(json.loads(json.dumps(new.to_dict()))),
+        "diff": lambda: box_diff(CONFIG, new),
+        "diff + patch": lambda: box_patch(CONFIG, box_diff(CONFIG, new)),
+    }
+    print("{:<14}{:>12}".format("case", "ms"))
+    for name, case in cases.items():
+        elapsed = timeit.timeit(case, number=number) / number
+        print("{:<14}{:>12.3f}".format(name, elapsed * 1e3))
+    print("delta bytes: {}".format(len(json.dumps(delta))))
+    print("tree bytes: {}".format(len(json.dumps(new.to_dict()))))
+
+
+if __name__ == "__main__":
+    main()
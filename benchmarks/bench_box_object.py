@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*- #
+#
+# benchmarks/bench_box_object.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping Benchmark: BoxObject Attribute Get and Set.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import timeit
+
+# ------------------------ Wrapping Library ------------------------ #
+
+from wrapping.box_extension import BoxObject
+
+# ------------------------ Benchmark ------------------------ #
+
+
+class Wrapped:
+    """Object with Class and Instance Attributes."""
+
+    constant = 1
+
+    def __init__(self):
+        """Initialize Instance Attribute."""
+        self.field = 2
+
+
+class Slotted:
+    """Object without Instance Dictionary."""
+
+    __slots__ = ("field",)
+
+
+def main(number=200000):
+    """Run Benchmark."""
+    wrapped = BoxObject(Wrapped(), stored=3)
+    slotted = BoxObject(Slotted(), stored=3)
+
+    def assign(target):
+        target.stored = 4
+
+    cases = {
+        "get class attribute": lambda: wrapped.constant,
+        "get instance attribute": lambda: wrapped.field,
+        "get box attribute": lambda: wrapped.stored,
+        "get box (slots)": lambda: slotted.stored,
+        "set box attribute": lambda: assign(wrapped),
+        "set box (slots)": lambda: assign(slotted),
+    }
+    print("{:<26}{:>10}".format("case", "ns/op"))
+    for name, case in cases.items():
+        elapsed = min(timeit.repeat(case, number=number, repeat=5)) / number
+        print("{:<26}{:>10.0f}".format(name, elapsed * 1e9))
+    values = {"stored_{}".format(index): index for index in range(50)}
+
+    def one_by_one():
+        for key, value in values.items():
+            setattr(wrapped, key, value)
+
+    bulk = {
+        "setattr x50": one_by_one,
+        "update_attrs x50": lambda: wrapped.update_attrs(values),
+        "getattr x50": lambda: [getattr(wrapped, key) for key in values],
+        "get_attrs x50": lambda: wrapped.get_attrs(values),
+    }
+    for name, case in bulk.items():
+        elapsed = min(timeit.repeat(case, number=number // 50, repeat=5))
+        print("{:<26}{:>10.0f}".format(name, elapsed / (number // 50) * 1e9))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*- #
+#
+# benchmarks/bench_box_table.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping Benchmark: Memory of Box Lists and Columnar BoxTables.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import time
+import tracemalloc
+
+# ------------------------ Wrapping Library ------------------------ #
+
+from wrapping.box_extension import Box, BoxTable
+
+# ------------------------ Benchmark ------------------------ #
+
+
+def records(count):
+    """Generate Homogeneous Records."""
+    for index in range(count):
+        yield {
+            "id": index,
+            "score": index / 7,
+            "active": index % 3 == 0,
+            "region": "region_{}".format(index % 16),
+        }
+
+
+def measure(factory):
+    """Measure Construction Time and Retained Memory.
+    :param factory: Container factory.
+    :return: Container, seconds and bytes.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    container = factory()
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return container, elapsed, memory
+
+
+def main(count=100000):
+    """Run Benchmark."""
+    boxes, box_seconds, box_memory = measure(lambda: [Box(r) for r in records(count)])
+    table, table_seconds, table_memory = measure(lambda: BoxTable(records(count)))
+    print("{:<12}{:>12}{:>14}".format("case", "build s", "MiB"))
+    print(
+        "{:<12}{:>12.2f}{:>14.1f}".format("list[Box]", box_seconds, box_memory / 2**20)
+    )
+    print(
+        "{:<12}{:>12.2f}{:>14.1f}".format(
+            "BoxTable", table_seconds, table_memory / 2**20
+        )
+    )
+    start = time.perf_counter()
+    selected = [box for box in boxes if box.active and box.score > 100]
+    filter_boxes = time.perf_counter() - start
+    start = time.perf_counter()
+    filtered = table.filter(active=True, score=lambda score: score > 100)
+    filter_table = time.perf_counter() - start
+    assert len(selected) == len(filtered)
+    print(
+        "filter ms: list[Box] {:.1f}, BoxTable {:.1f}".format(
+            filter_boxes * 1e3, filter_table * 1e3
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*- #
+#
+# benchmarks/bench_extender.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping Benchmark: Building a Superset of a Large Module.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import json
+import statistics
+import subprocess
+import sys
+
+# ------------------------ Benchmark ------------------------ #
+
+SCRIPT = """
+import json, sys, time
+import wrapping.extender
+start = time.perf_counter()
+{build}
+elapsed = time.perf_counter() - start
+print(json.dumps(elapsed))
+"""
+
+CASES = {
+    "eager star copy": (
+        "import asyncio, types;"
+        "module = types.ModuleType('ext');"
+        "vars(module).update((n, getattr(asyncio, n)) for n in asyncio.__all__)"
+    ),
+    "extend": "module = wrapping.extender.extend('asyncio', name='ext')",
+    "extend + 1 name": (
+        "module = wrapping.extender.extend('asyncio', name='ext'); module.sleep"
+    ),
+}
+
+
+def measure(build, repeat=20):
+    """Measure Build Time in Fresh Interpreters.
+    :param build: Statements building the superset module.
+    :param repeat: Number of interpreters to start.
+    :return: Median seconds.
+    """
+    return statistics.median(
+        json.loads(
+            subprocess.check_output([sys.executable, "-c", SCRIPT.format(build=build)])
+        )
+        for _ in range(repeat)
+    )
+
+
+def main():
+    """Run Benchmark."""
+    print("{:<24}{:>12}".format("case", "median ms"))
+    for name, build in CASES.items():
+        print("{:<24}{:>12.3f}".format(name, measure(build) * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*- #
+#
+# benchmarks/bench_frozen_box.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping Benchmark: FrozenBox Hashing, Interning and Structural Sharing.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import timeit
+import tracemalloc
+
+# ------------------------ External Library ------------------------ #
+
+import box
+
+# ------------------------ Wrapping Library ------------------------ #
+
+from wrapping.box_extension import FrozenBox
+
+# ------------------------ Benchmark ------------------------ #
+
+CONFIG = {
+    "section_{}".format(index): {"key_{}".format(key): key for key in range(50)}
+    for index in range(50)
+}
+
+
+def memory(factory, count=200):
+    """Measure Memory for a Fleet of Instances.
+    :param factory: Instance factory.
+    :param count: Number of live instances.
+    :return: Total bytes.
+    """
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    instances = [factory(index) for index in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del instances
+    return used
+
+
+def main(number=1000):
+    """Run Benchmark."""
+    plain = box.Box(CONFIG, frozen_box=True)
+    frozen = FrozenBox(CONFIG)
+    print("{:<10}{:>14}".format("case", "hash us"))
+    for name, instance in (("box", plain), ("frozen", frozen)):
+        elapsed = timeit.timeit(lambda: hash(instance), number=number) / number
+        print("{:<10}{:>14.2f}".format(name, elapsed * 1e6))
+    fleet = {
+        "rebuilt": lambda index: box.Box(
+            dict(CONFIG, section_0={"key_0": index}), frozen_box=True
+        ),
+        "interned": lambda index: FrozenBox.intern(
+            dict(CONFIG, section_0={"key_0": index})
+        ),
+        "evolved": lambda index: frozen.evolve({("section_0", "key_0"): index}),
+    }
+    print("{:<10}{:>14}".format("fleet", "KiB"))
+    for name, factory in fleet.items():
+        print("{:<10}{:>14.0f}".format(name, memory(factory) / 1024))
+
+
+if __name__ == "__main__":
+    main()
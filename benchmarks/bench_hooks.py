@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*- #
+#
+# benchmarks/bench_hooks.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping Benchmark: Import Hook Dispatch Cost against Number of Hooks.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import timeit
+
+# ------------------------ Wrapping Library ------------------------ #
+
+from wrapping.importer import ImportHookRegistry
+
+# ------------------------ Benchmark ------------------------ #
+
+
+def build(count):
+    """Build Registry with Hooks for Many Plugin Packages.
+    :param count: Number of hooks.
+    :return: Registry.
+    """
+    registry = ImportHookRegistry()
+    registry.register_many(
+        ("myorg.plugins{}.*".format(index), lambda module: None)
+        for index in range(count)
+    )
+    registry.disable()
+    return registry
+
+
+def main(number=100000):
+    """Run Benchmark."""
+    print("{:>8}{:>16}".format("hooks", "match us/module"))
+    for count in (1, 10, 100, 1000, 10000):
+        registry = build(count)
+        elapsed = timeit.timeit(
+            lambda: registry.matches("myorg.plugins7.module.submodule"), number=number
+        )
+        print("{:>8}{:>16.3f}".format(count, elapsed / number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*- #
+#
+# benchmarks/bench_import.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping Benchmark: Startup Cost of `import wrapping`.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import json
+import statistics
+import subprocess
+import sys
+
+# ------------------------ Benchmark ------------------------ #
+
+SCRIPT = """
+import json, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+import wrapping
+{access}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, len(set(sys.modules) - before), "box" in sys.modules]))
+"""
+
+CASES = {
+    "import wrapping": "",
+    "wrapping.try_import": "wrapping.try_import",
+    "wrapping.Box": "wrapping.Box",
+    "wrapping.__all__": "wrapping.__all__",
+}
+
+
+def measure(access, repeat=20):
+    """Measure Import Time in Fresh Interpreters.
+    :param access: Statement executed after the import.
+    :param repeat: Number of interpreters to start.
+    :return: Median seconds, modules loaded and whether box was imported.
+    """
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, "-c", SCRIPT.format(access=access)]
+        )
+        runs.append(json.loads(output))
+    return (
+        statistics.median(run[0] for run in runs),
+        runs[0][1],
+        runs[0][2],
+    )
+
+
+def main():
+    """Run Benchmark."""
+    print("{:<24}{:>12}{:>10}{:>6}".format("case", "median ms", "modules", "box"))
+    for name, access in CASES.items():
+        elapsed, modules, box = measure(access)
+        print(
+            "{:<24}{:>12.3f}{:>10}{:>6}".format(name, elapsed * 1e3, modules, str(box))
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*- #
+#
+# benchmarks/bench_iter_boxes.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping Benchmark: Streaming JSON Lines into Boxes.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import json
+import os
+import tempfile
+import time
+
+# ------------------------ Wrapping Library ------------------------ #
+
+from wrapping.box_extension import Box, FrozenBox, iter_boxes
+
+# ------------------------ Benchmark ------------------------ #
+
+
+def write_records(path, count):
+    """Write JSON Lines Log.
+    :param path: Output path.
+    :param count: Number of records.
+    """
+    with open(path, "w") as stream:
+        for index in range(count):
+            record = {
+                "id": index,
+                "level": "info",
+                "message": "request {} served".format(index),
+                "context": {"user": index % 97, "tags": ["a", "b"]},
+            }
+            stream.write(json.dumps(record) + "\n")
+
+
+def eager(path):
+    """Load every Record up Front."""
+    with open(path) as stream:
+        return [Box(json.loads(line)) for line in stream.readlines()]
+
+
+def main(count=200000):
+    """Run Benchmark.
+    The workers case only beats serial decoding with spare cores and records
+    that are costly to decode; for these small records it is slower, since
+    each decoded record is pickled back to be boxed in this process.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "records.jsonl")
+        write_records(path, count)
+        cases = {
+            "eager list": lambda: len(eager(path)),
+            "iter_boxes": lambda: sum(1 for _ in iter_boxes(path)),
+            "iter_boxes frozen": lambda: sum(1 for _ in iter_boxes(path, FrozenBox)),
+            "iter_boxes 4 workers": lambda: sum(1 for _ in iter_boxes(path, workers=4)),
+        }
+        print("cpus: {}".format(os.cpu_count()))
+        print("{:<22}{:>14}".format("case", "records/s"))
+        for name, case in cases.items():
+            start = time.perf_counter()
+            total = case()
+            elapsed = time.perf_counter() - start
+            print("{:<22}{:>14.0f}".format(name, total / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*- #
+#
+# benchmarks/bench_lazy_box.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping Benchmark: Eager and Lazy Conversion of Large Nested Configurations.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import time
+import tracemalloc
+
+# ------------------------ Wrapping Library ------------------------ #
+
+from wrapping.box_extension import Box
+
+# ------------------------ Benchmark ------------------------ #
+
+
+def make_config(sections=200, entries=50):
+    """Build Nested Configuration.
+    :param sections: Number of top-level sections.
+    :param entries: Number of entries per section.
+    :return:
+    """
+    return {
+        "section_{}".format(section): {
+            "entry_{}".format(entry): {"value": entry, "tags": ["a", "b"]}
+            for entry in range(entries)
+        }
+        for section in range(sections)
+    }
+
+
+def measure(factory):
+    """Measure Construction and Sparse Access.
+    :param factory: Box factory.
+    :return: Construction seconds, access seconds and peak bytes.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    config = factory()
+    built = time.perf_counter()
+    for section in range(0, 200, 20):
+        config["section_{}".format(section)].entry_7.value
+    accessed = time.perf_counter()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return built - start, accessed - built, peak
+
+
+def main():
+    """Run Benchmark."""
+    config = make_config()
+    cases = {
+        "eager": lambda: Box(config),
+        "lazy": lambda: Box(config, box_lazy=True),
+    }
+    print("{:<8}{:>14}{:>14}{:>14}".format("case", "build ms", "access ms", "peak KiB"))
+    for name, factory in cases.items():
+        build, access, peak = measure(factory)
+        print(
+            "{:<8}{:>14.1f}{:>14.2f}{:>14.0f}".format(
+                name, build * 1e3, access * 1e3, peak / 1024
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
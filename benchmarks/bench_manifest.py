@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*- #
+#
+# benchmarks/bench_manifest.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping Benchmark: Cold-Start Imports with and without an ImportManifest.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# ------------------------ Benchmark ------------------------ #
+
+SCRIPT = """
+import json, sys, time
+sys.path[:0] = {path!r}
+start = time.perf_counter()
+from wrapping.importer import ImportManifest, try_import
+if {mode!r} == "replay":
+    ImportManifest.load({manifest!r}, install=True)
+names = ["bench_module_{{}}".format(index) for index in range({modules})]
+if {mode!r} == "record":
+    manifest = ImportManifest()
+    with manifest.record():
+        try_import(names)
+    manifest.freeze({manifest!r})
+else:
+    try_import(names)
+print(json.dumps(time.perf_counter() - start))
+"""
+
+
+def build_tree(root, path_entries, modules):
+    """Build Long sys.path with Modules in its Last Entry.
+    :param root: Temporary directory.
+    :param path_entries: Number of sys.path entries.
+    :param modules: Number of modules.
+    :return: List of path entries.
+    """
+    path = []
+    for index in range(path_entries):
+        entry = os.path.join(root, "entry_{}".format(index))
+        os.mkdir(entry)
+        for filler in range(20):
+            open(os.path.join(entry, "filler_{}.py".format(filler)), "w").close()
+        path.append(entry)
+    for index in range(modules):
+        with open(os.path.join(path[-1], "bench_module_{}.py".format(index)), "w") as f:
+            f.write("value = {}\n".format(index))
+    return path
+
+
+def run(mode, path, manifest, modules):
+    """Run Import Script in a Fresh Interpreter.
+    :return: Seconds spent importing.
+    """
+    script = SCRIPT.format(path=path, mode=mode, manifest=manifest, modules=modules)
+    return json.loads(subprocess.check_output([sys.executable, "-c", script]))
+
+
+def main(path_entries=200, modules=200, repeat=10):
+    """Run Benchmark."""
+    with tempfile.TemporaryDirectory() as root:
+        path = build_tree(root, path_entries, modules)
+        manifest = os.path.join(root, "manifest.json")
+        run("record", path, manifest, modules)
+        print("{:<10}{:>12}".format("mode", "median ms"))
+        for mode in ("normal", "replay"):
+            elapsed = statistics.median(
+                run(mode, path, manifest, modules) for _ in range(repeat)
+            )
+            print("{:<10}{:>12.3f}".format(mode, elapsed * 1e3))
+
+
+if __name__ == "__main__":
+    main()
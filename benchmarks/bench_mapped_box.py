@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*- #
+#
+# benchmarks/bench_mapped_box.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping Benchmark: Loading a Large Configuration as FrozenBox and MappedBox.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+# ------------------------ Wrapping Library ------------------------ #
+
+from wrapping.box_extension import FrozenBox, MappedBox
+
+# ------------------------ Benchmark ------------------------ #
+
+CONFIG = {
+    "service_{}".format(index): {
+        "host": "10.0.{}.{}".format(index // 256, index % 256),
+        "port": 8000 + index,
+        "tags": ["web", "internal"],
+        "limits": {"cpu": 0.5, "memory": 512},
+    }
+    for index in range(20000)
+}
+
+
+def measure(load, lookups=1000):
+    """Measure Loading, Memory and Lookups.
+    :param load: Loader returning a mapping.
+    :param lookups: Number of lookups.
+    :return: Load seconds, traced bytes and seconds per lookup.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    config = load()
+    loaded = time.perf_counter()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    start_lookup = time.perf_counter()
+    for index in range(lookups):
+        config["service_{}".format(index * 7)]["limits"]["memory"]
+    elapsed = time.perf_counter() - start_lookup
+    return loaded - start, memory, elapsed / lookups
+
+
+def main():
+    """Run Benchmark."""
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "config.json")
+        mapped_path = os.path.join(directory, "config.box")
+        with open(json_path, "w") as json_file:
+            json.dump(CONFIG, json_file)
+        MappedBox.build(CONFIG, mapped_path).close()
+
+        def frozen():
+            with open(json_path) as json_file:
+                return FrozenBox(json.load(json_file))
+
+        cases = {"FrozenBox": frozen, "MappedBox": lambda: MappedBox(mapped_path)}
+        print(
+            "{:<12}{:>12}{:>16}{:>14}".format(
+                "case", "load ms", "private KiB", "lookup us"
+            )
+        )
+        for name, load in cases.items():
+            seconds, memory, lookup = measure(load)
+            print(
+                "{:<12}{:>12.1f}{:>16.0f}{:>14.2f}".format(
+                    name, seconds * 1e3, memory / 1024, lookup * 1e6
+                )
+            )
+        print("file size: {:.0f} KiB".format(os.path.getsize(mapped_path) / 1024))
+
+
+if __name__ == "__main__":
+    main()
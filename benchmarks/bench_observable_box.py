@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*- #
+#
+# benchmarks/bench_observable_box.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping Benchmark: Incremental Recomputation with Observable Boxes.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import timeit
+
+# ------------------------ Wrapping Library ------------------------ #
+
+from wrapping.box_extension import Box, ObservableBox
+
+# ------------------------ Benchmark ------------------------ #
+
+SECTIONS = {
+    "service_{}".format(index): {"host": "host_{}".format(index), "port": index}
+    for index in range(500)
+}
+
+
+def _derive(section):
+    """
+    :param section:
+    :return: Derived setting of one section.
+    """
+    return "{}:{}".format(section["host"], section["port"])
+
+
+def main(number=200):
+    """Run Benchmark."""
+    plain = Box(SECTIONS)
+    observed = ObservableBox(SECTIONS)
+    derived = {name: _derive(section) for name, section in observed.items()}
+
+    def recompute(changes):
+        for change in changes:
+            name = change.path[0]
+            derived[name] = _derive(observed[name])
+
+    observed.subscribe((), recompute)
+
+    def full():
+        plain.service_7.port += 1
+        return {name: _derive(section) for name, section in plain.items()}
+
+    def incremental():
+        observed.service_7.port += 1
+
+    def batched():
+        with observed.transaction():
+            for index in range(10):
+                observed["service_{}".format(index)].port += 1
+
+    cases = {
+        "full recompute": full,
+        "incremental": incremental,
+        "transaction x10": batched,
+        "set plain": lambda: setattr(plain.service_3, "port", 1),
+        "set observed": lambda: setattr(observed.service_3, "port", 1),
+    }
+    print("{:<18}{:>12}".format("case", "us"))
+    for name, case in cases.items():
+        elapsed = timeit.timeit(case, number=number) / number
+        print("{:<18}{:>12.1f}".format(name, elapsed * 1e6))
+
+
+if __name__ == "__main__":
+    main()
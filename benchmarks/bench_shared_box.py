@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*- #
+#
+# benchmarks/bench_shared_box.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping Benchmark: Config Fan-Out by Pickling over Pipes and by SharedBox.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import multiprocessing
+import pickle
+import time
+
+# ------------------------ Wrapping Library ------------------------ #
+
+from wrapping.box_extension import Box, SharedBox
+
+# ------------------------ Benchmark ------------------------ #
+
+CONFIG = Box(
+    {
+        "service_{}".format(index): {"port": 8000 + index, "tags": ["a", "b"]}
+        for index in range(2000)
+    }
+)
+
+
+def pipe_reader(connection):
+    """Receive Pickled Boxes until None."""
+    while True:
+        data = connection.recv_bytes()
+        config = pickle.loads(data)
+        if config is None:
+            return
+        connection.send(config.version)
+
+
+def shared_reader(name, connection):
+    """Follow SharedBox Generations until Version is None."""
+    shared = SharedBox.attach(name)
+    seen = shared.generation
+    while True:
+        if shared.generation == seen:
+            time.sleep(0.0005)
+            continue
+        seen = shared.generation
+        config = shared.snapshot()
+        if config.version is None:
+            break
+        connection.send(config.version)
+    shared.close()
+
+
+def fan_out(readers, rounds, shared):
+    """Time Config Updates Reaching every Reader.
+    :param readers: Number of reader processes.
+    :param rounds: Number of updates.
+    :param shared: Use SharedBox instead of pipes.
+    :return: Seconds per update.
+    """
+    owner = SharedBox.create() if shared else None
+    pipes = [multiprocessing.Pipe() for _ in range(readers)]
+    processes = [
+        multiprocessing.Process(
+            target=shared_reader if shared else pipe_reader,
+            args=(owner.name, child) if shared else (child,),
+        )
+        for _, child in pipes
+    ]
+    for process in processes:
+        process.start()
+    elapsed = 0
+    for version in range(rounds):
+        config = Box(CONFIG, version=version)
+        start = time.perf_counter()
+        if shared:
+            owner.publish(config)
+        else:
+            data = pickle.dumps(config)
+            for parent, _ in pipes:
+                parent.send_bytes(data)
+        for parent, _ in pipes:
+            parent.recv()
+        elapsed += time.perf_counter() - start
+    if shared:
+        owner.publish({"version": None})
+    else:
+        for parent, _ in pipes:
+            parent.send_bytes(pickle.dumps(None))
+    for process in processes:
+        process.join()
+    if shared:
+        owner.close()
+    return elapsed / rounds
+
+
+def main(rounds=5):
+    """Run Benchmark."""
+    print("{:<10}{:>14}{:>14}".format("readers", "pickle ms", "shared ms"))
+    for readers in (1, 4, 16, 64):
+        pickled = fan_out(readers, rounds, False)
+        shared = fan_out(readers, rounds, True)
+        print("{:<10}{:>14.1f}{:>14.1f}".format(readers, pickled * 1e3, shared * 1e3))
+
+
+if __name__ == "__main__":
+    main()
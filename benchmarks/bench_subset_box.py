@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*- #
+#
+# benchmarks/bench_subset_box.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping Benchmark: Copying and Viewing Subsets of Large Mappings.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import timeit
+
+# ------------------------ Wrapping Library ------------------------ #
+
+from wrapping.box_extension import subset_box
+
+# ------------------------ Benchmark ------------------------ #
+
+TOTAL = {"key_{}".format(index): {"value": index} for index in range(1000000)}
+KEYS = frozenset("key_{}".format(index) for index in range(0, 1000000, 100))
+
+
+def select(total):
+    """Select every hundredth Key by Copying."""
+    return {k: total[k] for k in KEYS}
+
+
+def read(subset):
+    """Read 1k nested Values."""
+    return [subset["key_{}".format(i)]["value"] for i in range(0, 100000, 100)]
+
+
+def main(number=3):
+    """Run Benchmark.
+    Views create the views of nested mappings on first access, so the first
+    read of each key is reported separately from later reads.
+    """
+    cases = {
+        "copy whole": lambda: subset_box(TOTAL),
+        "view whole": lambda: subset_box(TOTAL, view=True),
+        "copy 1%": lambda: subset_box(TOTAL, select),
+        "view 1%": lambda: subset_box(TOTAL, KEYS, view=True),
+    }
+    print(
+        "{:<12}{:>14}{:>18}{:>16}".format(
+            "case", "extract ms", "first read 1k us", "read 1k us"
+        )
+    )
+    for name, factory in cases.items():
+        elapsed = timeit.timeit(factory, number=number) / number
+        subset = factory()
+        first = timeit.timeit(lambda: read(subset), number=1)
+        again = timeit.timeit(lambda: read(subset), number=number) / number
+        print(
+            "{:<12}{:>14.2f}{:>18.1f}{:>16.1f}".format(
+                name, elapsed * 1e3, first * 1e6, again * 1e6
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
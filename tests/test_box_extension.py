@@ -30,6 +30,17 @@
 Wrapping: Box Extension Tests.
 """
 
+# ------------------------ Standard Library ------------------------ #
+
+import io
+import json
+import os
+import pickle
+import subprocess
+import sys
+from collections import OrderedDict
+from copy import copy
+
 # ------------------------ External Library ------------------------ #
 
 import pytest
@@ -39,9 +50,601 @@ from hypothesis.stateful import RuleBasedStateMachine, rule, invariant
 
 # ------------------------ Wrapping Library ------------------------ #
 
-from wrapping.box_extension import BoxObject
+from wrapping.box_extension import (
+    Box,
+    BoxChange,
+    BoxCodec,
+    BoxObject,
+    BoxTable,
+    BoxView,
+    FrozenBox,
+    MappedBox,
+    ObservableBox,
+    SharedBox,
+    box_diff,
+    box_patch,
+    iter_boxes,
+    subset_box,
+)
+
+requires_box = pytest.mark.skipif(
+    BoxObject == NotImplemented, reason="python-box is not installed"
+)
 
 
-@pytest.mark.skipif(BoxObject == NotImplemented)
+@requires_box
 class TestBoxObject:
-    pass
+    class Wrapped:
+        constant = 1
+
+        def __init__(self):
+            self.field = 2
+
+    class Slotted:
+        __slots__ = ("field",)
+
+    def test_attribute_routing(self):
+        wrapped = self.Wrapped()
+        proxy = BoxObject(wrapped)
+        proxy.stored = 3
+        proxy.field = 4
+        assert (proxy.constant, proxy.field, proxy.stored) == (1, 4, 3)
+        assert wrapped.field == 4 and "stored" not in vars(wrapped)
+        wrapped.stored = 5
+        assert proxy.stored == 5
+        del wrapped.stored
+        assert proxy.stored == 3
+        del proxy.stored
+        with pytest.raises(AttributeError):
+            proxy.stored
+        slotted = BoxObject(self.Slotted())
+        slotted.field, slotted.stored = 1, 2
+        assert slotted.__dict__ == {"field": 1, "stored": 2}
+
+    def test_bulk_attributes(self):
+        wrapped = self.Wrapped()
+        proxy = BoxObject(wrapped, stored=0)
+        proxy.update_attrs({"field": 5, "constant": 6}, stored=7, extra={"a": 1})
+        assert vars(wrapped) == {"field": 5, "constant": 6}
+        assert proxy.__dict__.stored == 7 and proxy.extra.a == 1
+        assert proxy.get_attrs(["field", "constant", "stored"]) == {
+            "field": 5,
+            "constant": 6,
+            "stored": 7,
+        }
+        with pytest.raises(AttributeError):
+            proxy.get_attrs(["missing"])
+
+    def test_class_attribute_added_later(self):
+        class Changing:
+            pass
+
+        proxy = BoxObject(Changing(), value=1)
+        assert proxy.value == 1
+        Changing.value = property(lambda _: 2)
+        assert proxy.value == 2
+        Changing.extra = 3
+        assert proxy.extra == 3
+        del Changing.value
+        assert proxy.value == 1
+
+    def test_setter_added_later(self):
+        class Slotted:
+            __slots__ = ("stored",)
+
+        proxy = BoxObject(Slotted())
+        proxy.value = 1
+        assert proxy.value == 1 and not hasattr(proxy.__wrapped__, "stored")
+
+        def setter(self, value):
+            self.stored = value
+
+        Slotted.value = property(lambda self: getattr(self, "stored", 0), setter)
+        proxy.value = 2
+        assert proxy.__wrapped__.stored == 2
+        proxy.update_attrs(value=3)
+        assert proxy.__wrapped__.stored == 3 and proxy.value == 3
+
+
+@requires_box
+class TestBoxDefaults:
+    class Config(Box, defaults={"name": "config", "nested": {"entries": [1]}}):
+        pass
+
+    class Permanent(Config, defaults={"level": 1}, frozen_defaults=True):
+        pass
+
+    def test_layered_lookup(self):
+        config = self.Config(level=2)
+        assert dict.__len__(config) == 1
+        assert config.name == "config"
+        assert config == {"name": "config", "nested": {"entries": [1]}, "level": 2}
+        assert list(config) == ["name", "nested", "level"]
+        assert len(config) == 3
+        assert "name" in config
+
+    def test_defaults_are_not_shared(self):
+        config = self.Config(name="other")
+        config.nested.entries.append(2)
+        assert self.Config().nested.entries == [1]
+        assert self.Config().name == "config"
+        assert dict(self.Config.defaults) == {
+            "name": "config",
+            "nested": {"entries": [1]},
+        }
+        with pytest.raises(TypeError):
+            self.Config.defaults["name"] = "leaked"
+
+    def test_delete_default(self):
+        config = self.Config()
+        del config.name
+        assert "name" not in config
+        assert config.to_dict() == {"nested": {"entries": [1]}}
+        config.name = "restored"
+        assert config.name == "restored"
+        copied = config.copy()
+        assert type(copied) is self.Config
+        assert copied == config
+
+    def test_clear_and_len(self):
+        config = self.Config(level=2)
+        config.nested.entries.append(2)
+        del config.name
+        assert len(config) == len(list(config)) == 2
+        config.update(name="updated")
+        assert len(config) == 3 and config.name == "updated"
+        config.clear()
+        assert len(config) == 0 and list(config) == [] and "name" not in config
+        assert config.get("nested") is None
+        config.name = "restored"
+        assert len(config) == 1 and config == {"name": "restored"}
+
+    def test_frozen_defaults(self):
+        assert self.Permanent(level=1, extra=2).extra == 2
+        assert self.Permanent().name == "config"
+        with pytest.raises(TypeError):
+            self.Permanent(level=2)
+
+    def test_compile_record(self):
+        Record = self.Config.compile_record()
+        assert Record is self.Config.compile_record()
+        assert Record.__slots__ == ("name", "nested")
+        record = Record(name="other")
+        assert record.name == "other" and record.nested.entries == [1]
+        record.nested.entries.append(2)
+        assert Record().nested.entries == [1]
+        assert type(record.to_box()) is self.Config
+        assert Record.from_box(record.to_box()) == record
+        assert pickle.loads(pickle.dumps(record)) == record
+        with pytest.raises(TypeError):
+            Record(missing=1)
+        with pytest.raises(AttributeError):
+            record.missing = 1
+        Permanent = self.Permanent.compile_record()
+        assert Permanent(level=1).level == 1
+        with pytest.raises(TypeError):
+            Permanent(level=2)
+
+    def test_frozen_box(self):
+        frozen = FrozenBox({"x": {"y": 1}}, z=2)
+        assert frozen.x.y == 1 and frozen.z == 2
+        assert hash(frozen) == hash(FrozenBox({"x": {"y": 1}}, z=2))
+        assert frozen.missing is None
+        with pytest.raises(Exception):
+            frozen.z = 3
+
+
+@requires_box
+class TestLazyBox:
+    data = {"a": {"b": {"c": [{"d": 1}]}}, "e": [1, {"f": 2}], "g": 3}
+
+    class Lazy(Box, defaults={"box_lazy": True, "name": "lazy"}):
+        pass
+
+    class Frozen(FrozenBox, defaults={"box_lazy": True}):
+        pass
+
+    def test_converted_on_access(self):
+        lazy = Box(self.data, box_lazy=True)
+        assert type(dict.__getitem__(lazy, "a")) is dict
+        assert lazy.a.b.c[0].d == 1
+        assert isinstance(dict.__getitem__(lazy, "a"), Box)
+        assert lazy.a is lazy.a and lazy.e[1].f == 2
+        lazy.a = {"x": 1}
+        assert lazy.a.x == 1
+        assert Box(self.data, box_lazy=True) == Box(self.data)
+
+    def test_defaults(self):
+        lazy = self.Lazy(self.data)
+        assert lazy.name == "lazy" and lazy.a.b.c[0].d == 1
+        assert lazy.a._box_config["box_lazy"] is True
+        assert lazy.to_dict() == dict(self.data, name="lazy")
+
+    def test_copy(self):
+        lazy = Box(self.data, box_lazy=True)
+        copied = lazy.copy()
+        assert isinstance(copied, Box) and copied._box_config["box_lazy"] is True
+        assert type(dict.__getitem__(copied, "a")) is dict
+        assert copied.a.b.c[0].d == 1 and type(dict.__getitem__(lazy, "a")) is dict
+        assert type(dict.__getitem__(copy(lazy), "e")) is list and copied == lazy
+        defaults = self.Lazy(self.data).copy()
+        assert isinstance(defaults, self.Lazy) and defaults.name == "lazy"
+        assert type(dict.__getitem__(defaults, "a")) is dict
+
+    def test_frozen(self):
+        frozen = self.Frozen(self.data)
+        assert type(dict.__getitem__(frozen, "a")) is dict
+        assert hash(frozen) == hash(self.Frozen(self.data))
+        assert isinstance(frozen.a, self.Frozen)
+        with pytest.raises(Exception):
+            frozen.a.x = 1
+        evolved = frozen.evolve(g=4)
+        assert evolved.e[1].f == 2 and evolved.g == 4
+
+
+@requires_box
+class TestFrozenBoxSharing:
+    def test_cached_hash_and_copy(self):
+        frozen = FrozenBox({"x": {"y": 1}})
+        assert hash(frozen) == hash(frozen) == frozen.__dict__["_box_hash"]
+        assert frozen.copy() is frozen
+        assert frozen.missing is None
+        assert "missing" not in frozen
+
+    def test_intern(self):
+        first = FrozenBox.intern({"x": {"y": 1}, "z": 2})
+        second = FrozenBox.intern(FrozenBox({"x": {"y": 1}, "z": 2}))
+        assert first is second
+        other = FrozenBox.intern({"w": {"y": 1}})
+        assert other.w is first.x
+
+    def test_evolve(self):
+        frozen = FrozenBox({"x": {"y": 1, "z": {"w": 2}}, "v": {"u": 3}})
+        evolved = frozen.evolve({("x", "y"): 5}, t={"s": 4})
+        assert evolved.x.y == 5 and frozen.x.y == 1
+        assert evolved.t.s == 4 and isinstance(evolved.t, FrozenBox)
+        assert evolved.x.z is frozen.x.z
+        assert evolved.v is frozen.v
+        with pytest.raises(Exception):
+            evolved.v = 1
+        with pytest.raises(TypeError):
+            frozen.evolve({("v", "u", "r"): 1})
+
+
+@requires_box
+class TestSubsetView:
+    def test_read_only_view(self):
+        total = {"a": {"b": {"c": 1}}, "d": 2, "e": 3}
+        view = subset_box(total, ["a", "d", "missing"], view=True)
+        assert isinstance(view, BoxView)
+        assert list(view) == ["a", "d"] and len(view) == 2
+        assert view.a.b.c == 1 and view.a.b is view.a.b
+        assert "e" not in view
+        with pytest.raises(AttributeError):
+            view.e
+        with pytest.raises(TypeError):
+            view.d = 3
+        assert view.to_box() == Box({"a": {"b": {"c": 1}}, "d": 2})
+
+    def test_nested_values(self):
+        nested = Box(x=1)
+        total = {"box": nested, "ordered": OrderedDict(y=2), "list": [{"z": 3}]}
+        view = subset_box(total, view=True)
+        assert view.box is nested and view.list is total["list"]
+        assert isinstance(view.ordered, BoxView) and view.ordered.y == 2
+
+    def test_write_through_view(self):
+        total = {"a": {"b": 1}}
+        view = subset_box(
+            total, lambda x: x, view=True, writable=True, name_for_original="orig"
+        )
+        assert view.orig is total
+        view.a.b = 2
+        view.x = 3
+        del view["a"]
+        assert total == {"x": 3}
+
+
+@requires_box
+class TestIterBoxes:
+    records = [{"id": index, "tags": {"even": index % 2 == 0}} for index in range(20)]
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        path = tmp_path / "records.jsonl"
+        lines = [json.dumps(record) for record in self.records]
+        path.write_text("\n".join(lines[:10]) + "\n\n" + "\n".join(lines[10:]))
+        return path
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_path(self, path, workers):
+        boxes = list(iter_boxes(str(path), chunk_size=7, workers=workers))
+        assert boxes == self.records
+        assert all(type(record) is Box for record in boxes)
+        assert boxes[3].tags.even is False
+
+    def test_file_object(self, path):
+        stream = io.StringIO(path.read_text())
+        boxes = list(iter_boxes(stream, FrozenBox, chunk_size=64))
+        assert boxes == self.records and isinstance(boxes[0], FrozenBox)
+        assert list(iter_boxes(io.BytesIO(b'[1]\n{"a": 1}'))) == [[1], {"a": 1}]
+
+
+@requires_box
+class TestMappedBox:
+    data = {
+        "section": {"entries": [1, {"name": "ñ"}], "ratio": 0.5, "raw": b"x"},
+        "enabled": True,
+        "large": 1 << 70,
+        "empty": {},
+    }
+
+    @pytest.fixture
+    def mapped(self, tmp_path):
+        mapped = MappedBox.build(Box(self.data), str(tmp_path / "config.box"))
+        yield mapped
+        mapped.close()
+
+    def test_lookup(self, mapped):
+        assert len(mapped) == 4 and sorted(mapped) == sorted(self.data)
+        assert mapped.section.entries[1].name == "ñ"
+        assert mapped["large"] == 1 << 70 and mapped.enabled is True
+        assert mapped.missing is None and "missing" not in mapped
+        with pytest.raises(KeyError):
+            mapped["missing"]
+        with pytest.raises(TypeError):
+            mapped.enabled = False
+        assert mapped.to_dict() == self.data
+
+    def test_frozen_box_compatible(self, mapped):
+        frozen = FrozenBox(self.data)
+        assert mapped == frozen and frozen == mapped
+        assert hash(mapped) == hash(frozen)
+        assert {frozen: 1}[mapped] == 1
+        assert mapped.to_box() == frozen and mapped.copy() is mapped
+
+    def test_pickle(self, mapped):
+        section = pickle.loads(pickle.dumps(mapped.section))
+        assert section == mapped.section and section.ratio == 0.5
+        section.close()
+
+    def test_invalid_file(self, tmp_path):
+        path = tmp_path / "invalid.box"
+        path.write_bytes(b"not a mapped box")
+        with pytest.raises(ValueError):
+            MappedBox(str(path))
+        with pytest.raises(TypeError):
+            MappedBox.build({1: 2}, str(path))
+        assert [p.name for p in tmp_path.iterdir()] == ["invalid.box"]
+
+
+@requires_box
+@pytest.mark.skipif(SharedBox == NotImplemented, reason="needs shared_memory")
+class TestSharedBox:
+    def test_publish_and_attach(self):
+        with SharedBox.create() as owner:
+            reader = SharedBox.attach(owner.name)
+            assert reader.generation == 0 and reader.snapshot() is None
+            assert owner.publish(Box(version=1, nested={"entries": [1, 2]})) == 1
+            first = reader.snapshot()
+            assert first.version == 1 and first.nested.entries == (1, 2)
+            assert reader.snapshot() is first
+            owner.publish({"version": 2})
+            assert reader.generation == 2
+            assert reader.snapshot().version == 2
+            assert first.version == 1 and owner.snapshot() == {"version": 2}
+            with pytest.raises(TypeError):
+                reader.publish({})
+            reader.close()
+
+    def test_reader_process_exit(self):
+        code = "from wrapping.box_extension import SharedBox\n"
+        code += "print(SharedBox.attach({!r}).snapshot().version)"
+        with SharedBox.create({"version": 1}) as owner:
+            reader = subprocess.run(
+                [sys.executable, "-c", code.format(owner.name)],
+                capture_output=True,
+                env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+                text=True,
+            )
+            assert (reader.stdout, reader.stderr) == ("1\n", "")
+            assert SharedBox.attach(owner.name).snapshot().version == 1
+
+
+@requires_box
+class TestBoxDiff:
+    old = {"a": {"b": 1, "c": {"d": [1, 2]}}, "e": 2, "f": {"g": 1}}
+
+    def test_diff(self):
+        old = FrozenBox(self.old)
+        new = old.evolve({("a", "b"): 5, ("a", "x"): {"y": 1}}, remove=["e"])
+        delta = box_diff(old, new)
+        assert delta == {
+            "added": [[["a", "x"], {"y": 1}]],
+            "removed": [["e"]],
+            "changed": [[["a", "b"], 5]],
+        }
+        assert json.loads(json.dumps(delta)) == delta
+        assert box_diff(new, new) == {"added": [], "removed": [], "changed": []}
+
+    def test_patch_frozen(self):
+        old = FrozenBox(self.old)
+        new = FrozenBox(self.old).evolve({("f", "h"): 2}, remove=[("f", "g")])
+        patched = box_patch(old, box_diff(old, new))
+        assert patched == new and old == FrozenBox(self.old)
+        assert patched.a is old.a
+
+    def test_patch_in_place(self):
+        box = Box(self.old)
+        target = Box(self.old, e={"z": [3]})
+        del target.a.c
+        assert box_patch(box, box_diff(box, target)) is box
+        assert box == target
+
+
+@requires_box
+class TestBoxTable:
+    records = [
+        {"id": 1, "name": "a", "ok": True, "score": 1.5, "meta": {"x": 1}},
+        {"id": 2, "name": "b", "ok": False, "score": 2.5, "meta": {"x": 2}},
+        {"id": 3, "name": "c", "ok": True, "score": 0.5, "meta": {"x": 3}},
+    ]
+
+    def test_columns_and_rows(self):
+        table = BoxTable(self.records)
+        assert table.columns == ("id", "name", "ok", "score", "meta")
+        assert table.column("id").typecode == "q"
+        assert table.column("score").typecode == "d"
+        assert isinstance(table.column("name"), list)
+        row = table[1]
+        assert (row.id, row.ok, row.meta.x) == (2, False, 2)
+        assert table[-1].name == "c" and len(table) == 3
+        assert [row.to_dict() for row in table] == self.records
+        with pytest.raises(AttributeError):
+            row.missing
+
+    def test_write_through(self):
+        table = BoxTable(self.records)
+        table[0].score = 9.0
+        table[0].id = "first"
+        assert table.column("score")[0] == 9.0
+        assert table.column("id") == ["first", 2, 3]
+        table.append({"id": 4, "extra": True})
+        assert table[3].extra is True and table[0].extra is None
+
+    def test_filter_and_select(self):
+        table = BoxTable(self.records)
+        assert table.mask(ok=True) == [True, False, True]
+        selected = table.filter(ok=True, score=lambda score: score > 1)
+        assert [row.name for row in selected] == ["a"]
+        projected = table.select("name", "score")
+        assert projected.column("score") is table.column("score")
+        assert projected.filter([False, True, True]).column("name") == ["b", "c"]
+        with pytest.raises(ValueError):
+            table.filter([True])
+
+    def test_select_copy_on_write(self):
+        table = BoxTable(self.records)
+        projected = table.select("name", "score")
+        projected[0].score = 9.0
+        projected.append({"name": "d", "score": 4.5})
+        assert table.column("score").tolist() == [1.5, 2.5, 0.5]
+        assert table.column("name") == ["a", "b", "c"] and len(table) == 3
+        table[1].name = "x"
+        assert [row.name for row in projected] == ["a", "b", "c", "d"]
+
+    def test_extend_typed_columns(self):
+        table = BoxTable()
+        table.extend(self.records)
+        assert table.column("id").typecode == "q"
+        assert table.column("ok").typecode == "b"
+        assert table.column("score").typecode == "d"
+        assert [row.to_dict() for row in table] == self.records
+
+
+@requires_box
+class TestBoxCodec:
+    class Settings(Box, defaults={"host": "localhost", "port": 80, "tags": []}):
+        pass
+
+    value = {
+        "a": {"b": [1, {"c": -2.5}], "my key": b"x", 5: None, "t": (1, 2)},
+        "big": -(1 << 70),
+        "ok": True,
+    }
+
+    def test_round_trip(self):
+        codec = BoxCodec()
+        decoded = codec.loads(codec.dumps(Box(self.value)))
+        assert decoded == self.value and type(decoded) is Box
+        assert isinstance(decoded.a.b[1], Box) and decoded.a.my_key == b"x"
+        plain = codec.loads(codec.dumps(self.value))
+        assert plain == self.value and type(plain["a"]["b"]) is list
+
+    def test_subclass_defaults(self):
+        codec = BoxCodec()
+        settings = self.Settings(port=8080)
+        del settings["host"]
+        decoded = codec.loads(codec.dumps(settings))
+        assert type(decoded) is self.Settings and list(dict.keys(decoded)) == ["port"]
+        assert decoded.port == 8080 and decoded.tags == []
+        assert "host" not in decoded
+
+    def test_frozen(self):
+        data = BoxCodec().dumps(Box(self.value))
+        frozen = BoxCodec(FrozenBox).loads(data)
+        expected = FrozenBox(self.value)
+        assert type(frozen) is FrozenBox and frozen == expected
+        assert hash(frozen) == hash(expected)
+        assert isinstance(frozen.a.b, tuple) and isinstance(frozen.a.b[1], FrozenBox)
+        with pytest.raises(Exception):
+            frozen.ok = False
+
+    def test_stream(self):
+        codec = BoxCodec()
+        records = [{"id": index, "name": str(index)} for index in range(100)]
+        stream = io.BytesIO()
+        assert codec.dump(records, stream) == 100
+        single = sum(len(codec.dumps(record)) for record in records)
+        assert len(stream.getvalue()) < single
+        stream.seek(0)
+        assert list(codec.load(stream)) == records
+
+    def test_invalid(self):
+        codec = BoxCodec()
+        data = codec.dumps(self.value)
+        for invalid in (b"", data[:-1], data + b"x", data[:4] + b"\x01Z"):
+            with pytest.raises(ValueError):
+                codec.loads(invalid)
+        with pytest.raises(ValueError):
+            list(codec.load(io.BytesIO(data[:-1])))
+        with pytest.raises(TypeError):
+            codec.dumps({"set": {1}})
+
+
+@requires_box
+class TestObservableBox:
+    @staticmethod
+    def observed():
+        config = ObservableBox({"db": {"host": "a", "port": 1}, "web": {"port": 2}})
+        events = {"db": [], "port": [], "all": []}
+        config.subscribe("db", events["db"].append)
+        config.db.subscribe("port", events["port"].append)
+        config.subscribe((), events["all"].append)
+        return config, events
+
+    def test_key_path_events(self):
+        config, events = self.observed()
+        config.db.port = 5
+        config.web.port = 3
+        assert events["port"] == [(BoxChange(("db", "port"), 1, 5),)]
+        assert events["db"] == events["port"] and len(events["all"]) == 2
+        del config.db.host
+        config.db = {"port": 6}
+        assert events["db"][1] == (BoxChange(("db", "host"), "a", BoxChange.MISSING),)
+        assert events["port"][1][0].path == ("db",)
+        config.db.unsubscribe("port", events["port"].append)
+        config.db.port = 7
+        assert len(events["port"]) == 2 and len(events["db"]) == 4
+
+    def test_transaction(self):
+        config, events = self.observed()
+        with config.transaction():
+            config.db.host = "b"
+            config.db.host = "c"
+            config.web.port = 9
+            config.web.port = 2
+            config.new = 1
+        assert events["db"] == [(BoxChange(("db", "host"), "a", "c"),)]
+        assert events["all"][0][1] == BoxChange(("new",), BoxChange.MISSING, 1)
+        assert len(events["all"]) == 1 and len(events["all"][0]) == 2
+        config.update(new=2, other=3)
+        assert len(events["all"]) == 2 and len(events["all"][1]) == 2
+
+    def test_copies_are_independent(self):
+        config, events = self.observed()
+        copied = pickle.loads(pickle.dumps(config))
+        assert copied == config and type(copied.db) is ObservableBox
+        copied.db.port = 3
+        config.copy().db = None
+        assert not events["all"]
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*- #
+#
+# tests/test_extender.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping: Test Extended Modules.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import json
+import subprocess
+import sys
+
+# ------------------------ External Library ------------------------ #
+
+import pytest
+
+# ------------------------ Wrapping Library ------------------------ #
+
+from wrapping import wrappers
+from wrapping.extender import ExtendedModule, extend
+
+
+def test_superset():
+    class extra:
+        dumps = "extended"
+
+    module = extend(
+        json, {".wrappers": ("value_or",), extra: ("dumps",)}, package="wrapping"
+    )
+    assert isinstance(module, ExtendedModule) and module.__name__ == "json"
+    assert module.__extensions__ == ("value_or", "dumps")
+    assert module.__all__[-2:] == module.__extensions__
+    assert set(module.__all__) == set(json.__all__) | {"value_or"}
+    assert module.loads is json.loads and module.value_or is wrappers.value_or
+    assert module.dumps == "extended"
+    assert {"loads", "value_or", "dumps"} <= set(dir(module))
+    assert not any(name.startswith("_extended_") for name in dir(module))
+    with pytest.raises(AttributeError):
+        module.missing
+    with pytest.raises(AttributeError):
+        module.__path__
+
+
+def test_lazy_resolution():
+    script = (
+        "import sys;"
+        "from wrapping.extender import extend;"
+        "module = extend('wave', {'colorsys': ('rgb_to_hsv',)}, name='ext');"
+        "assert 'wave' not in sys.modules and 'colorsys' not in sys.modules;"
+        "module.rgb_to_hsv;"
+        "assert 'colorsys' in sys.modules and 'wave' not in sys.modules;"
+        "assert 'rgb_to_hsv' in vars(module);"
+        "module.open;"
+        "assert 'wave' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_extended_registry():
+    import wrapping.extended as extended
+
+    name = extended.register(
+        "json", extensions={".wrappers": ("value_or",)}, package="wrapping"
+    )
+    try:
+        assert name == "wrapping.extended.json" and name not in sys.modules
+        assert "json" in extended.registered() and "json" in dir(extended)
+        from wrapping.extended.json import loads, value_or
+
+        module = sys.modules[name]
+        assert loads is json.loads and value_or is wrappers.value_or
+        assert extended.json is module and module.__spec__.name == name
+        with pytest.raises(ValueError):
+            extended.register("json")
+    finally:
+        extended.unregister("json")
+    assert name not in sys.modules
+    with pytest.raises(ImportError):
+        import wrapping.extended.json
+    with pytest.raises(AttributeError):
+        extended.missing
+
+
+def test_extended_import_is_lazy():
+    script = (
+        "import sys, wrapping.extended;"
+        "wrapping.extended.register('ext', 'wave', {'colorsys': ('rgb_to_hsv',)});"
+        "import wrapping.extended.ext as ext;"
+        "assert 'wave' not in sys.modules and 'colorsys' not in sys.modules;"
+        "from wrapping.extended.ext import open, rgb_to_hsv;"
+        "assert 'wave' in sys.modules and 'colorsys' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
@@ -31,3 +31,328 @@ Wrapping: Test Importers.
 """
 
 # ------------------------ Wrapping Library ------------------------ #
+
+# ------------------------ Standard Library ------------------------ #
+
+import os
+import sys
+import threading
+import uuid
+
+# ------------------------ External Library ------------------------ #
+
+import pytest
+from wrapt import ObjectProxy, register_post_import_hook
+
+# ------------------------ Wrapping Library ------------------------ #
+
+from wrapping.importer import (
+    ImportCache,
+    ImportHookRegistry,
+    ImportManifest,
+    LazyModule,
+    fallback_import,
+    fallback_selection,
+    import_profiler,
+    try_import,
+    warm_imports,
+)
+
+
+@pytest.fixture
+def make_module(tmp_path, monkeypatch):
+    """Build Temporary Importable Modules."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    created = []
+
+    def make(source="", name=None, package=False):
+        name = name or "_wrapping_test_{}".format(uuid.uuid4().hex)
+        path = tmp_path.joinpath(*name.split("."))
+        if package:
+            path.mkdir()
+            path = path / "__init__.py"
+        else:
+            path = path.with_suffix(".py")
+        path.write_text(source)
+        created.append(name)
+        return name
+
+    yield make
+    for name in created:
+        sys.modules.pop(name, None)
+
+
+def test_try_import(make_module):
+    name = make_module("value = 1")
+    module, success = try_import(name)
+    assert success
+    assert module.value == 1
+    assert try_import(make_module() + "_missing", default=0) == (0, False)
+
+
+def test_lazy_try_import(make_module):
+    name = make_module("value = 1")
+    module, success = try_import(name, lazy=True)
+    assert success
+    assert isinstance(module, LazyModule)
+    assert name not in sys.modules
+    assert module.__name__ == name
+    assert module.__spec__.name == name
+    assert name not in sys.modules
+    assert module.value == 1
+    assert name in sys.modules
+    assert module.__wrapped__ is sys.modules[name]
+
+
+def test_lazy_try_import_missing(make_module):
+    name = make_module() + "_missing"
+    assert try_import(name, lazy=True, default=1) == (1, False)
+    assert try_import([name, "sys"], lazy=True) == ((None, sys), (False, True))
+
+
+def test_lazy_try_import_threaded(make_module):
+    name = make_module("import time\ntime.sleep(0.05)\ncount = [0]\ncount[0] += 1")
+    module, _ = try_import(name, lazy=True)
+    threads = [threading.Thread(target=lambda: module.count) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert module.count == [1]
+
+
+def test_import_cache_negative(make_module):
+    cache = ImportCache()
+    name = make_module() + "_missing"
+    assert try_import(name, cache=cache) == (None, False)
+    assert try_import(name, cache=cache) == (None, False)
+    assert cache.stats["negative_hits"] == 1
+    assert try_import("sys", cache=cache) == (sys, True)
+
+
+def test_import_cache_installed_after_miss(make_module, tmp_path):
+    cache = ImportCache()
+    name = make_module() + "_late"
+    assert try_import(name, cache=cache) == (None, False)
+    make_module("value = 6", name=name)
+    os.utime(str(tmp_path), ns=(0, os.stat(str(tmp_path)).st_mtime_ns + 10**9))
+    module, success = try_import(name, cache=cache)
+    assert success and module.value == 6
+    assert cache.stats["invalidations"] == 1
+
+
+def test_import_cache_fallback(make_module):
+    cache = ImportCache()
+    anchor = make_module() + "_missing"
+    for _ in range(3):
+        assert (
+            fallback_import(".path", anchor, "os", cache=cache, refresh=True) is os.path
+        )
+    assert cache.stats == dict(
+        entries=1, hits=2, misses=1, negative_hits=0, invalidations=0
+    )
+
+
+def test_import_cache_persistence(make_module, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("cache") / "import_cache.json")
+    cache = ImportCache(path)
+    name = make_module() + "_missing"
+    try_import(name, cache=cache)
+    cache.flush()
+    assert len(ImportCache(path)) == 1
+    make_module()
+    assert len(ImportCache(path)) == 0
+
+
+def test_parallel_try_import(make_module):
+    package = make_module("loaded = []", package=True)
+    make_module("from . import loaded\nloaded.append('a')", name=package + ".a")
+    missing = make_module() + "_missing"
+    names = [package + ".a", missing, package, "json"]
+    timings = {}
+    modules, successes = try_import(names, workers=4, timings=timings)
+    assert successes == (True, False, True, True)
+    assert modules[0] is sys.modules[package + ".a"]
+    assert modules[0] is modules[2].a
+    assert modules[2].loaded == ["a"]
+    assert modules[3] is sys.modules["json"]
+    assert set(timings) == set(names)
+    assert all("load" in timing for timing in timings.values())
+    assert "find" in timings[package + ".a"] and "find" in timings[missing]
+
+
+def test_parallel_try_import_executes_on_caller(make_module):
+    timings = {}
+    source = "import threading\nTHREAD = threading.current_thread().name"
+    package = make_module(source, package=True)
+    make_module(source, name=package + ".a")
+    make_module(source, name=package + ".b")
+    names = [package + ".b", package + ".a", make_module(source)]
+    modules, successes = try_import(names, workers=4, timings=timings)
+    assert all(successes)
+    caller = threading.current_thread().name
+    assert sys.modules[package].THREAD == caller
+    assert [module.THREAD for module in modules] == [caller] * 3
+    assert all("find" in timing for timing in timings.values())
+
+
+def test_try_import_list_without_seeds(make_module, monkeypatch):
+    class MetaPath(list):
+        def insert(self, index, finder):
+            raise AssertionError("sys.meta_path modified")
+
+    monkeypatch.setattr(sys, "meta_path", MetaPath(sys.meta_path))
+    assert all(try_import([make_module(), "json"])[1])
+    assert all(try_import(["json", "os"], workers=4)[1])
+
+
+def test_import_profiler(make_module):
+    package = make_module("import time\ntime.sleep(0.01)", package=True)
+    make_module("import time\ntime.sleep(0.02)", name=package + ".child")
+    make_module("from . import child", name=package + ".parent")
+    with import_profiler() as profiler:
+        module, _ = try_import(package + ".parent")
+    assert not profiler.enabled
+    assert module.__spec__.loader is module.__loader__
+    assert not isinstance(module.__loader__, ObjectProxy)
+    parent = profiler.get(package + ".parent")
+    child = profiler.get(package + ".child")
+    assert child.parent is parent
+    assert parent.children == [child]
+    assert child.self_time >= 0.02
+    assert parent.wall >= child.wall
+    assert parent.self_time < child.self_time
+    assert profiler.top(1, key="wall")[0] is parent
+    assert "{};{}".format(parent.name, child.name) in profiler.folded()[1]
+    assert profiler.as_dicts()[2] == parent.as_dict()
+    assert parent.as_dict()["children"] == [child.name]
+
+
+def test_import_profiler_with_hooks(make_module):
+    first, second = make_module("value = 1"), make_module("value = 2")
+    seen = []
+    register_post_import_hook(lambda module: seen.append("wrapt"), second)
+    registry = ImportHookRegistry()
+    registry.register(first, lambda module: seen.append("registry"))
+    try:
+        with import_profiler() as profiler:
+            assert try_import(first)[0].value == 1
+            assert try_import(second)[0].value == 2
+    finally:
+        registry.disable()
+    assert seen == ["registry", "wrapt"]
+    assert [record.path for record in profiler.records] == [[first], [second]]
+
+
+def test_import_hook_registry(make_module):
+    package = make_module(package=True)
+    make_module(package=True, name=package + ".plugins")
+    for plugin in ("a", "b", "c_plugin"):
+        make_module(name="{}.plugins.{}".format(package, plugin))
+    registry = ImportHookRegistry()
+    seen = []
+    registry.register_many(
+        {
+            package + ".plugins.*": lambda module: seen.append(("all", module)),
+            package + ".plugins.*_plugin": lambda module: seen.append(("c", module)),
+            package: lambda module: seen.append(("root", module)),
+        }
+    )
+    try:
+        try_import(package + ".plugins.c_plugin")
+        assert [tag for tag, _ in seen] == ["root", "all", "c"]
+        assert seen[-1][1] is sys.modules[package + ".plugins.c_plugin"]
+        assert not isinstance(seen[-1][1].__loader__, ObjectProxy)
+
+        @registry.when_imported(package + ".plugins.a")
+        def hook(module):
+            seen.append(("a", module))
+
+        assert seen[-1][0] == "c"
+        try_import(package + ".plugins.a")
+        assert [tag for tag, _ in seen[-2:]] == ["all", "a"]
+        assert set(registry.timings) == {
+            package + suffix for suffix in ("", ".plugins.a", ".plugins.c_plugin")
+        }
+        assert registry.matches(package + ".other") == []
+        assert len(registry) == 4
+    finally:
+        registry.disable()
+
+
+def test_import_hook_registry_with_wrapt(make_module):
+    name = make_module()
+    seen = []
+    register_post_import_hook(lambda module: seen.append("wrapt"), name)
+    registry = ImportHookRegistry()
+    registry.register(name, lambda module: seen.append("registry"))
+    try:
+        try_import(name)
+    finally:
+        registry.disable()
+    assert sorted(seen) == ["registry", "wrapt"]
+
+
+def test_fallback_import_chain(make_module):
+    first, second = make_module() + "_missing", make_module() + "_missing"
+    third = make_module("value = 3")
+    names = (first, second, third, "json")
+    assert fallback_selection(names) is None
+    assert fallback_import(names).value == 3
+    assert fallback_selection(names) == (third, None)
+    sys.modules.pop(third)
+    make_module(name=second)
+    assert fallback_import(names).value == 3
+    assert fallback_import(names, refresh=True).__name__ == second
+    assert fallback_selection(names) == (second, None)
+    assert fallback_import(".path", first, second, "os") is os.path
+    assert fallback_selection(".path", first, second, "os") == (".path", "os")
+    with pytest.raises(ImportError):
+        fallback_import((first, first + "_other"))
+    with pytest.raises(ValueError):
+        fallback_import(())
+
+
+def test_import_manifest(make_module, tmp_path_factory):
+    package = make_module(package=True)
+    make_module("value = 4", name=package + ".child")
+    path = str(tmp_path_factory.mktemp("manifest") / "manifest.json")
+    manifest = ImportManifest()
+    with manifest.record():
+        try_import(package + ".child")
+    assert set(manifest.entries) == {package, package + ".child"}
+    manifest.freeze(path)
+    sys.modules.pop(package + ".child")
+    sys.modules.pop(package)
+    replay = ImportManifest.load(path, install=True)
+    try:
+        module, success = try_import(package + ".child")
+        assert success and module.value == 4
+        assert replay.stats == {"entries": 2, "hits": 2, "misses": 0}
+        assert try_import("json")[1]
+    finally:
+        replay.uninstall()
+    assert ImportManifest(dict(replay.entries)).find_spec("missing") is None
+
+
+def test_import_manifest_in_profiler(make_module):
+    name = make_module("value = 7")
+    manifest = ImportManifest()
+    with import_profiler() as profiler:
+        with manifest.record():
+            assert try_import(name)[0].value == 7
+    assert list(manifest.entries) == [name]
+    assert manifest.entries[name]["loader"] == "source"
+    assert [record.name for record in profiler.records] == [name]
+
+
+def test_warm_imports(make_module, tmp_path):
+    package = make_module(package=True)
+    make_module("value = 5", name=package + ".unused")
+    missing = make_module() + "_missing"
+    report = warm_imports([package, missing], workers=1)
+    assert report[package]["success"] and report[package]["compiled"]
+    assert not report[missing]["success"] and not report[missing]["compiled"]
+    assert report[package]["seconds"] >= 0
+    assert package + ".unused" not in sys.modules
+    assert list((tmp_path / package / "__pycache__").glob("unused.*.pyc"))
@@ -30,6 +30,11 @@
 Wrapping: Test that Wrapping is a Supermodule of Wrapt.
 """
 
+# ------------------------ Standard Library ------------------------ #
+
+import subprocess
+import sys
+
 # ------------------------ External Library ------------------------ #
 
 import pytest
@@ -44,6 +49,8 @@ def test_import():
     import wrapping._version
     import wrapping.box_extension
     import wrapping.decorators
+    import wrapping.extended
+    import wrapping.extender
     import wrapping.importer
     import wrapping.wrappers
 
@@ -54,3 +61,26 @@ def test_supermodule(name):
         getattr(wrapt, name)
     except AttributeError:
         assert name in wrapping.__extensions__
+
+
+@pytest.mark.parametrize(
+    "name", ("box_extension", "decorators", "importer", "wrappers")
+)
+def test_lazy_exports(name):
+    module = getattr(wrapping, name)
+    assert set(module.__all__) <= set(wrapping._exports["." + name])
+    if name != "box_extension":
+        assert module.__all__ == wrapping._exports["." + name]
+
+
+def test_lazy_box_import():
+    script = (
+        "import sys, wrapping;"
+        "assert 'box' not in sys.modules;"
+        "assert 'wrapping.box_extension' not in sys.modules;"
+        "wrapping.Bounded;"
+        "assert 'box' not in sys.modules;"
+        "wrapping.Box;"
+        "assert 'box' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
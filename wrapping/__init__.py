@@ -32,29 +32,152 @@ Wrapping Library.
 
 # ------------------------ Standard Library ------------------------ #
 
-from inspect import getcallargs
+import sys
+from importlib import import_module
 
 # ------------------------ Wrapping Library ------------------------ #
 
-from .decorators import *
-from .importer import *
-from .wrappers import *
-from .box_extension import *
-
 from ._version import __version__, __version_info__
 
+_submodules = ("box_extension", "decorators", "importer", "wrappers")
+
+_exports = {
+    "inspect": ("getcallargs",),
+    ".box_extension": (
+        "Box",
+        "FrozenBox",
+        "ObservableBox",
+        "BoxChange",
+        "BoxView",
+        "MappedBox",
+        "SharedBox",
+        "subset_box",
+        "iter_boxes",
+        "box_diff",
+        "box_patch",
+        "BoxTable",
+        "BoxCodec",
+        "BoxObject",
+    ),
+    ".decorators": (
+        "adapter_factory",
+        "AdapterFactory",
+        "decorator",
+        "synchronized",
+        "classproperty",
+    ),
+    ".importer": (
+        "register_post_import_hook",
+        "when_imported",
+        "notify_module_loaded",
+        "discover_post_import_hooks",
+        "fallback_import",
+        "fallback_selection",
+        "try_import",
+        "LazyModule",
+        "ImportCache",
+        "ImportRecord",
+        "ImportProfiler",
+        "import_profiler",
+        "ImportHookRegistry",
+        "ImportManifest",
+        "warm_imports",
+    ),
+    ".wrappers": (
+        "ObjectProxy",
+        "CallableObjectProxy",
+        "FunctionWrapper",
+        "BoundFunctionWrapper",
+        "WeakFunctionProxy",
+        "resolve_path",
+        "apply_patch",
+        "wrap_object",
+        "wrap_object_attribute",
+        "function_wrapper",
+        "wrap_function_wrapper",
+        "patch_function_wrapper",
+        "transient_function_wrapper",
+        "value_or",
+        "FullObjectProxy",
+        "Restricted",
+        "Bounded",
+    ),
+}
+
+_locations = {name: module for module, names in _exports.items() for name in names}
+
+
+def _load(name):
+    """Import Submodule.
+    :param name: Name of the submodule.
+    :return: Submodule.
+    """
+    return import_module("." + name, __name__)
+
+
+def _compute_all():
+    """
+    :return: Public names of the Wrapping Library.
+    """
+    box_extension, decorators, importer, wrappers = map(_load, _submodules)
+    return (
+        ("getcallargs",)
+        + box_extension.__all__
+        + decorators.__all__
+        + importer.__all__
+        + wrappers.__all__
+    )
+
+
+def _compute_extensions():
+    """
+    :return: Names which extend the Wrapt Library.
+    """
+    box_extension, decorators, importer, wrappers = map(_load, _submodules)
+    return (
+        box_extension.__all__
+        + decorators.__extensions__
+        + importer.__extensions__
+        + wrappers.__extensions__
+    )
+
+
+_computed = {"__all__": _compute_all, "__extensions__": _compute_extensions}
+
+
+def __getattr__(name):
+    """Resolve Public Names and Submodules on First Access.
+    :param name: Attribute name.
+    :return: Attribute value, cached in the module namespace.
+    """
+    if name in _computed:
+        value = _computed[name]()
+    elif name in _submodules:
+        value = _load(name)
+    elif name in _locations:
+        location = _locations[name]
+        module = import_module(location, __name__)
+        if location.startswith(".") and name not in module.__all__:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(__name__, name)
+            )
+        value = getattr(module, name)
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """
+    :return: Names in the module namespace and lazily resolved names.
+    """
+    return sorted(set(globals()) | set(_computed) | set(_submodules) | set(_locations))
+
 
-__all__ = (
-    ("getcallargs",)
-    + box_extension.__all__
-    + decorators.__all__
-    + importer.__all__
-    + wrappers.__all__
-)
-
-__extensions__ = (
-    box_extension.__all__
-    + decorators.__extensions__
-    + importer.__extensions__
-    + wrappers.__extensions__
-)
+if sys.version_info < (3, 7):
+    for _name in tuple(_computed) + tuple(_locations):
+        try:
+            __getattr__(_name)
+        except AttributeError:
+            pass
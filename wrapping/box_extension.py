@@ -32,7 +32,26 @@ Wrapping Library: Box Extension.
 
 # ------------------------ Standard Library ------------------------ #
 
-from collections.abc import Mapping
+import io
+import json
+import mmap
+import operator
+import os
+import struct
+import time
+import weakref
+from array import array
+from collections import deque, namedtuple
+from collections.abc import ItemsView, KeysView, Mapping, MutableMapping, ValuesView
+from contextlib import contextmanager
+from copy import deepcopy
+from functools import partial
+from importlib import import_module
+from importlib.util import find_spec
+from itertools import compress
+from keyword import iskeyword
+from threading import RLock
+from types import MappingProxyType
 
 # ------------------------ External Library ------------------------ #
 
@@ -43,49 +62,326 @@ import wrapt
 from .wrappers import value_or
 
 
-__extensions__ = ("Box", "FrozenBox", "subset_box")
+__extensions__ = (
+    "Box",
+    "FrozenBox",
+    "ObservableBox",
+    "BoxChange",
+    "BoxView",
+    "MappedBox",
+    "subset_box",
+    "iter_boxes",
+    "box_diff",
+    "box_patch",
+    "BoxTable",
+    "BoxCodec",
+)
+
+_has_shared_memory = (
+    find_spec("_winapi" if os.name == "nt" else "_posixshmem") is not None
+)
+
+if _has_shared_memory:
+    __extensions__ += ("SharedBox",)
 
 
 try:
     import box
 
+    try:
+        from box.box import BOX_PARAMETERS as _BOX_PARAMETERS
+    except ImportError:
+        _BOX_PARAMETERS = box.BOX_PARAMETERS
+
     __extensions__ += ("BoxObject",)
     __all__ = __extensions__
     _Box = box.Box
 except ImportError:
     box = None
+    _BOX_PARAMETERS = ()
     _Box = object
     __all__ = ()
 
 
+_BOX_OPTIONS = tuple(_BOX_PARAMETERS) + ("box_lazy",)
+
+
+class _Deferred:
+    """
+    Placeholder for a Nested Container Converted on First Access.
+
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        """Initialize Placeholder.
+        :param value: Unconverted dict or list.
+        """
+        self.value = value
+
+
+def _defer(items, recast):
+    """Replace Nested Containers with Placeholders.
+    :param items: Pairs of keys and values.
+    :param recast: Keys recast by Box, which are never deferred.
+    :return: Generator of pairs.
+    """
+    for k, v in items:
+        if type(v) in (dict, list) and k not in recast:
+            v = _Deferred(v)
+        yield k, v
+
+
+class _BoxRecord:
+    """
+    Base of Slotted Record Classes Compiled from Box Defaults.
+
+    """
+
+    __slots__ = ()
+    _fields = ()
+    _box_class = None
+
+    def __init__(self, *args, **kwargs):
+        """Initialize Record from Defaults.
+        :param args: Field values in declaration order.
+        :param kwargs: Field values by name.
+        """
+        box_class = self._box_class
+        if len(args) > len(self._fields):
+            raise TypeError(
+                "{} takes at most {} positional arguments.".format(
+                    type(self).__name__, len(self._fields)
+                )
+            )
+        for name, value in zip(self._fields, args):
+            if name in kwargs:
+                raise TypeError("Got multiple values for field {!r}.".format(name))
+            kwargs[name] = value
+        for name in kwargs:
+            if name not in box_class._default_layer:
+                raise TypeError(
+                    "{} has no field {!r}.".format(type(self).__name__, name)
+                )
+        for name, default in box_class._default_layer.items():
+            if name in kwargs:
+                value = kwargs[name]
+                if box_class.frozen_defaults and value != default:
+                    raise TypeError(
+                        "Box default {key}={value} is permanent.".format(
+                            key=name, value=default
+                        )
+                    )
+            elif isinstance(default, (Mapping, list)):
+                value = deepcopy(default)
+            else:
+                value = default
+            if type(value) is dict:
+                value = box_class._default_options.get("box_class", Box)(value)
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        """
+        :param name:
+        :param value:
+        """
+        if self._box_class._default_options.get("frozen_box"):
+            raise box.BoxError("Box is frozen")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        """
+        :param name:
+        """
+        raise TypeError("Cannot delete field {!r} of a record.".format(name))
+
+    def __eq__(self, other):
+        """
+        :param other: Record of the same class or mapping.
+        :return:
+        """
+        if isinstance(other, _BoxRecord) and type(other) is not type(self):
+            return False
+        if isinstance(other, (_BoxRecord, Mapping)):
+            return self.to_dict() == dict(
+                other.to_dict() if isinstance(other, _BoxRecord) else other
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        """
+        :return:
+        """
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join("{}={!r}".format(k, v) for k, v in self.to_dict().items()),
+        )
+
+    def __reduce__(self):
+        """
+        :return: Box class and field values, recompiled when unpickled.
+        """
+        return _rebuild_record, (self._box_class, self.to_dict())
+
+    def to_dict(self):
+        """
+        :return: Fields as a dictionary.
+        """
+        return {name: getattr(self, name) for name in self._fields}
+
+    def to_box(self):
+        """
+        :return: Instance of the Box class the record was compiled from.
+        """
+        return self._box_class(**self.to_dict())
+
+    @classmethod
+    def from_box(cls, mapping):
+        """
+        :param mapping: Box or mapping with a subset of the fields.
+        :return: Record.
+        """
+        return cls(**dict(mapping))
+
+
+def _rebuild_record(box_class, values):
+    """Unpickle Record.
+    :param box_class:
+    :param values:
+    :return:
+    """
+    return box_class.compile_record()(**values)
+
+
+class _LazyBox:
+    """
+    Lookup of Lazy Boxes.
+
+    Mixed into a private subclass of a Box class, which instances created with
+    `box_lazy` switch to, so that other boxes keep the lookup of Box.
+
+    """
+
+    def __getitem__(self, item, _ignore_default=False):
+        """Get Item, Converting Nested Containers of Lazy Boxes.
+        :param item:
+        :param _ignore_default:
+        :return:
+        """
+        value = super().__getitem__(item, _ignore_default)
+        pending = self.__dict__.get("_box_pending")
+        if not pending or isinstance(item, slice) or item not in pending:
+            return value
+        pending.discard(item)
+        config = self._box_config
+        created = config.get("__created", False)
+        config["__created"] = False
+        try:
+            super().__setitem__(item, value)
+        finally:
+            config["__created"] = created
+        return dict.__getitem__(self, item)
+
+    def __setitem__(self, key, value):
+        """Set Item, Replacing an Unconverted Container.
+        :param key:
+        :param value:
+        :return:
+        """
+        super().__setitem__(key, value)
+        pending = self.__dict__.get("_box_pending")
+        if pending:
+            pending.discard(key)
+
+    def clear(self):
+        """
+        :return:
+        """
+        super().clear()
+        self.__dict__.pop("_box_pending", None)
+
+    def items(self, *args, **kwargs):
+        """
+        :return: Items, converting nested containers.
+        """
+        if args or kwargs:
+            return super().items(*args, **kwargs)
+        return ItemsView(self)
+
+    def values(self):
+        """
+        :return: Values, converting nested containers.
+        """
+        return ValuesView(self)
+
+    def copy(self):
+        """
+        :return: Lazy shallow copy, leaving unconverted containers unconverted.
+        """
+        copied = type(self)(
+            dict(dict.items(self)), box_lazy=True, **self._box_options()
+        )
+        hidden = self._hidden()
+        if hidden:
+            object.__setattr__(copied, "_box_hidden", set(hidden))
+        return copied
+
+
 class Box(_Box):
     """
     Box Extension Object.
 
+    Class defaults are split into Box options and a shared, read-only layer of
+    default values. Instances only store the values they override and fall
+    back to the default layer on lookup, so construction time and memory do
+    not depend on the number of defaults. Mutable default values are copied
+    into the instance the first time they are accessed.
+
+    With the `box_lazy` option, given as a keyword or in the class defaults,
+    nested dicts and lists are stored as they are and converted the first time
+    they are accessed. Nested boxes created from them are lazy as well. Lazy
+    instances belong to a private subclass of their class, so that other
+    instances look up items without the conversion check.
+
     """
 
-    defaults = {}
+    defaults = MappingProxyType({})
     frozen_defaults = False
+    _default_options = MappingProxyType({})
+    _default_layer = MappingProxyType({})
 
-    def __init_subclass__(cls, defaults=None, frozen_defaults=False, **kwargs):
+    def __init_subclass__(cls, defaults=None, frozen_defaults=None, **kwargs):
         """
-        :param defaults:
-        :param frozen_defaults:
+        :param defaults: Default values and Box options, layered over the
+            defaults of the parent class.
+        :param frozen_defaults: Forbid overriding defaults on construction,
+            inherited from the parent class if None.
         :param kwargs:
         :return:
         """
         super().__init_subclass__(**kwargs)
-        cls.defaults = value_or(defaults, {})
-        cls.frozen_defaults = frozen_defaults
+        merged = dict(cls.defaults)
+        merged.update(value_or(defaults, {}))
+        options = {k: v for k, v in merged.items() if k in _BOX_OPTIONS}
+        layer = {k: v for k, v in merged.items() if k not in _BOX_OPTIONS}
+        if layer and "box_class" in _BOX_PARAMETERS:
+            options.setdefault("box_class", Box)
+        cls.defaults = MappingProxyType(merged)
+        cls.frozen_defaults = value_or(frozen_defaults, cls.frozen_defaults)
+        cls._default_options = MappingProxyType(options)
+        cls._default_layer = MappingProxyType(layer)
 
     def __init__(self, *args, **kwargs):
         """Initialize Box with custom Defaults
         :param args:
         :param kwargs:
         """
-        defaults = type(self).defaults
-        if type(self).frozen_defaults:
-            for k, v in self.defaults.items():
+        cls = type(self)
+        if cls.frozen_defaults:
+            for k, v in cls.defaults.items():
                 if k in kwargs:
                     if v != kwargs[k]:
                         raise TypeError(
@@ -94,9 +390,312 @@ class Box(_Box):
                             )
                         )
                     kwargs.pop(k)
+        if cls._default_options:
+            kwargs = dict(cls._default_options, **kwargs)
+        if not kwargs.pop("box_lazy", False):
+            return super().__init__(*args, **kwargs)
+        box_class = kwargs.get("box_class")
+        if box_class is not None and not issubclass(box_class, Box):
+            raise ValueError("Lazy boxes need a wrapping Box as box_class.")
+        object.__setattr__(self, "__class__", cls._lazy_class())
+        recast = value_or(kwargs.get("box_recast"), {})
+        if len(args) == 1 and isinstance(args[0], Mapping):
+            args = (dict(_defer(args[0].items(), recast)),)
+        elif len(args) == 1 and not isinstance(args[0], str):
+            args = (_defer(args[0], recast),)
+        options = {k: v for k, v in kwargs.items() if k in _BOX_PARAMETERS}
+        data = {k: v for k, v in kwargs.items() if k not in _BOX_PARAMETERS}
+        super().__init__(*args, **dict(_defer(data.items(), recast)), **options)
+        self._box_config["box_lazy"] = True
+        pending = set()
+        for k, v in list(dict.items(self)):
+            if type(v) is _Deferred:
+                dict.__setitem__(self, k, v.value)
+                pending.add(k)
+        self.__dict__["_box_pending"] = pending
+
+    @classmethod
+    def _lazy_class(cls):
+        """Get the Private Subclass for Lazy Instances of this Class.
+        :return: Lazy subclass, created once per Box class.
+        """
+        if issubclass(cls, _LazyBox):
+            return cls
+        lazy = cls.__dict__.get("_box_lazy_class")
+        if lazy is None:
+            lazy = type(
+                cls.__name__,
+                (_LazyBox, cls),
+                {
+                    "__module__": cls.__module__,
+                    "__qualname__": "{}._box_lazy_class".format(cls.__qualname__),
+                    "__doc__": cls.__doc__,
+                    "_box_eager_class": cls,
+                },
+            )
+            type.__setattr__(cls, "_box_lazy_class", lazy)
+        return lazy
+
+    @classmethod
+    def compile_record(cls):
+        """Compile Slotted Record Class from the Class Defaults.
+        Records have one slot per default value, with the same names, defaults
+        and `frozen_defaults` enforcement, and convert to and from this class.
+        The record class is compiled once per Box class.
+        :return: Record class.
+        """
+        record = cls.__dict__.get("_record_class")
+        if record is None:
+            fields = tuple(cls._default_layer)
+            for name in fields:
+                if not isinstance(name, str) or not name.isidentifier():
+                    raise ValueError(
+                        "Cannot compile {!r} into a record field.".format(name)
+                    )
+            record = type(
+                "{}Record".format(cls.__name__),
+                (_BoxRecord,),
+                {
+                    "__slots__": fields,
+                    "__module__": cls.__module__,
+                    "__doc__": "Slotted record compiled from {}.".format(
+                        cls.__qualname__
+                    ),
+                    "_fields": fields,
+                    "_box_class": cls,
+                },
+            )
+            type.__setattr__(cls, "_record_class", record)
+        return record
+
+    def _hidden(self):
+        """
+        :return: Default keys deleted from this instance.
+        """
+        return self.__dict__.get("_box_hidden", ())
+
+    def _defaulted(self):
+        """
+        :return: Number of default keys neither stored in nor deleted from this
+            instance, counted once and then kept up to date.
+        """
+        count = self.__dict__.get("_box_defaulted")
+        if count is None:
+            layer = type(self)._default_layer
+            stored = sum(1 for key in dict.__iter__(self) if key in layer)
+            count = len(layer) - len(self._hidden()) - stored
+            object.__setattr__(self, "_box_defaulted", count)
+        return count
+
+    def _count_defaulted(self, change):
+        """Update the Number of Default Keys Served from the Layer.
+        :param change:
+        """
+        count = self.__dict__.get("_box_defaulted")
+        if count is not None:
+            object.__setattr__(self, "_box_defaulted", count + change)
+
+    def __missing__(self, key):
+        """Look Up Key in the Default Layer.
+        :param key:
+        :return:
+        """
+        layer = type(self)._default_layer
+        if key not in layer or key in self.__dict__.get("_box_hidden", ()):
+            raise KeyError(key)
+        value = layer[key]
+        if not isinstance(value, (Mapping, list)):
+            return value
+        config = self._box_config
+        created = config.get("__created", False)
+        config["__created"] = False
+        try:
+            super().__setitem__(key, deepcopy(value))
+        finally:
+            config["__created"] = created
+        self._count_defaulted(-1)
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key, value):
+        """Set Item, Restoring a Deleted Default Key.
+        :param key:
+        :param value:
+        :return:
+        """
+        if key in type(self)._default_layer and not dict.__contains__(self, key):
+            super().__setitem__(key, value)
+            hidden = self._hidden()
+            if key in hidden:
+                hidden.discard(key)
+            elif dict.__contains__(self, key):
+                self._count_defaulted(-1)
+        else:
+            super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        """Delete Item, Hiding it from the Default Layer.
+        :param key:
+        :return:
+        """
+        layer = type(self)._default_layer
+        if key not in layer or key in self._hidden():
+            return super().__delitem__(key)
+        if self._box_config.get("frozen_box"):
+            raise box.BoxError("Box is frozen")
+        if dict.__contains__(self, key):
+            super().__delitem__(key)
         else:
-            defaults.update(**kwargs)
-        super().__init__(*args, **defaults)
+            self._count_defaulted(-1)
+        if not self._hidden():
+            object.__setattr__(self, "_box_hidden", set())
+        self._hidden().add(key)
+
+    def __contains__(self, item):
+        """
+        :param item:
+        :return: True if the key is set on the instance or in the defaults.
+        """
+        if dict.__contains__(self, item):
+            return True
+        layer = type(self)._default_layer
+        if item in layer and item not in self._hidden():
+            return True
+        return super().__contains__(item)
+
+    def __iter__(self):
+        """
+        :return: Iterator over default keys followed by instance keys.
+        """
+        layer = type(self)._default_layer
+        if not layer:
+            return dict.__iter__(self)
+        return self._iter_layered(layer)
+
+    def _iter_layered(self, layer):
+        """
+        :param layer: Default layer of the class.
+        :return: Generator of default keys followed by instance keys.
+        """
+        hidden = self._hidden()
+        for key in layer:
+            if key not in hidden:
+                yield key
+        for key in dict.__iter__(self):
+            if key not in layer:
+                yield key
+
+    def __len__(self):
+        """
+        :return: Number of keys including defaults.
+        """
+        if not type(self)._default_layer:
+            return dict.__len__(self)
+        return dict.__len__(self) + self._defaulted()
+
+    def update(self, *args, **kwargs):
+        """Update Items, Restoring Deleted Default Keys.
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        super().update(*args, **kwargs)
+        if type(self)._default_layer:
+            hidden = self._hidden()
+            if hidden:
+                hidden.difference_update(
+                    [key for key in hidden if dict.__contains__(self, key)]
+                )
+            self.__dict__.pop("_box_defaulted", None)
+
+    def clear(self):
+        """Delete all Items, Hiding every Default Key.
+        :return:
+        """
+        super().clear()
+        layer = type(self)._default_layer
+        if layer:
+            object.__setattr__(self, "_box_hidden", set(layer))
+            object.__setattr__(self, "_box_defaulted", 0)
+
+    def keys(self, *args, **kwargs):
+        """
+        :return: Keys including defaults.
+        """
+        if args or kwargs:
+            return super().keys(*args, **kwargs)
+        if not type(self)._default_layer:
+            return dict.keys(self)
+        return KeysView(self)
+
+    def items(self, *args, **kwargs):
+        """
+        :return: Items including defaults.
+        """
+        if args or kwargs:
+            return super().items(*args, **kwargs)
+        if not type(self)._default_layer:
+            return dict.items(self)
+        return ItemsView(self)
+
+    def values(self):
+        """
+        :return: Values including defaults.
+        """
+        if not type(self)._default_layer:
+            return dict.values(self)
+        return ValuesView(self)
+
+    def __eq__(self, other):
+        """
+        :param other:
+        :return: True if both mappings have the same items.
+        """
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        layered = getattr(type(other), "_default_layer", None)
+        if not type(self)._default_layer and not layered:
+            return super().__eq__(other)
+        return len(self) == len(other) and all(
+            key in other and other[key] == value for key, value in self.items()
+        )
+
+    def __ne__(self, other):
+        """
+        :param other:
+        :return: True if the mappings differ.
+        """
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = _Box.__hash__
+
+    def _box_options(self):
+        """
+        :return: Box options of this instance, without its namespace.
+        """
+        config = getattr(self, "_box_config", {})
+        options = {k: config[k] for k in _BOX_PARAMETERS if k in config}
+        options.pop("box_namespace", None)
+        return options
+
+    def copy(self):
+        """
+        :return: Shallow copy sharing the default layer.
+        """
+        copied = type(self).__new__(type(self))
+        _Box.__init__(copied, dict.items(self), **self._box_options())
+        hidden = self._hidden()
+        if hidden:
+            object.__setattr__(copied, "_box_hidden", set(hidden))
+        if "_box_defaulted" in self.__dict__:
+            object.__setattr__(copied, "_box_defaulted", self._defaulted())
+        return copied
+
+    def __copy__(self):
+        """
+        :return: Shallow copy sharing the default layer.
+        """
+        return self.copy()
 
 
 class _BoxObject(wrapt.ObjectProxy):
@@ -138,6 +737,42 @@ class _BoxObject(wrapt.ObjectProxy):
         """
         return self.__wrapped__(*args, **kwargs)
 
+    def update_attrs(self, mapping=(), **kwargs):
+        """Set Many Attributes in Wrapped Object or Box.
+        Attributes are routed as by `setattr` and then written in bulk: plain
+        instance attributes of the wrapped object through its __dict__, and
+        Box attributes with a single Box update.
+        :param mapping: Mapping or iterable of name, value pairs.
+        :param kwargs: Additional attributes.
+        :return:
+        """
+        wrapped = self.__wrapped__
+        cls = type(wrapped)
+        namespace = {}
+        if cls.__setattr__ is object.__setattr__:
+            namespace = getattr(wrapped, "__dict__", namespace)
+        instance, internal = {}, {}
+        for name, value in dict(mapping, **kwargs).items():
+            if name == "__dict__":
+                raise TypeError("cannot set __dict__")
+            if name in namespace and not hasattr(cls, name):
+                instance[name] = value
+            elif hasattr(wrapped, name):
+                setattr(wrapped, name, value)
+            else:
+                internal[name] = value
+        if instance:
+            namespace.update(instance)
+        if internal:
+            self.__dict__.update(internal)
+
+    def get_attrs(self, names):
+        """Get Many Attributes from Wrapped Object or Box.
+        :param names: Attribute names.
+        :return: Dictionary from names to values.
+        """
+        return {name: getattr(self, name) for name in names}
+
     def __getattr__(self, name):
         """Get Attribute from Wrapped Object or from Box.
         :param name:
@@ -183,34 +818,2320 @@ class _BoxObject(wrapt.ObjectProxy):
                     raise error
 
 
-class FrozenBox(
-    Box,
-    defaults={"frozen_box": True, "default_box": True, "default_box_attr": None},
-    frozen_defaults=True,
-):
+_frozen_box_defaults = {
+    "frozen_box": True,
+    "default_box": True,
+    "default_box_attr": None,
+}
+
+if "default_box_create_on_get" in _BOX_PARAMETERS:
+    _frozen_box_defaults["default_box_create_on_get"] = False
+
+
+class _InternKey:
+    """
+    Weak Intern Table Key comparing FrozenBox Instances Structurally.
+
+    """
+
+    __slots__ = ("reference", "hash")
+
+    def __init__(self, frozen):
+        """Initialize Intern Key.
+        :param frozen: Frozen box.
+        """
+        self.reference = weakref.ref(frozen)
+        self.hash = hash(frozen)
+
+    def __hash__(self):
+        """
+        :return: Cached hash of the frozen box.
+        """
+        return self.hash
+
+    def __eq__(self, other):
+        """
+        :param other:
+        :return: True if both referents are alive and structurally equal.
+        """
+        first, second = self.reference(), other.reference()
+        if first is None or second is None:
+            return first is second
+        return first is second or (type(first) is type(second) and first == second)
+
+
+class FrozenBox(Box, defaults=_frozen_box_defaults, frozen_defaults=True):
     """
     FrozenBox.
 
+    Frozen boxes compute their hash once, copy to themselves, can be interned
+    so that structurally equal boxes share one instance, and are modified with
+    `evolve`, which shares every unchanged subtree with the original.
+
     """
 
+    def __hash__(self):
+        """
+        :return: Hash of the items, computed once.
+        """
+        try:
+            return self.__dict__["_box_hash"]
+        except KeyError:
+            value = super().__hash__()
+            object.__setattr__(self, "_box_hash", value)
+            return value
+
+    def copy(self):
+        """
+        :return: This box, since it cannot be modified.
+        """
+        return self
+
+    def __copy__(self):
+        """
+        :return: This box, since it cannot be modified.
+        """
+        return self
+
+    @classmethod
+    def intern(cls, value):
+        """Get the Canonical Instance for a Frozen Box.
+        Nested frozen boxes are interned first, so equal subtrees are shared
+        across every interned box. Canonical instances are held weakly.
+        :param value: FrozenBox or mapping converted to this class.
+        :return: Canonical structurally equal instance.
+        """
+        if not isinstance(value, FrozenBox):
+            value = cls(value)
+        table = type(value).__dict__.get("_intern_table")
+        if table is None:
+            table = weakref.WeakValueDictionary()
+            type.__setattr__(type(value), "_intern_table", table)
+        key = _InternKey(value)
+        canonical = table.get(key)
+        if canonical is not None:
+            return canonical
+        for k, v in dict.items(value):
+            if isinstance(v, FrozenBox):
+                shared = type(v).intern(v)
+                if shared is not v:
+                    dict.__setitem__(value, k, shared)
+        return table.setdefault(key, value)
+
+    def evolve(self, changes=None, remove=(), **kwargs):
+        """Make a Modified Copy Sharing all Unchanged Subtrees.
+        :param changes: Mapping from keys, or tuples of keys for nested paths,
+            to new values.
+        :param remove: Keys, or tuples of keys for nested paths, to delete.
+        :param kwargs: Top-level keys to new values.
+        :return: New frozen box.
+        """
+        changes = dict(value_or(changes, {}), **kwargs)
+        nested = {}
+        top = {}
+        removed = set()
+        for path, value in changes.items():
+            if isinstance(path, tuple) and len(path) > 1:
+                nested.setdefault(path[0], ({}, []))[0][path[1:]] = value
+            else:
+                top[path[0] if isinstance(path, tuple) else path] = value
+        for path in remove:
+            if isinstance(path, tuple) and len(path) > 1:
+                nested.setdefault(path[0], ({}, []))[1].append(path[1:])
+            else:
+                removed.add(path[0] if isinstance(path, tuple) else path)
+        for key, (paths, removals) in nested.items():
+            child = top[key] if key in top else self[key]
+            if not isinstance(child, FrozenBox):
+                raise TypeError(
+                    "Cannot evolve {key!r}: not a FrozenBox.".format(key=key)
+                )
+            top[key] = child.evolve(paths, removals)
+        options = self._box_options()
+        evolved = type(self).__new__(type(self))
+        _Box.__init__(evolved, **options)
+        dict.update(evolved, dict.items(self))
+        config = getattr(self, "_box_config", {})
+        if "__safe_keys" in config:
+            evolved._box_config["__safe_keys"].update(config["__safe_keys"])
+        layer = type(self)._default_layer
+        for key in removed:
+            if key not in self:
+                raise KeyError(key)
+            if dict.__contains__(evolved, key):
+                dict.__delitem__(evolved, key)
+        hidden = set(self._hidden()).difference(top)
+        hidden.update(key for key in removed if key in layer)
+        if hidden:
+            object.__setattr__(evolved, "_box_hidden", hidden)
+        if config.get("box_lazy"):
+            evolved._box_config["box_lazy"] = True
+            pending = self.__dict__.get("_box_pending", set()).difference(top)
+            evolved.__dict__["_box_pending"] = pending.difference(removed)
+        if top:
+            nested_class = options.get("box_class", type(self))
+            converted = {}
+            for key, value in top.items():
+                if isinstance(value, Mapping) and not isinstance(value, FrozenBox):
+                    value = nested_class(value, **options)
+                converted[key] = value
+            created = evolved._box_config.get("__created", False)
+            evolved._box_config["__created"] = False
+            try:
+                for key, value in converted.items():
+                    if isinstance(value, FrozenBox):
+                        dict.__setitem__(evolved, key, value)
+                    else:
+                        evolved[key] = value
+            finally:
+                evolved._box_config["__created"] = created
+        return evolved
+
 
-def subset_box(total, key=lambda x: x, *, name_for_original=None, box_class=Box):
+class BoxChange(namedtuple("BoxChange", ("path", "old", "new"))):
     """
-    Get subset of mapping type as a Box or BoxObject.
-    :param total:
-    :param key:
-    :param name_for_original:
-    :param box_class:
-    :return:
+    Box Change Event.
+
+    `path` is the tuple of keys from the root box to the changed key, `old`
+    and `new` are the values before and after the change, `MISSING` if the
+    key did not exist.
+
     """
-    subset = key(total)
-    kwargs = box_class({name_for_original: total}) if name_for_original else box_class()
-    if isinstance(subset, Mapping):
-        return box_class(subset, **kwargs)
-    return BoxObject(subset, box_class=box_class, **kwargs)
 
+    __slots__ = ()
 
-if box is None:
-    BoxObject = NotImplemented
-else:
-    BoxObject = _BoxObject
+    MISSING = type(
+        "Missing", (), {"__repr__": lambda self: "BoxChange.MISSING", "__slots__": ()}
+    )()
+
+
+class _SubscriberNode:
+    """
+    Node of the Subscriber Index.
+
+    """
+
+    __slots__ = ("children", "callbacks")
+
+    def __init__(self):
+        """Initialize Node."""
+        self.children = {}
+        self.callbacks = []
+
+
+class _BoxObserver:
+    """
+    Subscriber Index and Transaction State shared by an Observable Box Tree.
+
+    Subscribers are stored in a trie keyed by their path prefix, so a change
+    only visits the nodes along its path and, for replaced subtrees, the
+    nodes below it.
+
+    """
+
+    def __init__(self):
+        """Initialize Observer."""
+        self.root = _SubscriberNode()
+        self.count = 0
+        self.depth = 0
+        self.pending = {}
+        self.lock = RLock()
+
+    def __reduce__(self):
+        """
+        :return: Subscribers are not copied or pickled.
+        """
+        return type(self), ()
+
+    def subscribe(self, prefix, callback):
+        """
+        :param prefix: Path prefix.
+        :param callback:
+        """
+        with self.lock:
+            node = self.root
+            for key in prefix:
+                node = node.children.setdefault(key, _SubscriberNode())
+            node.callbacks.append(callback)
+            self.count += 1
+
+    def unsubscribe(self, prefix, callback):
+        """
+        :param prefix: Path prefix.
+        :param callback:
+        """
+        with self.lock:
+            nodes = [self.root]
+            for key in prefix:
+                nodes.append(nodes[-1].children.get(key))
+                if nodes[-1] is None:
+                    raise KeyError(prefix)
+            try:
+                nodes[-1].callbacks.remove(callback)
+            except ValueError:
+                raise KeyError(prefix) from None
+            self.count -= 1
+            for key, node, parent in zip(reversed(prefix), nodes[:0:-1], nodes[-2::-1]):
+                if node.children or node.callbacks:
+                    break
+                del parent.children[key]
+
+    def matching(self, path):
+        """
+        :param path:
+        :return: Callbacks subscribed to a prefix of the path or below it.
+        """
+        node = self.root
+        found = list(node.callbacks)
+        for key in path:
+            node = node.children.get(key)
+            if node is None:
+                return found
+            found.extend(node.callbacks)
+        stack = list(node.children.values())
+        while stack:
+            node = stack.pop()
+            found.extend(node.callbacks)
+            stack.extend(node.children.values())
+        return found
+
+    def record(self, path, old, new):
+        """Record Change, Dispatching it Unless a Transaction is Open.
+        :param path:
+        :param old:
+        :param new:
+        """
+        with self.lock:
+            if self.depth:
+                if path in self.pending:
+                    self.pending[path][1] = new
+                else:
+                    self.pending[path] = [old, new]
+                return
+        if old is not new:
+            self.dispatch((BoxChange(path, old, new),))
+
+    def dispatch(self, changes):
+        """Call every Matching Subscriber Once with its Changes.
+        :param changes:
+        """
+        with self.lock:
+            batches = {}
+            for change in changes:
+                for callback in self.matching(change.path):
+                    batches.setdefault(callback, []).append(change)
+        for callback, batch in batches.items():
+            callback(tuple(batch))
+
+    @contextmanager
+    def transaction(self):
+        """Batch Changes, Coalescing them per Path.
+        :return:
+        """
+        with self.lock:
+            self.depth += 1
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.depth -= 1
+                pending = {} if self.depth else self.pending
+                if not self.depth:
+                    self.pending = {}
+            changes = [
+                BoxChange(path, old, new)
+                for path, (old, new) in pending.items()
+                if old is not new and not _same_value(old, new)
+            ]
+            if changes:
+                self.dispatch(changes)
+
+
+def _same_value(old, new):
+    """
+    :param old:
+    :param new:
+    :return: True if a coalesced change leaves the value unchanged.
+    """
+    if old is BoxChange.MISSING or new is BoxChange.MISSING:
+        return False
+    try:
+        return type(old) is type(new) and bool(old == new)
+    except Exception:
+        return False
+
+
+class ObservableBox(Box):
+    """
+    Observable Box.
+
+    Changes made through item and attribute access, `update`, `pop`, `clear`
+    and the other Box methods are reported to subscribers as `BoxChange`
+    events with the path of the changed key from the root box. Nested boxes
+    share the subscribers of their root, while copies start without any.
+    Changes inside lists are not tracked; list items report the path of the
+    list.
+
+    Subscribers register for a path prefix and receive the tuple of changes
+    at, above or below that prefix. Inside a `transaction` changes are
+    coalesced per path and each subscriber is called once when the
+    outermost transaction ends.
+
+    """
+
+    def __init__(self, *args, box_observer=None, **kwargs):
+        """Initialize Observable Box.
+        :param args:
+        :param box_observer: Observer of the root box, passed to nested boxes.
+        :param kwargs:
+        """
+        if box_observer is None:
+            box_observer = _BoxObserver()
+        self.__dict__["_box_observer"] = box_observer
+        super().__init__(*args, **kwargs)
+        self._share_observer(box_observer)
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        :param kwargs:
+        :return:
+        """
+        super().__init_subclass__(**kwargs)
+        if cls._default_options.get("box_class") is Box:
+            cls._default_options = MappingProxyType(
+                dict(cls._default_options, box_class=ObservableBox)
+            )
+
+    def _observer(self):
+        """
+        :return: Observer shared by the box tree.
+        """
+        observer = self.__dict__.get("_box_observer")
+        if observer is None:
+            observer = self.__dict__["_box_observer"] = _BoxObserver()
+        return observer
+
+    def _share_observer(self, observer):
+        """Pass Observer on to Nested Boxes of an Observable Class.
+        :param observer:
+        """
+        config = self._box_config
+        if issubclass(config.get("box_class", type(self)), ObservableBox):
+            config["box_observer"] = observer
+
+    def _path(self, *keys):
+        """
+        :param keys:
+        :return: Path of nested keys from the root box.
+        """
+        return tuple(self._box_config.get("box_namespace") or ()) + keys
+
+    def _current(self, key):
+        """
+        :param key:
+        :return: Value of a key without materializing defaults.
+        """
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        layer = type(self)._default_layer
+        if key in layer and key not in self._hidden():
+            return layer[key]
+        return BoxChange.MISSING
+
+    def subscribe(self, prefix, callback):
+        """Subscribe to Changes.
+        :param prefix: Key or tuple of keys relative to this box.
+        :param callback: Called with a tuple of BoxChange events.
+        :return: Callback.
+        """
+        prefix = prefix if isinstance(prefix, tuple) else (prefix,)
+        self._observer().subscribe(self._path(*prefix), callback)
+        return callback
+
+    def unsubscribe(self, prefix, callback):
+        """Unsubscribe from Changes.
+        :param prefix: Key or tuple of keys relative to this box.
+        :param callback:
+        """
+        prefix = prefix if isinstance(prefix, tuple) else (prefix,)
+        self._observer().unsubscribe(self._path(*prefix), callback)
+
+    def transaction(self):
+        """Batch and Coalesce Changes to the Whole Box Tree.
+        :return: Context manager.
+        """
+        return self._observer().transaction()
+
+    def __setitem__(self, key, value):
+        """Set Item, Reporting the Change.
+        :param key:
+        :param value:
+        :return:
+        """
+        observer = self._observer()
+        if not self._box_config.get("__created"):
+            self._share_observer(observer)
+            return super().__setitem__(key, value)
+        if not observer.count:
+            return super().__setitem__(key, value)
+        old = self._current(key)
+        super().__setitem__(key, value)
+        if dict.__contains__(self, key):
+            observer.record(self._path(key), old, dict.__getitem__(self, key))
+
+    def __delitem__(self, key):
+        """Delete Item, Reporting the Change.
+        :param key:
+        :return:
+        """
+        observer = self._observer()
+        if not observer.count:
+            return super().__delitem__(key)
+        old = self._current(key)
+        super().__delitem__(key)
+        if old is not BoxChange.MISSING:
+            observer.record(self._path(key), old, self._current(key))
+
+    def update(self, *args, **kwargs):
+        """Update Items in one Transaction.
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        if len(args) > 1:
+            raise TypeError(
+                "update expected at most 1 argument, got {}".format(len(args))
+            )
+        with self.transaction():
+            for key, value in dict(*args, **kwargs).items():
+                self[key] = value
+
+    def clear(self):
+        """Delete all Items in one Transaction.
+        :return:
+        """
+        with self.transaction():
+            for key in list(dict.keys(self)):
+                del self[key]
+        super().clear()
+
+    def __deepcopy__(self, memodict=None):
+        """
+        :param memodict:
+        :return: Deep copy without subscribers.
+        """
+        return type(self)(deepcopy(self.to_dict(), memodict), **self._box_options())
+
+    def __reduce__(self):
+        """
+        :return: Pickled without subscribers.
+        """
+        return partial(type(self), **self._box_options()), (self.to_dict(),)
+
+
+_VIEW_LEAVES = frozenset((str, int, float, bool, bytes, type(None), list, tuple))
+
+
+class BoxView(MutableMapping):
+    """
+    Box View.
+
+    Zero-copy, attribute-accessible view over an existing mapping, optionally
+    restricted to a collection of keys. Nested mappings are wrapped in views
+    when they are first accessed, and `to_box` materializes the view. Views
+    are read-only unless `writable` is set, in which case writes go through to
+    the underlying mapping.
+
+    Views trade read speed for extraction: creating one is constant time,
+    while each read is a Python-level lookup, slower than reading a Box, and
+    the first read of a nested mapping also creates its view. They pay off
+    when only part of the extracted data is read.
+
+    """
+
+    __slots__ = ("_view_mapping", "_view_keys", "_view_extra", "_view_options")
+
+    def __init__(
+        self, mapping, keys=None, *, extra=None, writable=False, box_class=Box
+    ):
+        """Initialize Box View.
+        :param mapping: Underlying mapping.
+        :param keys: Collection of visible keys, or None for every key.
+        :param extra: Mapping of additional keys shown over the mapping.
+        :param writable: Write through to the underlying mapping.
+        :param box_class: Box class used by `to_box`.
+        """
+        object.__setattr__(self, "_view_mapping", mapping)
+        object.__setattr__(self, "_view_keys", keys)
+        object.__setattr__(self, "_view_extra", dict(value_or(extra, {})))
+        object.__setattr__(self, "_view_options", (writable, box_class, {}))
+
+    @property
+    def writable(self):
+        """
+        :return: True if writes go through to the underlying mapping.
+        """
+        return self._view_options[0]
+
+    def _check_writable(self):
+        """
+        Raise if the view is read-only.
+        """
+        if not self.writable:
+            raise TypeError("{} is read-only.".format(type(self).__name__))
+
+    def _visible(self, key):
+        """
+        :param key:
+        :return: True if the key is visible through the view.
+        """
+        return self._view_keys is None or key in self._view_keys
+
+    def __getitem__(self, key):
+        """
+        :param key:
+        :return: Value, wrapping nested mappings in views.
+        """
+        extra = self._view_extra
+        if extra and key in extra:
+            return extra[key]
+        keys = self._view_keys
+        if keys is not None and key not in keys:
+            raise KeyError(key)
+        value = self._view_mapping[key]
+        cls = type(value)
+        if cls in _VIEW_LEAVES:
+            return value
+        if cls is not dict and (
+            isinstance(value, (_Box, BoxView)) or not isinstance(value, Mapping)
+        ):
+            return value
+        writable, box_class, views = self._view_options
+        view = views.get(key)
+        if view is None or view._view_mapping is not value:
+            view = views[key] = type(self)(
+                value, writable=writable, box_class=box_class
+            )
+        return view
+
+    def __setitem__(self, key, value):
+        """
+        :param key:
+        :param value:
+        """
+        self._check_writable()
+        if key in self._view_extra:
+            self._view_extra[key] = value
+        elif self._visible(key):
+            self._view_mapping[key] = value
+        else:
+            raise KeyError(key)
+
+    def __delitem__(self, key):
+        """
+        :param key:
+        """
+        self._check_writable()
+        if key in self._view_extra:
+            del self._view_extra[key]
+        elif self._visible(key):
+            del self._view_mapping[key]
+            self._view_options[2].pop(key, None)
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        """
+        :param key:
+        :return:
+        """
+        if key in self._view_extra:
+            return True
+        return self._visible(key) and key in self._view_mapping
+
+    def __iter__(self):
+        """
+        :return: Iterator over extra keys, then visible mapping keys.
+        """
+        yield from self._view_extra
+        if self._view_keys is None:
+            keys = self._view_mapping
+        else:
+            keys = (k for k in self._view_keys if k in self._view_mapping)
+        for key in keys:
+            if key not in self._view_extra:
+                yield key
+
+    def __len__(self):
+        """
+        :return: Number of visible keys.
+        """
+        if self._view_keys is None and not self._view_extra:
+            return len(self._view_mapping)
+        return sum(1 for _ in self)
+
+    def __getattr__(self, name):
+        """
+        :param name:
+        :return: Value of the key named by the attribute.
+        """
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        """
+        :param name:
+        :param value:
+        """
+        self[name] = value
+
+    def __delattr__(self, name):
+        """
+        :param name:
+        """
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __dir__(self):
+        """
+        :return: Attributes and string keys.
+        """
+        return list(super().__dir__()) + [k for k in self if isinstance(k, str)]
+
+    def __eq__(self, other):
+        """
+        :param other:
+        :return:
+        """
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            k in other and self[k] == other[k] for k in self
+        )
+
+    def __ne__(self, other):
+        """
+        :param other:
+        :return:
+        """
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        """
+        :return:
+        """
+        return "<{}: {!r}>".format(type(self).__name__, self.to_dict())
+
+    def to_dict(self):
+        """Materialize View as Nested Dictionaries.
+        :return:
+        """
+        return {
+            k: v.to_dict() if isinstance(v, BoxView) else v for k, v in self.items()
+        }
+
+    def to_box(self):
+        """Materialize View as a Box.
+        :return:
+        """
+        return self._view_options[1](self.to_dict())
+
+
+_MAPPED_MAGIC = b"WRAPBOX1"
+_MAPPED_HEADER = struct.Struct("<8sQ")
+_MAPPED_ENTRY = struct.Struct("<QIQ")
+_MAPPED_COUNT = struct.Struct("<Q")
+_MAPPED_INT = struct.Struct("<q")
+_MAPPED_FLOAT = struct.Struct("<d")
+_MAPPED_CONSTANTS = {b"N": None, b"T": True, b"F": False}
+
+
+class _MappedWriter:
+    """
+    Serializer for the MappedBox File Format.
+
+    Values are written children first, so every record only refers to offsets
+    that were already written. Mapping records hold an index of fixed-size
+    entries sorted by encoded key, and identical keys are stored once.
+
+    """
+
+    def __init__(self, stream):
+        """Initialize Writer.
+        :param stream: Binary file object positioned after the header.
+        """
+        self.stream = stream
+        self.position = stream.tell()
+        self.keys = {}
+
+    def emit(self, *chunks):
+        """Write Chunks.
+        :param chunks:
+        :return: Offset of the first chunk.
+        """
+        offset = self.position
+        for chunk in chunks:
+            self.stream.write(chunk)
+            self.position += len(chunk)
+        return offset
+
+    def key(self, key):
+        """Write Key Once.
+        :param key:
+        :return: Encoded key and its offset.
+        """
+        if not isinstance(key, str):
+            raise TypeError("MappedBox keys must be strings, not {!r}.".format(key))
+        encoded = key.encode("utf-8")
+        if encoded not in self.keys:
+            self.keys[encoded] = self.emit(encoded)
+        return encoded, self.keys[encoded]
+
+    def write(self, value):
+        """Write Value Record.
+        :param value:
+        :return: Offset of the record.
+        """
+        if value is None or isinstance(value, bool):
+            return self.emit(b"N" if value is None else b"T" if value else b"F")
+        if isinstance(value, int):
+            if -(1 << 63) <= value < 1 << 63:
+                return self.emit(b"I", _MAPPED_INT.pack(value))
+            encoded = str(value).encode("ascii")
+            return self.emit(b"J", _MAPPED_COUNT.pack(len(encoded)), encoded)
+        if isinstance(value, float):
+            return self.emit(b"D", _MAPPED_FLOAT.pack(value))
+        if isinstance(value, str):
+            encoded = value.encode("utf-8")
+            return self.emit(b"S", _MAPPED_COUNT.pack(len(encoded)), encoded)
+        if isinstance(value, (bytes, bytearray)):
+            return self.emit(b"B", _MAPPED_COUNT.pack(len(value)), bytes(value))
+        if isinstance(value, Mapping):
+            entries = sorted(self.key(k) + (self.write(v),) for k, v in value.items())
+            return self.emit(
+                b"M",
+                _MAPPED_COUNT.pack(len(entries)),
+                *(_MAPPED_ENTRY.pack(o, len(k), v) for k, o, v in entries)
+            )
+        if isinstance(value, (list, tuple)):
+            offsets = [self.write(v) for v in value]
+            return self.emit(
+                b"L",
+                _MAPPED_COUNT.pack(len(offsets)),
+                *(_MAPPED_COUNT.pack(offset) for offset in offsets)
+            )
+        raise TypeError("Cannot store {!r} in a MappedBox.".format(value))
+
+
+def _read_mapped(buffer, offset, source=None):
+    """Decode Value Record.
+    :param buffer: Memory map or memoryview of a MappedBox file.
+    :param offset: Offset of the record.
+    :param source: Path or shared memory segment holding the buffer.
+    :return: Value, with mappings as MappedBox and sequences as tuples.
+    """
+    tag = bytes(buffer[offset : offset + 1])
+    if tag in _MAPPED_CONSTANTS:
+        return _MAPPED_CONSTANTS[tag]
+    if tag == b"I":
+        return _MAPPED_INT.unpack_from(buffer, offset + 1)[0]
+    if tag == b"D":
+        return _MAPPED_FLOAT.unpack_from(buffer, offset + 1)[0]
+    if tag == b"M":
+        return MappedBox._from_buffer(buffer, offset, source)
+    (count,) = _MAPPED_COUNT.unpack_from(buffer, offset + 1)
+    start = offset + 1 + _MAPPED_COUNT.size
+    if tag == b"L":
+        return tuple(
+            _read_mapped(buffer, offset, source)
+            for (offset,) in _MAPPED_COUNT.iter_unpack(
+                buffer[start : start + 8 * count]
+            )
+        )
+    data = bytes(buffer[start : start + count])
+    if tag == b"S":
+        return data.decode("utf-8")
+    if tag == b"J":
+        return int(data)
+    return data
+
+
+def _unmap(value):
+    """Decode Mapped Values Recursively.
+    :param value:
+    :return: Value with mappings as dictionaries and sequences as lists.
+    """
+    if isinstance(value, MappedBox):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_unmap(v) for v in value]
+    return value
+
+
+def _dump_mapped(mapping, stream):
+    """Serialize Mapping in the MappedBox File Format.
+    :param mapping:
+    :param stream: Seekable binary file object.
+    """
+    stream.write(_MAPPED_HEADER.pack(_MAPPED_MAGIC, 0))
+    root = _MappedWriter(stream).write(mapping)
+    stream.seek(0)
+    stream.write(_MAPPED_HEADER.pack(_MAPPED_MAGIC, root))
+
+
+def _open_mapped(cls, path, offset):
+    """Open Mapped Box at a Record Offset.
+    :param cls: MappedBox class.
+    :param path:
+    :param offset:
+    :return:
+    """
+    root = cls(path)
+    if offset == root._mapped_offset:
+        return root
+    return cls._from_buffer(root._mapped_buffer, offset, path)
+
+
+class MappedBox(Mapping):
+    """
+    Mapped Box.
+
+    Read-only, FrozenBox-compatible mapping backed by a file opened with
+    `mmap`, so every process mapping the same file shares its pages. Values
+    are decoded on each lookup, nested mappings are MappedBox views into the
+    same map and sequences are tuples. Equal MappedBox and FrozenBox
+    instances compare and hash equal. Files are written with `build`.
+
+    """
+
+    __slots__ = ("_mapped_source", "_mapped_buffer", "_mapped_offset", "_mapped_hash")
+
+    def __init__(self, path):
+        """Open Mapped Box.
+        :param path: Path written by `MappedBox.build`.
+        """
+        with open(path, "rb") as mapped_file:
+            buffer = mmap.mmap(mapped_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, root = _MAPPED_HEADER.unpack_from(buffer)
+        if magic != _MAPPED_MAGIC:
+            buffer.close()
+            raise ValueError("{!r} is not a MappedBox file.".format(path))
+        self._setup(str(path), buffer, root)
+
+    def _setup(self, source, buffer, offset):
+        """Bind View to a Mapping Record.
+        :param source: Path or shared memory segment, kept alive by the view.
+        :param buffer:
+        :param offset:
+        """
+        object.__setattr__(self, "_mapped_source", source)
+        object.__setattr__(self, "_mapped_buffer", buffer)
+        object.__setattr__(self, "_mapped_offset", offset)
+        object.__setattr__(self, "_mapped_hash", None)
+
+    @classmethod
+    def _from_buffer(cls, buffer, offset, source=None):
+        """Make View of a Nested Mapping Record.
+        :param buffer:
+        :param offset:
+        :param source:
+        :return:
+        """
+        mapped = cls.__new__(cls)
+        mapped._setup(source, buffer, offset)
+        return mapped
+
+    @classmethod
+    def build(cls, mapping, path):
+        """Write Mapping to a MappedBox File and Open it.
+        :param mapping: Box or any mapping of JSON-like values.
+        :param path: Output path, replaced atomically.
+        :return: MappedBox.
+        """
+        temporary_path = "{}.{}.tmp".format(path, os.getpid())
+        try:
+            with open(temporary_path, "wb") as mapped_file:
+                _dump_mapped(mapping, mapped_file)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+        os.replace(temporary_path, path)
+        return cls(path)
+
+    def _entry(self, index):
+        """
+        :param index:
+        :return: Key offset, key length and value offset of an index entry.
+        """
+        position = self._mapped_offset + 1 + _MAPPED_COUNT.size
+        return _MAPPED_ENTRY.unpack_from(
+            self._mapped_buffer, position + index * _MAPPED_ENTRY.size
+        )
+
+    def _key(self, index):
+        """
+        :param index:
+        :return: Encoded key of an index entry.
+        """
+        offset, length, _ = self._entry(index)
+        return bytes(self._mapped_buffer[offset : offset + length])
+
+    def __len__(self):
+        """
+        :return: Number of keys.
+        """
+        (count,) = _MAPPED_COUNT.unpack_from(
+            self._mapped_buffer, self._mapped_offset + 1
+        )
+        return count
+
+    def __getitem__(self, key):
+        """Look Up Key by Binary Search over the Index.
+        :param key:
+        :return:
+        """
+        if not isinstance(key, str):
+            raise KeyError(key)
+        encoded = key.encode("utf-8")
+        buffer, offset = self._mapped_buffer, self._mapped_offset
+        (count,) = _MAPPED_COUNT.unpack_from(buffer, offset + 1)
+        index = offset + 1 + _MAPPED_COUNT.size
+        unpack, size = _MAPPED_ENTRY.unpack_from, _MAPPED_ENTRY.size
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            start, length, value = unpack(buffer, index + middle * size)
+            current = bytes(buffer[start : start + length])
+            if current < encoded:
+                low = middle + 1
+            elif current > encoded:
+                high = middle
+            else:
+                return _read_mapped(buffer, value, self._mapped_source)
+        raise KeyError(key)
+
+    def __iter__(self):
+        """
+        :return: Iterator over keys in encoded order.
+        """
+        for index in range(len(self)):
+            yield self._key(index).decode("utf-8")
+
+    def __getattr__(self, name):
+        """Get Key as Attribute, None if Missing as in FrozenBox.
+        :param name:
+        :return:
+        """
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+        return self.get(name)
+
+    def __setattr__(self, name, value):
+        """
+        :param name:
+        :param value:
+        """
+        raise TypeError("MappedBox is read-only.")
+
+    def __delattr__(self, name):
+        """
+        :param name:
+        """
+        raise TypeError("MappedBox is read-only.")
+
+    def __dir__(self):
+        """
+        :return: Attributes and keys.
+        """
+        return list(super().__dir__()) + list(self)
+
+    def __hash__(self):
+        """
+        :return: Hash of the items, computed once as for FrozenBox.
+        """
+        if self._mapped_hash is None:
+            value = 54321
+            for item in self.items():
+                value ^= hash(item)
+            object.__setattr__(self, "_mapped_hash", value)
+        return self._mapped_hash
+
+    def __reduce__(self):
+        """
+        :return: Path and offset, so other processes map the same file.
+        """
+        if not isinstance(self._mapped_source, str):
+            raise TypeError("Only file-backed MappedBox views can be pickled.")
+        return _open_mapped, (type(self), self._mapped_source, self._mapped_offset)
+
+    def __repr__(self):
+        """
+        :return:
+        """
+        return "<{}: {!r}>".format(type(self).__name__, self.to_dict())
+
+    def copy(self):
+        """
+        :return: This box, since it cannot be modified.
+        """
+        return self
+
+    def __copy__(self):
+        """
+        :return: This box, since it cannot be modified.
+        """
+        return self
+
+    def to_dict(self):
+        """Decode Mapped Box into Nested Dictionaries.
+        :return:
+        """
+        return {k: _unmap(v) for k, v in self.items()}
+
+    def to_box(self, box_class=None):
+        """Decode Mapped Box into a FrozenBox.
+        :param box_class: Box class, FrozenBox by default.
+        :return:
+        """
+        return value_or(box_class, FrozenBox)(self.to_dict())
+
+    def close(self):
+        """Unmap the File. Views into it are unusable afterwards."""
+        self._mapped_buffer.close()
+
+
+_SHARED_GENERATION = struct.Struct("<Q")
+_SHARED_SEGMENT = struct.Struct("<Q64s")
+
+
+_owned_segments = set()
+
+
+def _attach_segment(name):
+    """Attach to a Shared Memory Segment without Tracking it.
+    The resource tracker would otherwise unlink segments owned by another
+    process when this one exits. Segments owned by this process stay tracked.
+    :param name:
+    :return:
+    """
+    from multiprocessing import shared_memory
+
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+    segment = shared_memory.SharedMemory(name=name)
+    if os.name != "nt" and segment.name not in _owned_segments:
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+
+class _SharedBox:
+    """
+    Shared Box.
+
+    Broadcasts read-only snapshots of a mapping to other processes through
+    shared memory. The owner serializes every published version, in the
+    MappedBox format, into a new shared memory segment and then bumps a
+    generation counter in a small control segment. Readers attach by name,
+    check the counter and map new versions as MappedBox views without copying
+    or unpickling. Published segments are never modified, so snapshots stay
+    consistent while the owner publishes newer ones.
+
+    """
+
+    def __init__(self, control, owner):
+        """Initialize Shared Box. Use `create` or `attach`.
+        :param control: Control segment.
+        :param owner: True in the publishing process.
+        """
+        self._control = control
+        self._owner = owner
+        self._segment = None
+        self._generation = 0
+        self._snapshot = None
+
+    @classmethod
+    def create(cls, mapping=None, name=None):
+        """Create Shared Box Owned by this Process.
+        :param mapping: Initial snapshot.
+        :param name: Name of the control segment, random if None.
+        :return:
+        """
+        from multiprocessing import shared_memory
+
+        size = _SHARED_GENERATION.size + _SHARED_SEGMENT.size
+        control = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _owned_segments.add(control.name)
+        control.buf[:size] = bytes(size)
+        shared = cls(control, True)
+        if mapping is not None:
+            shared.publish(mapping)
+        return shared
+
+    @classmethod
+    def attach(cls, name):
+        """Attach to a Shared Box Owned by Another Process.
+        :param name: Name of the control segment.
+        :return:
+        """
+        return cls(_attach_segment(name), False)
+
+    @property
+    def name(self):
+        """
+        :return: Name of the control segment, passed to `attach`.
+        """
+        return self._control.name
+
+    def _counter(self):
+        """
+        :return: Generation counter, odd while the owner is publishing.
+        """
+        return _SHARED_GENERATION.unpack_from(self._control.buf)[0]
+
+    def _read_control(self):
+        """Read Consistent Control Record.
+        :return: Generation counter and segment name.
+        """
+        while True:
+            counter = self._counter()
+            _, name = _SHARED_SEGMENT.unpack_from(
+                self._control.buf, _SHARED_GENERATION.size
+            )
+            if counter % 2 == 0 and counter == self._counter():
+                return counter, name.rstrip(b"\x00").decode("ascii")
+            time.sleep(0)
+
+    @property
+    def generation(self):
+        """
+        :return: Number of published snapshots.
+        """
+        return self._counter() // 2
+
+    def publish(self, mapping):
+        """Publish New Snapshot.
+        :param mapping: Box or any mapping of JSON-like values.
+        :return: New generation.
+        """
+        if not self._owner:
+            raise TypeError("Only the owner of a SharedBox can publish.")
+        from multiprocessing import shared_memory
+
+        stream = io.BytesIO()
+        _dump_mapped(mapping, stream)
+        data = stream.getbuffer()
+        segment = shared_memory.SharedMemory(create=True, size=len(data))
+        _owned_segments.add(segment.name)
+        segment.buf[: len(data)] = data
+        counter = self._counter()
+        _SHARED_GENERATION.pack_into(self._control.buf, 0, counter + 1)
+        _SHARED_SEGMENT.pack_into(
+            self._control.buf,
+            _SHARED_GENERATION.size,
+            len(data),
+            segment.name.encode("ascii"),
+        )
+        _SHARED_GENERATION.pack_into(self._control.buf, 0, counter + 2)
+        previous, self._segment = self._segment, segment
+        if previous is not None:
+            previous.unlink()
+            _owned_segments.discard(previous.name)
+        return (counter + 2) // 2
+
+    def snapshot(self):
+        """Get Latest Snapshot.
+        Only reads the generation counter unless a new version was published.
+        :return: MappedBox view of the snapshot, or None before the first one.
+        """
+        if self._counter() == self._generation:
+            return self._snapshot
+        while True:
+            counter, name = self._read_control()
+            try:
+                segment = self._segment if self._owner else _attach_segment(name)
+                break
+            except FileNotFoundError:
+                if counter == self._counter():
+                    raise
+        _, root = _MAPPED_HEADER.unpack_from(segment.buf)
+        self._snapshot = MappedBox._from_buffer(segment.buf, root, segment)
+        self._generation = counter
+        if not self._owner:
+            self._segment = segment
+        return self._snapshot
+
+    def close(self):
+        """Detach from Shared Memory, Unlinking it in the Owner.
+        Snapshots taken before closing keep their segments mapped.
+        """
+        if self._owner:
+            if self._segment is not None:
+                self._segment.unlink()
+                _owned_segments.discard(self._segment.name)
+            self._control.unlink()
+            _owned_segments.discard(self._control.name)
+        self._segment = self._snapshot = None
+        self._control.close()
+
+    def __enter__(self):
+        """
+        :return:
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        :param exc_info:
+        """
+        self.close()
+
+
+def _plain(value):
+    """Convert Boxes and Sequences into Serializable Containers.
+    :param value:
+    :return: Value with mappings as dictionaries and sequences as lists.
+    """
+    if isinstance(value, Mapping):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    return value
+
+
+def _diff(old, new, path, delta):
+    """Collect Differences between two Mappings.
+    :param old:
+    :param new:
+    :param path: Key path of both mappings.
+    :param delta: Delta being built.
+    """
+    for key in old:
+        if key not in new:
+            delta["removed"].append(path + [key])
+    for key in new:
+        value = new[key]
+        if key not in old:
+            delta["added"].append([path + [key], _plain(value)])
+            continue
+        previous = old[key]
+        if previous is value:
+            continue
+        if isinstance(previous, Mapping) and isinstance(value, Mapping):
+            _diff(previous, value, path + [key], delta)
+        elif previous != value:
+            delta["changed"].append([path + [key], _plain(value)])
+
+
+def box_diff(old, new):
+    """
+    Compute Structural Delta between two Boxes.
+    Subtrees that are the same object in both, as after FrozenBox.evolve, are
+    skipped, so the cost follows the size of the change.
+    :param old: Box or any mapping.
+    :param new: Box or any mapping.
+    :return: JSON-serializable delta with lists of added and changed key paths
+        and values, and of removed key paths.
+    """
+    delta = {"added": [], "removed": [], "changed": []}
+    if old is not new:
+        _diff(old, new, [], delta)
+    return delta
+
+
+def box_patch(box, delta):
+    """
+    Apply a Delta from `box_diff`.
+    FrozenBox instances are not modified: the result is a copy made with
+    FrozenBox.evolve, sharing every unchanged subtree.
+    :param box: Box, FrozenBox or mutable mapping.
+    :param delta: Delta from `box_diff`.
+    :return: Patched box.
+    """
+    removed = [tuple(path) for path in delta.get("removed", ())]
+    updates = [
+        (tuple(path), value)
+        for path, value in list(delta.get("changed", ())) + list(delta.get("added", ()))
+    ]
+    if isinstance(box, FrozenBox):
+        return box.evolve(dict(updates), remove=removed)
+    for path in removed:
+        node = box
+        for key in path[:-1]:
+            node = node[key]
+        del node[path[-1]]
+    for path, value in updates:
+        node = box
+        for key in path[:-1]:
+            node = node[key]
+        node[path[-1]] = value
+    return box
+
+
+_COLUMN_TYPECODES = {"bool": "b", "int": "q", "float": "d"}
+
+
+def _column_kind(value):
+    """
+    :param value:
+    :return: Kind of typed column able to hold the value, or "object".
+    """
+    if type(value) is bool:
+        return "bool"
+    if type(value) is int and -(1 << 63) <= value < 1 << 63:
+        return "int"
+    if type(value) is float:
+        return "float"
+    return "object"
+
+
+def _make_column(values):
+    """Build Typed Column if every Value has the same Kind.
+    :param values:
+    :return: Kind and column.
+    """
+    values = list(values)
+    kinds = set(map(_column_kind, values))
+    kind = kinds.pop() if len(kinds) == 1 else "object"
+    if kind == "object":
+        return kind, [Box(v) if type(v) is dict else v for v in values]
+    return kind, array(_COLUMN_TYPECODES[kind], values)
+
+
+class _BoxRow(Mapping):
+    """
+    Row View of a BoxTable with Box-like Attribute Access.
+
+    """
+
+    __slots__ = ("_row_table", "_row_index")
+
+    def __init__(self, table, index):
+        """Initialize Row View.
+        :param table:
+        :param index:
+        """
+        object.__setattr__(self, "_row_table", table)
+        object.__setattr__(self, "_row_index", index)
+
+    def __getitem__(self, key):
+        """
+        :param key:
+        :return: Value of the column in this row.
+        """
+        return self._row_table._value(key, self._row_index)
+
+    def __setitem__(self, key, value):
+        """
+        :param key:
+        :param value:
+        """
+        self._row_table._set_value(key, self._row_index, value)
+
+    def __iter__(self):
+        """
+        :return: Iterator over column names.
+        """
+        return iter(self._row_table.columns)
+
+    def __len__(self):
+        """
+        :return: Number of columns.
+        """
+        return len(self._row_table.columns)
+
+    def __getattr__(self, name):
+        """
+        :param name:
+        :return: Value of the column named by the attribute.
+        """
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        """
+        :param name:
+        :param value:
+        """
+        self[name] = value
+
+    def __dir__(self):
+        """
+        :return: Attributes and column names.
+        """
+        return list(super().__dir__()) + list(self)
+
+    def __repr__(self):
+        """
+        :return:
+        """
+        return "<{} {}: {!r}>".format(type(self).__name__, self._row_index, dict(self))
+
+    def to_dict(self):
+        """
+        :return: Row as a dictionary.
+        """
+        return dict(self)
+
+    def to_box(self, box_class=Box):
+        """
+        :param box_class:
+        :return: Row as a Box.
+        """
+        return box_class(self.to_dict())
+
+
+class BoxTable:
+    """
+    Box Table.
+
+    Stores homogeneous records column by column. Columns whose values are all
+    booleans, 64-bit integers or floats are typed `array.array` columns, the
+    others are lists. Rows are lightweight views with Box-like attribute
+    access that read and write the columns. Filters and projections work on
+    whole columns and return new tables; projections share their columns
+    until either table writes to them, which copies the column first.
+    Typed columns support the buffer protocol, so `numpy.asarray` wraps them
+    without copying and vectorized comparisons can be passed as masks.
+
+    """
+
+    def __init__(self, records=(), columns=None):
+        """Initialize Box Table.
+        :param records: Iterable of mappings.
+        :param columns: Mapping from column names to sequences of values.
+        """
+        self._kinds = {}
+        self._columns = {}
+        self._shared = set()
+        self._length = 0
+        records = list(records)
+        if records and columns is None:
+            names = dict.fromkeys(k for record in records for k in record)
+            columns = {name: [r.get(name) for r in records] for name in names}
+            records = ()
+        if columns is not None:
+            lengths = {len(values) for values in columns.values()}
+            if len(lengths) > 1:
+                raise ValueError("BoxTable columns must have the same length.")
+            for name, values in columns.items():
+                self._kinds[name], self._columns[name] = _make_column(values)
+            self._length = lengths.pop() if lengths else 0
+        self.extend(records)
+
+    @property
+    def columns(self):
+        """
+        :return: Column names.
+        """
+        return tuple(self._columns)
+
+    def column(self, name):
+        """
+        :param name:
+        :return: Column as an array or list, shared with the table.
+        """
+        return self._columns[name]
+
+    def __len__(self):
+        """
+        :return: Number of rows.
+        """
+        return self._length
+
+    def __iter__(self):
+        """
+        :return: Iterator over row views.
+        """
+        return (_BoxRow(self, index) for index in range(self._length))
+
+    def __getitem__(self, item):
+        """
+        :param item: Row index or column name.
+        :return: Row view or column.
+        """
+        if isinstance(item, str):
+            return self.column(item)
+        if item < 0:
+            item += self._length
+        if not 0 <= item < self._length:
+            raise IndexError("BoxTable row index out of range.")
+        return _BoxRow(self, item)
+
+    def __repr__(self):
+        """
+        :return:
+        """
+        return "<{}: {} rows, columns={!r}>".format(
+            type(self).__name__, self._length, self.columns
+        )
+
+    def _value(self, name, index):
+        """
+        :param name:
+        :param index:
+        :return: Value of a column in a row.
+        """
+        value = self._columns[name][index]
+        return bool(value) if self._kinds[name] == "bool" else value
+
+    def _set_value(self, name, index, value):
+        """Set Value of a Column in a Row.
+        :param name:
+        :param index:
+        :param value:
+        """
+        if name not in self._columns:
+            raise KeyError(name)
+        if self._kinds[name] != "object" and _column_kind(value) != self._kinds[name]:
+            self._to_object(name)
+        else:
+            self._own(name)
+        if self._kinds[name] == "object" and type(value) is dict:
+            value = Box(value)
+        self._columns[name][index] = value
+
+    def _to_object(self, name):
+        """Convert Typed Column into a List Column.
+        :param name:
+        """
+        self._columns[name] = [self._value(name, i) for i in range(self._length)]
+        self._kinds[name] = "object"
+        self._shared.discard(name)
+
+    def _own(self, name):
+        """Copy Column Shared with a Projection before Writing to it.
+        :param name:
+        """
+        if name in self._shared:
+            self._columns[name] = self._columns[name][:]
+            self._shared.discard(name)
+
+    def append(self, record):
+        """Append Record, Adding Columns for New Keys.
+        :param record: Mapping.
+        """
+        for name, value in record.items():
+            if name not in self._columns:
+                kind = _column_kind(value) if not self._length else "object"
+                self._kinds[name] = kind
+                if kind == "object":
+                    self._columns[name] = [None] * self._length
+                else:
+                    self._columns[name] = array(_COLUMN_TYPECODES[kind])
+        for name in self._shared:
+            self._columns[name] = self._columns[name][:]
+        self._shared.clear()
+        for name, column in self._columns.items():
+            value = record.get(name)
+            kind = self._kinds[name]
+            if kind != "object" and _column_kind(value) != kind:
+                self._to_object(name)
+                column, kind = self._columns[name], "object"
+            if kind == "object" and type(value) is dict:
+                value = Box(value)
+            column.append(value)
+        self._length += 1
+
+    def extend(self, records):
+        """
+        :param records: Iterable of mappings.
+        """
+        for record in records:
+            self.append(record)
+
+    def select(self, *names):
+        """Project Columns.
+        :param names: Column names.
+        :return: Table sharing the selected columns until either table writes.
+        """
+        table = type(self)()
+        table._kinds = {name: self._kinds[name] for name in names}
+        table._columns = {name: self._columns[name] for name in names}
+        table._shared = set(names)
+        table._length = self._length
+        self._shared.update(names)
+        return table
+
+    def mask(self, **conditions):
+        """Evaluate Conditions over whole Columns.
+        :param conditions: Column names to values, compared for equality, or to
+            predicates called with each value of the column.
+        :return: List of booleans, one per row.
+        """
+        mask = [True] * self._length
+        for name, condition in conditions.items():
+            column = self._columns[name]
+            if callable(condition):
+                matches = map(condition, column)
+            else:
+                matches = map(partial(operator.eq, condition), column)
+            mask = [m and bool(c) for m, c in zip(mask, matches)]
+        return mask
+
+    def filter(self, mask=None, **conditions):
+        """Select Rows.
+        :param mask: Sequence of booleans, one per row, e.g. from `mask` or a
+            vectorized comparison of a column.
+        :param conditions: Conditions as in `mask`, combined with it.
+        :return: Table with copies of the selected rows.
+        """
+        selected = self.mask(**conditions)
+        if mask is not None:
+            selected = [bool(m) and s for m, s in zip(mask, selected)]
+        if mask is not None and len(mask) != self._length:
+            raise ValueError("BoxTable mask must have one value per row.")
+        table = type(self)()
+        for name, column in self._columns.items():
+            kind = self._kinds[name]
+            values = compress(column, selected)
+            if kind == "object":
+                table._columns[name] = list(values)
+            else:
+                table._columns[name] = array(column.typecode, values)
+            table._kinds[name] = kind
+        table._length = sum(selected)
+        return table
+
+    def to_boxes(self, box_class=Box):
+        """
+        :param box_class:
+        :return: Generator of rows as boxes.
+        """
+        return (row.to_box(box_class) for row in self)
+
+
+_CODEC_MAGIC = b"WBC\x01"
+_CODEC_FLOAT = struct.Struct("<d")
+_CODEC_NONE, _CODEC_TRUE, _CODEC_FALSE = b"NTF"
+_CODEC_INT, _CODEC_FLOAT_TAG, _CODEC_STR, _CODEC_BYTES = b"idsb"
+_CODEC_LIST, _CODEC_TUPLE, _CODEC_MAPPING = b"ltm"
+
+
+def _write_varint(out, value):
+    """Write Unsigned Variable-Length Integer.
+    :param out: Bytearray.
+    :param value:
+    """
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, position):
+    """Read Unsigned Variable-Length Integer.
+    :param data:
+    :param position:
+    :return: Value and the position after it.
+    """
+    result = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+
+
+def _read_stream_varint(stream):
+    """Read Unsigned Variable-Length Integer from a Stream.
+    :param stream: Binary file object.
+    :return: Value, or None at the end of the stream.
+    """
+    result = shift = 0
+    byte = stream.read(1)
+    if not byte:
+        return None
+    while byte[0] >= 0x80:
+        result |= (byte[0] & 0x7F) << shift
+        shift += 7
+        byte = stream.read(1)
+        if not byte:
+            raise ValueError("Truncated box codec stream.")
+    return result | byte[0] << shift
+
+
+def _class_name(cls):
+    """
+    :param cls:
+    :return: Importable name of a mapping class.
+    """
+    name = "{}:{}".format(cls.__module__, cls.__qualname__)
+    try:
+        resolved = _resolve_class(name)
+    except (ImportError, AttributeError, ValueError):
+        resolved = None
+    if resolved is not cls:
+        raise ValueError("Cannot encode {!r}: class is not importable.".format(cls))
+    return name
+
+
+def _resolve_class(name):
+    """
+    :param name: Name written by `_class_name`.
+    :return: Mapping class.
+    """
+    module, _, qualname = name.partition(":")
+    resolved = import_module(module)
+    for part in qualname.split("."):
+        resolved = getattr(resolved, part)
+    if not isinstance(resolved, type) or not issubclass(resolved, dict):
+        raise ValueError("Cannot decode {!r}: not a mapping class.".format(name))
+    return resolved
+
+
+class _CodecTarget:
+    """
+    Decoding Target for the Mappings of one Class and their Sequences.
+
+    """
+
+    __slots__ = ("cls", "boxed", "options", "frozen", "safe", "camel", "none", "lists")
+
+    def __init__(self, cls):
+        """Initialize Target.
+        :param cls: Mapping class, plain `dict` or a Box class.
+        """
+        self.cls = cls
+        self.boxed = _Box is not object and issubclass(cls, _Box)
+        self.frozen = self.safe = self.camel = self.none = False
+        self.options = self.lists = None
+        if self.boxed:
+            self.options = dict(getattr(cls, "_default_options", {}))
+            self.options.pop("box_lazy", None)
+            config = self.new()._box_config
+            self.frozen = config.get("frozen_box", False)
+            self.safe = config.get("conversion_box", False) and "__safe_keys" in config
+            self.camel = config.get("camel_killer_box", False)
+            self.none = config.get("default_box", False) and config.get(
+                "default_box_none_transform", False
+            )
+            self.lists = {
+                k: config[k]
+                for k in _BOX_PARAMETERS
+                if k in config and k != "box_namespace"
+            }
+
+    def new(self):
+        """
+        :return: Empty instance of the target class.
+        """
+        if not self.boxed:
+            return self.cls()
+        instance = self.cls.__new__(self.cls)
+        _Box.__init__(instance, **self.options)
+        return instance
+
+    def sequence(self, items):
+        """
+        :param items: Decoded list items.
+        :return: List as the target class stores it.
+        """
+        if not self.boxed:
+            return items
+        if self.frozen:
+            return tuple(items)
+        converted = box.BoxList(**self.lists)
+        list.extend(converted, items)
+        return converted
+
+
+class _BoxEncoder:
+    """
+    Box Codec Encoder.
+
+    Keys and classes are written inline the first time they are seen and by
+    table index afterwards, for as long as the encoder lives.
+
+    """
+
+    def __init__(self):
+        """Initialize Encoder."""
+        self.keys = {}
+        self.classes = {}
+
+    def mapping_class(self, cls, out):
+        """Write Mapping Class Token.
+        :param cls:
+        :param out:
+        """
+        if cls is dict or not issubclass(cls, dict):
+            return out.append(0)
+        index = self.classes.get(cls)
+        if index is not None:
+            return _write_varint(out, index + 2)
+        encoded = _class_name(cls).encode("utf-8")
+        self.classes[cls] = len(self.classes)
+        out.append(1)
+        _write_varint(out, len(encoded))
+        out += encoded
+
+    def key(self, key, out):
+        """Write Key Token.
+        :param key:
+        :param out:
+        """
+        if not isinstance(key, str):
+            out.append(1)
+            return self.encode(key, out, None)
+        index = self.keys.get(key)
+        if index is not None:
+            return _write_varint(out, index + 2)
+        encoded = key.encode("utf-8")
+        self.keys[key] = len(self.keys)
+        out.append(0)
+        _write_varint(out, len(encoded))
+        out += encoded
+
+    def encode(self, value, out, nested):
+        """Write Value.
+        :param value:
+        :param out: Bytearray.
+        :param nested: Class of the Box holding plain dicts, or None.
+        """
+        kind = type(value)
+        if kind is str:
+            encoded = value.encode("utf-8")
+            out.append(_CODEC_STR)
+            _write_varint(out, len(encoded))
+            out += encoded
+        elif value is None:
+            out.append(_CODEC_NONE)
+        elif kind is bool:
+            out.append(_CODEC_TRUE if value else _CODEC_FALSE)
+        elif kind is int:
+            out.append(_CODEC_INT)
+            _write_varint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+        elif kind is float:
+            out.append(_CODEC_FLOAT_TAG)
+            out += _CODEC_FLOAT.pack(value)
+        elif isinstance(value, Mapping):
+            cls = type(value)
+            items = value.items()
+            hidden = ()
+            if isinstance(value, _Box) and _Box is not object:
+                cls = getattr(cls, "_box_eager_class", cls)
+                items = dict.items(value)
+                hidden = value.__dict__.get("_box_hidden", ())
+                nested = value._box_config.get("box_class", cls)
+            elif not isinstance(value, dict) or cls is dict:
+                cls = nested or dict
+            out.append(_CODEC_MAPPING)
+            self.mapping_class(cls, out)
+            _write_varint(out, len(items))
+            for k, v in items:
+                self.key(k, out)
+                self.encode(v, out, nested)
+            _write_varint(out, len(hidden))
+            for k in hidden:
+                self.key(k, out)
+        elif isinstance(value, (list, tuple)):
+            out.append(_CODEC_TUPLE if isinstance(value, tuple) else _CODEC_LIST)
+            _write_varint(out, len(value))
+            for v in value:
+                self.encode(v, out, nested)
+        elif isinstance(value, (bytes, bytearray)):
+            out.append(_CODEC_BYTES)
+            _write_varint(out, len(value))
+            out += value
+        elif isinstance(value, bool):
+            out.append(_CODEC_TRUE if value else _CODEC_FALSE)
+        elif isinstance(value, int):
+            self.encode(int(value), out, nested)
+        elif isinstance(value, float):
+            self.encode(float(value), out, nested)
+        elif isinstance(value, str):
+            self.encode(str(value), out, nested)
+        else:
+            raise TypeError("Cannot encode {!r}.".format(value))
+
+
+class _BoxDecoder:
+    """
+    Box Codec Decoder.
+
+    Mappings are built directly into their target class, so nested values
+    are never converted a second time by the Box they are stored in.
+
+    """
+
+    def __init__(self, box_class=None):
+        """Initialize Decoder.
+        :param box_class: Class for every decoded mapping, or None for the
+            classes recorded by the encoder.
+        """
+        self.keys = []
+        self.plain = []
+        self.classes = []
+        self.targets = {}
+        self.default = _CodecTarget(dict)
+        self.override = None if box_class is None else self.target(box_class)
+
+    def target(self, cls):
+        """
+        :param cls:
+        :return: Cached decoding target of a class.
+        """
+        target = self.targets.get(cls)
+        if target is None:
+            target = self.targets[cls] = _CodecTarget(cls)
+        return target
+
+    def mapping_class(self, data, position):
+        """Read Mapping Class Token.
+        :param data:
+        :param position:
+        :return: Target and the position after the token.
+        """
+        token, position = _read_varint(data, position)
+        if token == 1:
+            size, position = _read_varint(data, position)
+            end = position + size
+            name = str(data[position:end], "utf-8")
+            self.classes.append(self.target(_resolve_class(name)))
+            position = end
+            token = len(self.classes) + 1
+        target = self.default if token == 0 else self.classes[token - 2]
+        return self.override or target, position
+
+    def key(self, data, position):
+        """Read Key Token.
+        :param data:
+        :param position:
+        :return: Key, whether it is a plain attribute name, and the position
+            after the token.
+        """
+        token = data[position]
+        position += 1
+        if token >= 0x80:
+            token, position = _read_varint(data, position - 1)
+        if token >= 2:
+            return self.keys[token - 2], self.plain[token - 2], position
+        if token == 1:
+            key, position = self.decode(data, position, self.default)
+            return key, False, position
+        size, position = _read_varint(data, position)
+        end = position + size
+        key = str(data[position:end], "utf-8")
+        self.keys.append(key)
+        self.plain.append(key.isidentifier() and not iskeyword(key))
+        return key, self.plain[-1], end
+
+    def decode(self, data, position, target):
+        """Read Value.
+        :param data:
+        :param position:
+        :param target: Target of the mapping or sequence holding the value.
+        :return: Value and the position after it.
+        """
+        tag = data[position]
+        position += 1
+        if tag == _CODEC_STR:
+            size, position = _read_varint(data, position)
+            end = position + size
+            return str(data[position:end], "utf-8"), end
+        if tag == _CODEC_INT:
+            value, position = _read_varint(data, position)
+            return (value >> 1) ^ -(value & 1), position
+        if tag == _CODEC_MAPPING:
+            target, position = self.mapping_class(data, position)
+            count, position = _read_varint(data, position)
+            instance = target.new()
+            if target.boxed:
+                safe = target.safe
+                camel = target.camel
+                none = target.none
+                safe_keys = instance._box_config.get("__safe_keys")
+                for _ in range(count):
+                    key, plain, position = self.key(data, position)
+                    value, position = self.decode(data, position, target)
+                    if value is None and none:
+                        continue
+                    dict.__setitem__(instance, key, value)
+                    if safe and (camel or not plain):
+                        safe_keys[instance._safe_attr(key)] = key
+            else:
+                for _ in range(count):
+                    key, _plain, position = self.key(data, position)
+                    value, position = self.decode(data, position, target)
+                    instance[key] = value
+            count, position = _read_varint(data, position)
+            if count:
+                hidden = set()
+                for _ in range(count):
+                    key, _plain, position = self.key(data, position)
+                    hidden.add(key)
+                if target.boxed:
+                    object.__setattr__(instance, "_box_hidden", hidden)
+            return instance, position
+        if tag == _CODEC_FLOAT_TAG:
+            return _CODEC_FLOAT.unpack_from(data, position)[0], position + 8
+        if tag == _CODEC_NONE:
+            return None, position
+        if tag == _CODEC_TRUE:
+            return True, position
+        if tag == _CODEC_FALSE:
+            return False, position
+        if tag == _CODEC_LIST or tag == _CODEC_TUPLE:
+            count, position = _read_varint(data, position)
+            items = []
+            for _ in range(count):
+                value, position = self.decode(data, position, target)
+                items.append(value)
+            if tag == _CODEC_TUPLE:
+                return tuple(items), position
+            return target.sequence(items), position
+        if tag == _CODEC_BYTES:
+            size, position = _read_varint(data, position)
+            end = position + size
+            return bytes(data[position:end]), end
+        raise ValueError("Unknown box codec tag {!r}.".format(bytes((tag,))))
+
+    def record(self, data, position, size):
+        """Read Framed Record.
+        :param data:
+        :param position: Position of the record.
+        :param size: Record size.
+        :return: Value and the position after it.
+        """
+        end = position + size
+        try:
+            value, position = self.decode(data, position, self.override or self.default)
+        except (IndexError, struct.error, UnicodeDecodeError) as error:
+            raise ValueError("Corrupt box codec record.") from error
+        if position != end:
+            raise ValueError("Corrupt box codec record.")
+        return value, end
+
+
+class BoxCodec:
+    """
+    Binary Box Codec.
+
+    Encodes boxes, mappings, sequences and scalars into a compact binary
+    format. Every key is written once per stream and referred to by index
+    afterwards, so records sharing a schema only pay for their values. Box
+    classes are recorded by name and restored with their defaults and
+    deleted default keys. Data is only decoded into mapping classes, but
+    decoding imports the modules they are defined in, so only load trusted
+    data.
+
+    """
+
+    def __init__(self, box_class=None):
+        """Initialize Codec.
+        :param box_class: Class to decode every mapping into, for example
+            FrozenBox, instead of the recorded classes.
+        """
+        self.box_class = box_class
+
+    def dumps(self, value):
+        """Encode Value.
+        :param value:
+        :return: Bytes.
+        """
+        stream = io.BytesIO()
+        self.dump((value,), stream)
+        return stream.getvalue()
+
+    def loads(self, data):
+        """Decode Value.
+        :param data: Bytes written by `dumps`.
+        :return:
+        """
+        data = memoryview(data).cast("B")
+        if bytes(data[: len(_CODEC_MAGIC)]) != _CODEC_MAGIC:
+            raise ValueError("Not box codec data.")
+        try:
+            size, position = _read_varint(data, len(_CODEC_MAGIC))
+        except IndexError as error:
+            raise ValueError("Corrupt box codec record.") from error
+        value, position = _BoxDecoder(self.box_class).record(data, position, size)
+        if position != len(data):
+            raise ValueError("Trailing data after box codec record.")
+        return value
+
+    def dump(self, values, stream):
+        """Encode Sequence of Values into a Stream.
+        Keys and classes are shared by all the records of the stream.
+        :param values: Iterable of values.
+        :param stream: Binary file object.
+        :return: Number of records written.
+        """
+        encoder = _BoxEncoder()
+        stream.write(_CODEC_MAGIC)
+        out = bytearray()
+        frame = bytearray()
+        count = 0
+        for value in values:
+            encoder.encode(value, out, None)
+            _write_varint(frame, len(out))
+            stream.write(frame + out)
+            del out[:], frame[:]
+            count += 1
+        return count
+
+    def load(self, stream):
+        """Decode Values from a Stream Written by `dump` or `dumps`.
+        :param stream: Binary file object.
+        :return: Generator of values.
+        """
+        if stream.read(len(_CODEC_MAGIC)) != _CODEC_MAGIC:
+            raise ValueError("Not box codec data.")
+        decoder = _BoxDecoder(self.box_class)
+        while True:
+            size = _read_stream_varint(stream)
+            if size is None:
+                return
+            data = stream.read(size)
+            if len(data) != size:
+                raise ValueError("Truncated box codec stream.")
+            yield decoder.record(data, 0, len(data))[0]
+
+
+def subset_box(
+    total,
+    key=lambda x: x,
+    *,
+    name_for_original=None,
+    box_class=Box,
+    view=False,
+    writable=False
+):
+    """
+    Get subset of mapping type as a Box or BoxObject.
+    :param total:
+    :param key: Subset function, or with `view` set, a collection of keys.
+    :param name_for_original:
+    :param box_class:
+    :param view: Return a BoxView over the subset instead of copying it,
+        which is cheaper to extract but slower to read.
+    :param writable: Write through to the original mapping from the view.
+    :return:
+    """
+    if view:
+        extra = {name_for_original: total} if name_for_original else None
+        if not callable(key):
+            return BoxView(
+                total, key, extra=extra, writable=writable, box_class=box_class
+            )
+        subset = key(total)
+        if isinstance(subset, Mapping):
+            return BoxView(subset, extra=extra, writable=writable, box_class=box_class)
+    else:
+        subset = key(total)
+    kwargs = box_class({name_for_original: total}) if name_for_original else box_class()
+    if isinstance(subset, Mapping):
+        return box_class(subset, **kwargs)
+    return BoxObject(subset, box_class=box_class, **kwargs)
+
+
+def _read_lines(stream, chunk_size):
+    """Read Batches of Non-Empty Lines from a Stream.
+    :param stream: Binary or text file object.
+    :param chunk_size: Number of bytes or characters per read.
+    :return: Generator of lists of lines, one list per read.
+    """
+    remainder = None
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        lines = chunk.split(b"\n" if isinstance(chunk, bytes) else "\n")
+        if remainder:
+            lines[0] = remainder + lines[0]
+        remainder = lines.pop()
+        lines = [line for line in lines if line.strip()]
+        if lines:
+            yield lines
+    if remainder and remainder.strip():
+        yield [remainder]
+
+
+def _decode_lines(lines):
+    """Decode a Batch of JSON Lines.
+    :param lines:
+    :return: Decoded records.
+    """
+    return [json.loads(line) for line in lines]
+
+
+def _iter_records(stream, chunk_size, workers):
+    """Decode Records from a JSON Lines Stream.
+    :param stream: Binary or text file object.
+    :param chunk_size: Number of bytes or characters per read.
+    :param workers: Number of decoding processes, or None to decode here.
+    :return: Generator of decoded records.
+    """
+    batches = _read_lines(stream, chunk_size)
+    if not workers:
+        for lines in batches:
+            yield from _decode_lines(lines)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        for lines in batches:
+            pending.append(executor.submit(_decode_lines, lines))
+            if len(pending) > 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def iter_boxes(
+    path_or_file, box_class=Box, chunk_size=1 << 20, *, workers=None, **kwargs
+):
+    """
+    Stream Boxes from a JSON Lines File.
+    The file is read `chunk_size` at a time, so memory stays bounded by the
+    chunk size and, with `workers`, by twice as many chunks per process.
+    Records that are not objects are yielded unchanged.
+    Each worker task decodes a whole chunk, but the decoded records are still
+    pickled back and boxed in this process, so `workers` only pays off with
+    spare cores and records that are costly to decode relative to their
+    size; for small records it is slower.
+    :param path_or_file: Path or binary or text file object.
+    :param box_class: Box class of each record, e.g. FrozenBox.
+    :param chunk_size: Number of bytes or characters per read.
+    :param workers: Number of processes decoding JSON, or None to decode in
+        this process.
+    :param kwargs: Box options for each record.
+    :return: Generator of boxes.
+    """
+    if hasattr(path_or_file, "read"):
+        stream = path_or_file
+    else:
+        stream = open(path_or_file, "rb")
+    try:
+        for record in _iter_records(stream, chunk_size, workers):
+            yield box_class(record, **kwargs) if isinstance(record, dict) else record
+    finally:
+        if stream is not path_or_file:
+            stream.close()
+
+
+if box is None:
+    BoxObject = NotImplemented
+else:
+    BoxObject = _BoxObject
+
+if not _has_shared_memory:
+    SharedBox = NotImplemented
+else:
+    SharedBox = _SharedBox
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*- #
+#
+# wrapping/extended/__init__.py
+#
+#
+# MIT License
+#
+# Copyright (c) 2019 Brandon Gomes
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+"""
+Wrapping Library: Extended Modules.
+
+Importing `wrapping.extended.<name>` builds the extended version of the base
+module registered under `name`, and caches it in `sys.modules`. Nothing is
+imported or extended at registration.
+"""
+
+# ------------------------ Standard Library ------------------------ #
+
+import sys
+from importlib import import_module
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from threading import RLock
+
+# ------------------------ Wrapping Library ------------------------ #
+
+from ..extender import extend
+
+__all__ = ("register", "unregister", "registered")
+
+_registry = {}
+_registry_lock = RLock()
+
+
+class _ExtendedLoader(Loader):
+    """
+    Loader Building a Registered Extended Module.
+
+    """
+
+    def __init__(self, base, extensions, package):
+        """Initialize Loader.
+        :param base: Base module, or its name.
+        :param extensions: Extension table.
+        :param package: Anchor package for relative source names.
+        """
+        self.base = base
+        self.extensions = extensions
+        self.package = package
+
+    def create_module(self, spec):
+        """
+        :param spec:
+        :return: Extended module.
+        """
+        return extend(self.base, self.extensions, spec.name, self.package)
+
+    def exec_module(self, module):
+        """Names are resolved on first access, so there is nothing to execute.
+        :param module:
+        """
+
+
+class _ExtendedFinder(MetaPathFinder):
+    """
+    Finder for Registered Extended Modules.
+
+    """
+
+    def find_spec(self, fullname, path=None, target=None):
+        """
+        :param fullname:
+        :param path:
+        :param target:
+        :return: Spec of a registered extended module, or None.
+        """
+        package, _, name = fullname.rpartition(".")
+        if package != __name__:
+            return None
+        with _registry_lock:
+            registration = _registry.get(name)
+        if registration is None:
+            return None
+        return ModuleSpec(fullname, _ExtendedLoader(*registration))
+
+
+def register(name, base=None, extensions=None, package=None):
+    """Register Extended Module.
+    :param name: Name of the extended module under `wrapping.extended`.
+    :param base: Base module, or its name, `name` by default.
+    :param extensions: Mapping from sources to tuples of extension names, as
+        taken by `wrapping.extender.extend`.
+    :param package: Anchor package for relative source names.
+    :return: Full name of the extended module.
+    """
+    if not name.isidentifier():
+        raise ValueError("Invalid extended module name {!r}.".format(name))
+    fullname = "{}.{}".format(__name__, name)
+    with _registry_lock:
+        if fullname in sys.modules:
+            raise ValueError("{!r} is already imported.".format(fullname))
+        _registry[name] = (name if base is None else base, extensions, package)
+    return fullname
+
+
+def unregister(name):
+    """Unregister Extended Module, Dropping it from `sys.modules`.
+    :param name: Name of the extended module under `wrapping.extended`.
+    """
+    with _registry_lock:
+        del _registry[name]
+        sys.modules.pop("{}.{}".format(__name__, name), None)
+        globals().pop(name, None)
+
+
+def registered():
+    """
+    :return: Names of the registered extended modules.
+    """
+    with _registry_lock:
+        return tuple(_registry)
+
+
+def __getattr__(name):
+    """Import Registered Extended Modules on First Access.
+    :param name: Attribute name.
+    :return: Extended module.
+    """
+    with _registry_lock:
+        if name not in _registry:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(__name__, name)
+            )
+    return import_module("." + name, __name__)
+
+
+def __dir__():
+    """
+    :return: Names in the module namespace and registered extended modules.
+    """
+    return sorted(set(globals()) | set(registered()))
+
+
+if not any(isinstance(finder, _ExtendedFinder) for finder in sys.meta_path):
+    sys.meta_path.append(_ExtendedFinder())
@@ -30,11 +30,149 @@
 Wrapping Extender Library.
 """
 
-# ------------------------ Wrapping Library ------------------------ #
+# ------------------------ Standard Library ------------------------ #
 
+from importlib import import_module
+from threading import RLock
+from types import ModuleType
 
-__all__ = ("extend",)
+__all__ = ("extend", "ExtendedModule")
 
+_LOCAL_NAMES = frozenset(
+    (
+        "__name__",
+        "__doc__",
+        "__package__",
+        "__loader__",
+        "__spec__",
+        "__path__",
+        "__file__",
+        "__cached__",
+        "__builtins__",
+        "__all__",
+        "__extensions__",
+    )
+)
 
-def extend(module):
-    """"""
+
+class ExtendedModule(ModuleType):
+    """
+    Lazy Superset of a Base Module.
+
+    Exposes the names of the base module plus a table of extension names,
+    which take precedence over base names. Nothing is imported when the
+    module is built: the base module and the extension sources are imported
+    on first access to one of their names, and every resolved name is cached
+    in the module namespace.
+
+    """
+
+    def __init__(self, name, base, extensions=None, package=None, doc=None):
+        """Initialize Extended Module.
+        :param name: Name of the extended module.
+        :param base: Base module, or its name.
+        :param extensions: Mapping from sources to tuples of extension names,
+            where sources are modules, objects or module names.
+        :param package: Anchor package for relative source names.
+        :param doc: Module docstring, the docstring of the base by default.
+        """
+        super().__init__(name, doc)
+        locations = {}
+        for source, names in (extensions or {}).items():
+            for extension in names:
+                locations[extension] = source
+        namespace = self.__dict__
+        namespace["_extended_base"] = base
+        namespace["_extended_package"] = package
+        namespace["_extended_locations"] = locations
+        namespace["_extended_lock"] = RLock()
+        namespace["__extensions__"] = tuple(locations)
+
+    def _extended_source(self, source):
+        """
+        :param source: Module, object or module name.
+        :return: Source object, importing it if necessary.
+        """
+        if not isinstance(source, str):
+            return source
+        return import_module(source, self.__dict__["_extended_package"])
+
+    def _extended_module(self):
+        """Import the Base Module Exactly Once.
+        :return: Base module.
+        """
+        namespace = self.__dict__
+        base = namespace["_extended_base"]
+        if isinstance(base, str):
+            with namespace["_extended_lock"]:
+                base = namespace["_extended_base"]
+                if isinstance(base, str):
+                    base = self._extended_source(base)
+                    namespace["_extended_base"] = base
+                    if namespace["__doc__"] is None:
+                        namespace["__doc__"] = base.__doc__
+        return base
+
+    def __getattr__(self, name):
+        """Resolve Base and Extension Names on First Access.
+        :param name: Attribute name.
+        :return: Attribute value, cached in the module namespace.
+        """
+        namespace = self.__dict__
+        locations = namespace["_extended_locations"]
+        if name == "__all__":
+            base = self._extended_module()
+            names = getattr(base, "__all__", None)
+            if names is None:
+                names = (n for n in dir(base) if not n.startswith("_"))
+            value = tuple(n for n in names if n not in locations) + tuple(locations)
+        elif name in locations:
+            value = getattr(self._extended_source(locations[name]), name)
+        elif name in _LOCAL_NAMES or name.startswith("_extended_"):
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(self.__name__, name)
+            )
+        else:
+            try:
+                value = getattr(self._extended_module(), name)
+            except AttributeError:
+                raise AttributeError(
+                    "module {!r} has no attribute {!r}".format(self.__name__, name)
+                ) from None
+        namespace[name] = value
+        return value
+
+    def __dir__(self):
+        """
+        :return: Names of the base module, the extensions and the namespace.
+        """
+        names = set(dir(self._extended_module())) - _LOCAL_NAMES
+        names.update(self.__dict__["_extended_locations"])
+        names.update(n for n in self.__dict__ if not n.startswith("_extended_"))
+        return sorted(names)
+
+    def __repr__(self):
+        """
+        :return: Representation of the Extended Module.
+        """
+        base = self.__dict__["_extended_base"]
+        return "<{} {!r} extending {!r}>".format(
+            type(self).__name__,
+            self.__name__,
+            base if isinstance(base, str) else base.__name__,
+        )
+
+
+def extend(module, extensions=None, name=None, package=None):
+    """Build Lazy Superset of a Module.
+    :param module: Base module, or its name to import on first use.
+    :param extensions: Mapping from sources to tuples of extension names,
+        where sources are modules, objects or module names, in the format of
+        the export table of the Wrapping Library.
+    :param name: Name of the extended module, the name of the base by default.
+    :param package: Anchor package for relative module names.
+    :return: Extended module.
+    """
+    if name is None:
+        name = module if isinstance(module, str) else module.__name__
+    return ExtendedModule(name, module, extensions, package)
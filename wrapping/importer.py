@@ -32,8 +32,28 @@ Wrapping Library: Importer.
 
 # ------------------------ Standard Library ------------------------ #
 
+import gc
+import os
+import sys
+from collections.abc import Mapping
+from contextlib import contextmanager, nullcontext
+from fnmatch import fnmatchcase
+from threading import RLock, local
+from time import perf_counter
+from types import ModuleType
 from typing import Any, AnyStr, Union, Sequence, Tuple, List, Callable, Iterable
 from importlib import import_module
+from importlib.machinery import (
+    ExtensionFileLoader,
+    PathFinder,
+    SourceFileLoader,
+    SourcelessFileLoader,
+)
+from importlib.util import (
+    find_spec,
+    resolve_name,
+    spec_from_file_location,
+)
 
 # ------------------------ External Library ------------------------ #
 
@@ -43,10 +63,25 @@ from wrapt.importer import (
     notify_module_loaded,
     discover_post_import_hooks,
 )
+from wrapt.wrappers import ObjectProxy
 
 # ------------------------ Wrapping Library ------------------------ #
 
-__extensions__ = ("fallback_import", "try_import")
+from .wrappers import value_or
+
+__extensions__ = (
+    "fallback_import",
+    "fallback_selection",
+    "try_import",
+    "LazyModule",
+    "ImportCache",
+    "ImportRecord",
+    "ImportProfiler",
+    "import_profiler",
+    "ImportHookRegistry",
+    "ImportManifest",
+    "warm_imports",
+)
 
 __all__ = (
     "register_post_import_hook",
@@ -56,18 +91,458 @@ __all__ = (
 ) + __extensions__
 
 
-def fallback_import(name: AnyStr, package: AnyStr, fallback_package: AnyStr) -> Any:
+class LazyModule(ObjectProxy):
+    """
+    Module Proxy which Imports the Underlying Module on First Attribute Access.
+
+    """
+
+    def __init__(self, name: AnyStr, spec=None):
+        """Initialize Lazy Module Proxy.
+        :param name: Absolute name of the module.
+        :param spec: Module spec found for the module.
+        """
+        placeholder = ModuleType(name)
+        placeholder.__spec__ = spec
+        super().__init__(placeholder)
+        self._self_lock = RLock()
+        self._self_loaded = False
+
+    @property
+    def __spec__(self):
+        """
+        :return: Module spec, available without importing the module.
+        """
+        return self.__wrapped__.__spec__
+
+    def _self_load(self):
+        """Import the underlying module exactly once, even across threads.
+        :return: Imported module.
+        """
+        if not self._self_loaded:
+            with self._self_lock:
+                if not self._self_loaded:
+                    self.__wrapped__ = import_module(self.__wrapped__.__name__)
+                    self._self_loaded = True
+        return self.__wrapped__
+
+    def __getattr__(self, name):
+        """Get Attribute from the Module, Importing it if Necessary.
+        :param name:
+        :return:
+        """
+        if name.startswith("_self_"):
+            raise AttributeError(name)
+        return getattr(self._self_load(), name)
+
+    def __dir__(self):
+        """
+        :return: Directory of the imported module.
+        """
+        return dir(self._self_load())
+
+    def __repr__(self):
+        """
+        :return: Representation of the Lazy Module.
+        """
+        return "<{} {!r} ({})>".format(
+            type(self).__name__,
+            self.__wrapped__.__name__,
+            "loaded" if self._self_loaded else "not loaded",
+        )
+
+
+def _lazy_import(name: AnyStr, package: AnyStr) -> Any:
+    """Find Module Spec and Return a Lazy Module if the Module Exists.
+    :param name: Name of the module.
+    :param package: Anchor Package for relative imports.
+    :return: Lazy module, or the module itself if it is already imported.
+    """
+    absolute_name = resolve_name(name, package) if name.startswith(".") else name
+    try:
+        return sys.modules[absolute_name]
+    except KeyError:
+        pass
+    spec = find_spec(absolute_name)
+    if spec is None:
+        raise ModuleNotFoundError(
+            "No module named {!r}".format(absolute_name), name=absolute_name
+        )
+    return LazyModule(absolute_name, spec)
+
+
+class ImportCache:
+    """
+    Import Resolution Cache.
+
+    Remembers which anchor resolved a name and which names are missing, so that
+    repeated calls to `try_import` and `fallback_import` skip failing finder
+    searches. Entries are tied to a fingerprint of the interpreter version and
+    the modification times of the `sys.path` entries, and can be persisted to
+    disk with `flush`.
+
+    """
+
+    MISSING = "missing"
+
+    def __init__(self, path: AnyStr = None):
+        """Initialize Import Cache.
+        :param path: Optional file used to persist the cache across processes.
+        """
+        self.path = path
+        self._lock = RLock()
+        self._entries = {}
+        self._sys_path = tuple(sys.path)
+        self._fingerprint = None
+        self._hits = 0
+        self._misses = 0
+        self._negative_hits = 0
+        self._invalidations = 0
+        if path is not None:
+            self.load()
+
+    @staticmethod
+    def fingerprint() -> dict:
+        """Compute Fingerprint for the Current Interpreter and Search Path.
+        :return: Interpreter version and sys.path entries with their mtimes.
+        """
+        entries = []
+        for entry in sys.path:
+            try:
+                mtime = os.stat(entry or os.curdir).st_mtime_ns
+            except (OSError, TypeError, ValueError):
+                mtime = None
+            entries.append([entry, mtime])
+        return {
+            "version": sys.version,
+            "cache_tag": sys.implementation.cache_tag,
+            "path": entries,
+        }
+
+    def _check_sys_path(self):
+        """Invalidate the Cache if sys.path changed since the last lookup."""
+        current = tuple(sys.path)
+        if current != self._sys_path:
+            self._sys_path = current
+            self.invalidate()
+
+    def lookup(self, key: Tuple) -> Any:
+        """Look Up Cached Outcome.
+        Negative outcomes are only trusted while the fingerprint of the
+        `sys.path` entries is unchanged, so installing a module into an
+        existing entry invalidates the cache.
+        :param key: Cache Key.
+        :return: Cached outcome or None if the key is not cached.
+        """
+        with self._lock:
+            self._check_sys_path()
+            outcome = self._entries.get(key)
+            if outcome == self.MISSING and self._fingerprint != self.fingerprint():
+                self.invalidate()
+                outcome = None
+            if outcome is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                if outcome == self.MISSING:
+                    self._negative_hits += 1
+            return outcome
+
+    def record(self, key: Tuple, outcome: Union[AnyStr, int]):
+        """Record Outcome for Key.
+        :param key: Cache Key.
+        :param outcome: Anchor or fallback candidate index which resolved the
+            key, or ImportCache.MISSING.
+        """
+        with self._lock:
+            if self._fingerprint is None:
+                self._fingerprint = self.fingerprint()
+            self._entries[key] = outcome
+
+    def discard(self, key: Tuple):
+        """Remove Key from the Cache.
+        :param key: Cache Key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self):
+        """Clear all Cached Outcomes."""
+        with self._lock:
+            self._entries.clear()
+            self._fingerprint = None
+            self._invalidations += 1
+
+    def load(self) -> bool:
+        """Load Cache from Disk if it Matches the Current Fingerprint.
+        :return: True if the persisted cache was loaded.
+        """
+        if self.path is None:
+            return False
+        import json
+
+        try:
+            with open(self.path, "r") as cache_file:
+                data = json.load(cache_file)
+        except (OSError, ValueError):
+            return False
+        fingerprint = self.fingerprint()
+        if data.get("fingerprint") != fingerprint:
+            return False
+        with self._lock:
+            for *key, outcome in data.get("entries", ()):
+                self._entries.setdefault(tuple(key), outcome)
+            self._fingerprint = fingerprint
+        return True
+
+    def flush(self):
+        """Write Cache to Disk."""
+        if self.path is None:
+            raise TypeError("Cannot flush an ImportCache without a path.")
+        with self._lock:
+            if self._fingerprint is None:
+                self._fingerprint = self.fingerprint()
+            data = {
+                "fingerprint": self._fingerprint,
+                "entries": [
+                    list(key) + [value] for key, value in self._entries.items()
+                ],
+            }
+        import json
+
+        temporary_path = "{}.{}.tmp".format(self.path, os.getpid())
+        with open(temporary_path, "w") as cache_file:
+            json.dump(data, cache_file)
+        os.replace(temporary_path, self.path)
+
+    @property
+    def stats(self) -> dict:
+        """
+        :return: Cache Statistics.
+        """
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "negative_hits": self._negative_hits,
+            "invalidations": self._invalidations,
+        }
+
+    def __contains__(self, key):
+        """
+        :return: True if the key has a cached outcome.
+        """
+        return key in self._entries
+
+    def __len__(self):
+        """
+        :return: Number of Cached Outcomes.
+        """
+        return len(self._entries)
+
+
+def _is_missing(error: Exception, name: AnyStr, package: AnyStr) -> bool:
+    """Check if Import Error means that the Name itself is Missing.
+    :param error: Error raised during import.
+    :param name: Name that was imported.
+    :param package: Anchor Package for relative imports.
+    :return: True if the module or one of its parent packages does not exist.
+    """
+    if not isinstance(error, ModuleNotFoundError) or error.name is None:
+        return False
+    try:
+        absolute_name = resolve_name(name, package) if name.startswith(".") else name
+    except (ImportError, ValueError):
+        return False
+    return absolute_name == error.name or absolute_name.startswith(error.name + ".")
+
+
+_fallback_winners = {}
+
+
+def _fallback_candidates(
+    name: Union[AnyStr, Sequence[AnyStr]], anchors: Sequence[AnyStr]
+) -> Tuple[Tuple, Tuple, List[Tuple[AnyStr, AnyStr]]]:
+    """Build Ordered Fallback Candidates.
+    :param name: Name or ordered alternative names.
+    :param anchors: Ordered anchor packages, None entries are skipped.
+    :return: Names, anchors and (name, anchor) candidates in order of preference.
+    """
+    names = (name,) if isinstance(name, str) else tuple(name)
+    anchors = tuple(anchor for anchor in anchors if anchor is not None) or (None,)
+    return names, anchors, [(n, anchor) for n in names for anchor in anchors]
+
+
+def fallback_selection(
+    name: Union[AnyStr, Sequence[AnyStr]],
+    package: AnyStr = None,
+    fallback_package: AnyStr = None,
+    *fallback_packages: AnyStr
+) -> Union[Tuple[AnyStr, AnyStr], None]:
+    """Get the Implementation Selected by a Previous `fallback_import`.
+    :param name: Name or ordered alternative names.
+    :param package: Package Anchor.
+    :param fallback_package: Fallback Package Anchor.
+    :param fallback_packages: Further Fallback Package Anchors.
+    :return: Pair of winning name and anchor, or None if not resolved yet.
+    """
+    names, anchors, _ = _fallback_candidates(
+        name, (package, fallback_package) + fallback_packages
+    )
+    return _fallback_winners.get((names, anchors))
+
+
+def fallback_import(
+    name: Union[AnyStr, Sequence[AnyStr]],
+    package: AnyStr = None,
+    fallback_package: AnyStr = None,
+    *fallback_packages: AnyStr,
+    cache: ImportCache = None,
+    refresh: bool = False
+) -> Any:
     """
     Fallback importer.
-    :param name: Name of package.
+    Tries every name in order against every anchor in order, e.g.
+    `fallback_import(("ujson", "orjson", "json"))`. The first candidate which
+    imports is memoized for the process, so later calls return it directly.
+    :param name: Name of package, or ordered alternative names.
     :param package: Package Anchor.
     :param fallback_package: Fallback Package Anchor.
+    :param fallback_packages: Further Fallback Package Anchors.
+    :param cache: Import cache remembering which candidate succeeded.
+    :param refresh: Ignore the memoized winner and resolve the chain again.
     :return: Imported Package.
     """
+    names, anchors, candidates = _fallback_candidates(
+        name, (package, fallback_package) + fallback_packages
+    )
+    if not names:
+        raise ValueError("fallback_import needs at least one name.")
+    memo_key = (names, anchors)
+    winner = None if refresh else _fallback_winners.get(memo_key)
+    if winner is not None:
+        try:
+            return import_module(*winner)
+        except ImportError:
+            _fallback_winners.pop(memo_key, None)
+    key = ("fallback_import", "|".join(names), "|".join(map(str, anchors)))
+    outcome = cache.lookup(key) if cache is not None else None
+    if outcome == ImportCache.MISSING:
+        raise ModuleNotFoundError(
+            "No module named {!r} (cached)".format(names[-1]), name=names[-1]
+        )
+    if outcome is not None:
+        try:
+            module = import_module(*candidates[outcome])
+            _fallback_winners[memo_key] = candidates[outcome]
+            return module
+        except (ImportError, IndexError, TypeError):
+            cache.discard(key)
+    all_missing = True
+    for index, candidate in enumerate(candidates):
+        try:
+            module = import_module(*candidate)
+        except ImportError as exception:
+            error = exception
+            all_missing = all_missing and _is_missing(error, *candidate)
+            continue
+        _fallback_winners[memo_key] = candidate
+        if cache is not None and all_missing:
+            cache.record(key, index)
+        return module
+    if cache is not None and all_missing:
+        cache.record(key, ImportCache.MISSING)
+    raise error
+
+
+class _SeededFinder:
+    """
+    Meta Path Finder Serving Specs Resolved Ahead of Time.
+
+    Installed just before `PathFinder`, so that finders ahead of it still see
+    and wrap every spec, and each seeded spec is used at most once.
+
+    """
+
+    def __init__(self, specs: dict):
+        """Initialize Seeded Finder.
+        :param specs: Mapping of module names to specs found by PathFinder.
+        """
+        self.specs = specs
+        self._lock = RLock()
+
+    def find_spec(self, name, path=None, target=None):
+        """
+        :param name:
+        :param path:
+        :param target:
+        :return: Seeded spec for the name, or None.
+        """
+        if target is not None:
+            return None
+        with self._lock:
+            return self.specs.pop(name, None)
+
+    def __enter__(self):
+        """Install Finder before PathFinder."""
+        for index, finder in enumerate(sys.meta_path):
+            if finder is PathFinder:
+                sys.meta_path.insert(index, self)
+                break
+        else:
+            sys.meta_path.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        """Uninstall Finder."""
+        try:
+            sys.meta_path.remove(self)
+        except ValueError:
+            pass
+
+
+def _import(name: AnyStr, package: AnyStr, lazy: bool, spec=None) -> Any:
+    """Import Module by Name, Optionally from a Pre-Resolved Spec.
+    :param name: Name of the module.
+    :param package: Anchor Package for relative imports.
+    :param lazy: Defer module execution until first attribute access.
+    :param spec: Pre-resolved module spec, seeded for the standard import
+        machinery by the caller.
+    :return: Imported module.
+    """
+    if spec is not None and lazy:
+        return sys.modules.get(spec.name) or LazyModule(spec.name, spec)
+    if lazy:
+        return _lazy_import(name, package)
+    return import_module(name, package=package)
+
+
+def _absolute_name(name: AnyStr, package: AnyStr) -> Union[AnyStr, None]:
+    """
+    :param name: Name of the module.
+    :param package: Anchor Package for relative imports.
+    :return: Absolute name, or None if it cannot be resolved.
+    """
     try:
-        return import_module(name, package)
-    except ImportError:
-        return import_module(name, fallback_package)
+        return resolve_name(name, package) if name.startswith(".") else name
+    except (ImportError, ValueError):
+        return None
+
+
+def _resolve_spec(name: AnyStr) -> Tuple[Any, float]:
+    """Find Module Spec with PathFinder, Timing the Search.
+    The parent package must already be imported, so nothing is executed.
+    :param name: Absolute name of the module.
+    :return: Pair of spec or None, and elapsed seconds.
+    """
+    start = perf_counter()
+    parent, _, _ = name.rpartition(".")
+    try:
+        path = sys.modules[parent].__path__ if parent else None
+        spec = PathFinder.find_spec(name, path)
+    except Exception:
+        spec = None
+    return spec, perf_counter() - start
 
 
 def _recurse_try_import(
@@ -77,6 +552,10 @@ def _recurse_try_import(
     log_error: Callable[[Any], None],
     log_success: Callable[[Any], None],
     default: Any,
+    lazy: bool,
+    cache: ImportCache,
+    workers: int,
+    timings: dict,
 ) -> Tuple[List[Any], List[bool]]:
     """Recurse Try-Import Mechanism.
     :param names: Names to import
@@ -85,23 +564,132 @@ def _recurse_try_import(
     :param log_error: Log function for errors
     :param log_success: Log function for successes
     :param default: Default value for missing names
+    :param lazy: Defer module execution until first attribute access
+    :param cache: Import cache for resolution outcomes
+    :param workers: Number of threads resolving module specs
+    :param timings: Mapping filled with per-name timing
     :return: Pair of resulting objects and success/failure flags
     """
-    return tuple(
-        zip(
-            *[
-                try_import(
-                    name,
-                    package,
-                    *exceptions,
-                    log_error=log_error,
-                    log_success=log_success,
-                    default=default
-                )
-                for name in names
-            ]
-        )
+    for name in names:
+        if name.startswith(".") and package is None:
+            raise TypeError(
+                "Relative Packages must be imported with an anchor package."
+            )
+    specs = [None] * len(names)
+    find_times = [None] * len(names)
+    absolute = [_absolute_name(name, package) for name in names]
+    if workers is not None and workers > 1 and len(names) > 1:
+        pending = []
+        for index, name in enumerate(absolute):
+            if name is None or name in sys.modules:
+                continue
+            if cache is not None and ("try_import", names[index], package) in cache:
+                continue
+            parent, _, _ = name.rpartition(".")
+            if parent and parent not in sys.modules:
+                try:
+                    import_module(parent)
+                except Exception:
+                    continue
+            pending.append(index)
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            resolved = executor.map(
+                lambda index: _resolve_spec(absolute[index]), pending
+            )
+            for index, (spec, elapsed) in zip(pending, resolved):
+                specs[index] = spec
+                find_times[index] = elapsed
+    order = sorted(
+        range(len(names)),
+        key=lambda index: absolute[index].count(".") if absolute[index] else 0,
     )
+    results = [None] * len(names)
+    seeded = {spec.name: spec for spec in specs if spec is not None}
+    with _SeededFinder(seeded) if seeded else nullcontext():
+        for index in order:
+            start = perf_counter()
+            results[index] = _try_import_one(
+                names[index],
+                package,
+                exceptions,
+                log_error,
+                log_success,
+                default,
+                lazy,
+                cache,
+                specs[index],
+            )
+            if timings is not None:
+                timing = {"load": perf_counter() - start}
+                if find_times[index] is not None:
+                    timing["find"] = find_times[index]
+                timings[names[index]] = timing
+    return tuple(zip(*results))
+
+
+def _try_import_one(
+    name: AnyStr,
+    package: AnyStr,
+    exceptions: Iterable[Exception],
+    log_error: Callable[[Any], None],
+    log_success: Callable[[Any], None],
+    default: Any,
+    lazy: bool,
+    cache: ImportCache,
+    spec=None,
+) -> Tuple[Any, bool]:
+    """Try-Import Mechanism for a Single Name.
+    :param name: Name to import
+    :param package: Anchor Package
+    :param exceptions: Exceptions to catch during import
+    :param log_error: Log function for errors
+    :param log_success: Log function for successes
+    :param default: Default value for missing names
+    :param lazy: Defer module execution until first attribute access
+    :param cache: Import cache for resolution outcomes
+    :param spec: Pre-resolved module spec
+    :return: Pair of result and success/failure flag
+    """
+    key = ("try_import", name, package)
+    outcome = cache.lookup(key) if cache is not None else None
+    if outcome == ImportCache.MISSING:
+        log_error(
+            ModuleNotFoundError("No module named {!r} (cached)".format(name), name=name)
+        )
+        return default, False
+    if outcome != "package":
+        try:
+            module = _import(name, package, lazy, spec)
+            if cache is not None:
+                cache.record(key, "name")
+            log_success(module)
+            return module, True
+        except exceptions as exception:
+            error = exception
+    else:
+        error = None
+    try:
+        module = import_module(package)
+        resource = getattr(module, name)
+        if cache is not None and (error is None or _is_missing(error, name, package)):
+            cache.record(key, "package")
+        log_success(resource)
+        return resource, True
+    except exceptions as import_error:
+        log_error(import_error)
+    except AttributeError as attribute_error:
+        log_error(attribute_error)
+    if error is None:
+        cache.discard(key)
+        return _try_import_one(
+            name, package, exceptions, log_error, log_success, default, lazy, cache
+        )
+    log_error(error)
+    if cache is not None and _is_missing(error, name, package):
+        cache.record(key, ImportCache.MISSING)
+    return default, False
 
 
 def try_import(
@@ -110,7 +698,11 @@ def try_import(
     *exceptions: Exception,
     log_error: Callable[[Any], None] = lambda s: None,
     log_success: Callable[[Any], None] = lambda s: None,
-    default: Any = None
+    default: Any = None,
+    lazy: bool = False,
+    cache: ImportCache = None,
+    workers: int = None,
+    timings: dict = None
 ) -> Union[Tuple[Any, bool], Tuple[List[Any], List[bool]]]:
     """Attempt Package Import With Automatic Exception Handling.
     :param names: Names to import. Input as one string or a list of strings.
@@ -119,29 +711,832 @@ def try_import(
     :param log_error: Log function for logging errors.
     :param log_success: Log function for logging successes.
     :param default: Default value for missing names.
+    :param lazy: Only check that modules exist and return LazyModule proxies
+        which import them on first attribute access.
+    :param cache: Import cache remembering how names resolved and which names
+        are missing.
+    :param workers: For a list of names, number of threads used to find module
+        specs concurrently before executing the modules, parents first.
+    :param timings: Mapping filled with the seconds spent finding ("find") and
+        loading ("load") each name.
     :return: Pair of result and success/failure flag
     """
     if not exceptions:
         exceptions = (ImportError, ModuleNotFoundError)
     if not isinstance(names, str) and isinstance(names, Sequence):
         return _recurse_try_import(
-            names, package, exceptions, log_error, log_success, default
+            names,
+            package,
+            exceptions,
+            log_error,
+            log_success,
+            default,
+            lazy,
+            cache,
+            workers,
+            timings,
         )
     elif names.startswith(".") and package is None:
         raise TypeError("Relative Packages must be imported with an anchor package.")
+    start = perf_counter()
+    result = _try_import_one(
+        names, package, exceptions, log_error, log_success, default, lazy, cache
+    )
+    if timings is not None:
+        timings[names] = {"load": perf_counter() - start}
+    return result
+
+
+class ImportRecord:
+    """
+    Timing Record for a Single Module Import.
+
+    """
+
+    def __init__(self, name: AnyStr, find: float = 0.0):
+        """Initialize Import Record.
+        :param name: Name of the imported module.
+        :param find: Seconds spent finding the module spec.
+        """
+        self.name = name
+        self.parent = None
+        self.children = []
+        self.find = find
+        self.wall = 0.0
+
+    @property
+    def self_time(self) -> float:
+        """
+        :return: Seconds spent in this import excluding nested imports.
+        """
+        return self.wall - sum(child.wall for child in self.children)
+
+    @property
+    def path(self) -> List[AnyStr]:
+        """
+        :return: Names of the chain of imports leading to this import.
+        """
+        path = []
+        record = self
+        while record is not None:
+            path.append(record.name)
+            record = record.parent
+        return path[::-1]
+
+    def as_dict(self) -> dict:
+        """
+        :return: Record as a plain dictionary.
+        """
+        return {
+            "name": self.name,
+            "parent": self.parent.name if self.parent is not None else None,
+            "children": [child.name for child in self.children],
+            "find": self.find,
+            "wall": self.wall,
+            "self_time": self.self_time,
+        }
+
+    def __repr__(self):
+        """
+        :return: Representation of Import Record.
+        """
+        return "{}({!r}, wall={:.6f}, self_time={:.6f})".format(
+            type(self).__name__, self.name, self.wall, self.self_time
+        )
+
+
+_finding = local()
+
+
+def _find_spec_after(finder, name, path=None, target=None):
+    """Find Spec with every Meta Path Finder except the Given One.
+    Re-entrant searches for the same name by the same finder, made by other
+    finders which search `sys.meta_path` themselves, find nothing, so each
+    finder handles a name at most once per import.
+    :param finder: Meta path finder to skip.
+    :param name: Name of the module.
+    :param path: Parent package search path.
+    :param target: Module object targeted by a reload.
+    :return: Module spec or None.
+    """
+    try:
+        in_progress = _finding.in_progress
+    except AttributeError:
+        in_progress = _finding.in_progress = set()
+    key = (id(finder), name)
+    if key in in_progress:
+        return None
+    in_progress.add(key)
     try:
-        module = import_module(names, package=package)
-        log_success(module)
-        return module, True
-    except exceptions as error:
+        for other in list(sys.meta_path):
+            if other is finder:
+                continue
+            find = getattr(other, "find_spec", None)
+            if find is None:
+                continue
+            spec = find(name, path, target)
+            if spec is not None:
+                return spec
+        return None
+    finally:
+        in_progress.discard(key)
+
+
+def _restore_loader(module, proxy):
+    """Replace Loader Proxy with the Original Loader on the Module.
+    :param module: Executed module.
+    :param proxy: Loader proxy installed by a meta path finder.
+    """
+    spec = getattr(module, "__spec__", None)
+    if spec is not None and spec.loader is proxy:
+        spec.loader = proxy.__wrapped__
+    if getattr(module, "__loader__", None) is proxy:
+        module.__loader__ = proxy.__wrapped__
+
+
+class _ProfilingLoader(ObjectProxy):
+    """
+    Loader Proxy which Times Module Creation and Execution.
+
+    """
+
+    def __init__(self, loader, profiler, record):
+        """Initialize Profiling Loader.
+        :param loader: Wrapped loader.
+        :param profiler: Owning ImportProfiler.
+        :param record: Record receiving the timing.
+        """
+        super().__init__(loader)
+        self._self_profiler = profiler
+        self._self_record = record
+
+    def create_module(self, spec):
+        """Create Module with the Wrapped Loader, Timing the Creation.
+        :param spec:
+        :return:
+        """
+        start = perf_counter()
         try:
-            module = import_module(package)
-            resource = getattr(module, names)
-            log_success(resource)
-            return resource, True
-        except exceptions as import_error:
-            log_error(import_error)
-        except AttributeError as attribute_error:
-            log_error(attribute_error)
-        log_error(error)
-    return default, False
+            return self.__wrapped__.create_module(spec)
+        finally:
+            self._self_record.wall += perf_counter() - start
+
+    def exec_module(self, module):
+        """Execute Module with the Wrapped Loader, Timing the Execution.
+        :param module:
+        :return:
+        """
+        profiler = self._self_profiler
+        record = self._self_record
+        stack = profiler._stack()
+        if stack:
+            record.parent = stack[-1]
+            stack[-1].children.append(record)
+        stack.append(record)
+        start = perf_counter()
+        try:
+            self.__wrapped__.exec_module(module)
+        finally:
+            record.wall += perf_counter() - start + record.find
+            stack.pop()
+            profiler._add(record)
+            _restore_loader(module, self)
+
+
+class ImportProfiler:
+    """
+    Import-Time Profiler.
+
+    Installs a meta path finder which times finding, creating and executing
+    every module imported while it is enabled, and keeps the results as a
+    parent/child tree of ImportRecord objects.
+
+    """
+
+    def __init__(self):
+        """Initialize Import Profiler."""
+        self._records = []
+        self._lock = RLock()
+        self._local = local()
+
+    def _stack(self) -> List[ImportRecord]:
+        """
+        :return: Stack of imports in progress on the current thread.
+        """
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def _add(self, record: ImportRecord):
+        """Add Completed Record.
+        :param record: Completed import record.
+        """
+        with self._lock:
+            self._records.append(record)
+
+    @property
+    def enabled(self) -> bool:
+        """
+        :return: True if the profiler is installed on sys.meta_path.
+        """
+        return any(finder is self for finder in sys.meta_path)
+
+    def enable(self):
+        """Start Profiling Imports."""
+        if not self.enabled:
+            sys.meta_path.insert(0, self)
+
+    def disable(self):
+        """Stop Profiling Imports."""
+        sys.meta_path[:] = [finder for finder in sys.meta_path if finder is not self]
+
+    def clear(self):
+        """Remove all Records."""
+        with self._lock:
+            self._records.clear()
+
+    def __enter__(self):
+        """Enable Profiler."""
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Disable Profiler."""
+        self.disable()
+
+    def find_spec(self, name, path=None, target=None):
+        """Find Spec with the Remaining Finders and Wrap its Loader.
+        :param name:
+        :param path:
+        :param target:
+        :return:
+        """
+        start = perf_counter()
+        spec = _find_spec_after(self, name, path, target)
+        if spec is None:
+            return None
+        if not hasattr(spec.loader, "exec_module"):
+            return spec
+        record = ImportRecord(name, perf_counter() - start)
+        spec.loader = _ProfilingLoader(spec.loader, self, record)
+        return spec
+
+    @property
+    def records(self) -> List[ImportRecord]:
+        """
+        :return: All import records in order of completion.
+        """
+        with self._lock:
+            return list(self._records)
+
+    @property
+    def roots(self) -> List[ImportRecord]:
+        """
+        :return: Records of top-level imports.
+        """
+        return [record for record in self.records if record.parent is None]
+
+    @property
+    def total(self) -> float:
+        """
+        :return: Seconds spent in all top-level imports.
+        """
+        return sum(record.wall for record in self.roots)
+
+    def get(self, name: AnyStr) -> ImportRecord:
+        """Get Latest Record for Module.
+        :param name: Name of the module.
+        :return: Import record or None.
+        """
+        for record in reversed(self.records):
+            if record.name == name:
+                return record
+        return None
+
+    def top(self, count: int = 10, key: AnyStr = "self_time") -> List[ImportRecord]:
+        """Get Most Expensive Imports.
+        :param count: Number of records.
+        :param key: Timing to sort by: "self_time", "wall" or "find".
+        :return: Records sorted by decreasing time.
+        """
+        return sorted(
+            self.records, key=lambda record: getattr(record, key), reverse=True
+        )[:count]
+
+    def as_dicts(self) -> List[dict]:
+        """
+        :return: All records as plain dictionaries.
+        """
+        return [record.as_dict() for record in self.records]
+
+    def folded(self) -> List[AnyStr]:
+        """Export Records in Folded Stack Format for Flame Graph Tools.
+        :return: Lines of semicolon-separated import chains and self time in
+            microseconds.
+        """
+        return [
+            "{} {}".format(";".join(record.path), max(int(record.self_time * 1e6), 0))
+            for record in self.records
+        ]
+
+
+@contextmanager
+def import_profiler():
+    """Profile Imports in a Block.
+    :return: Enabled ImportProfiler which is disabled when the block exits.
+    """
+    profiler = ImportProfiler()
+    with profiler:
+        yield profiler
+
+
+class _HookNode:
+    """
+    Node of the Import Hook Pattern Trie.
+
+    """
+
+    __slots__ = ("children", "wildcards", "hooks", "descendant_hooks")
+
+    def __init__(self):
+        """Initialize Empty Node."""
+        self.children = {}
+        self.wildcards = {}
+        self.hooks = []
+        self.descendant_hooks = []
+
+    def insert(self, pattern: AnyStr, entry: Tuple[int, Callable]):
+        """Insert Hook Entry for Pattern.
+        :param pattern: Dotted module pattern.
+        :param entry: Pair of registration order and hook.
+        """
+        node = self
+        segments = pattern.split(".")
+        for index, segment in enumerate(segments):
+            if segment == "*" and index == len(segments) - 1:
+                node.descendant_hooks.append(entry)
+                return
+            table = node.wildcards if _has_wildcard(segment) else node.children
+            node = table.setdefault(segment, _HookNode())
+        node.hooks.append(entry)
+
+    def match(self, name: AnyStr) -> List[Tuple[int, Callable]]:
+        """Find Hook Entries Matching a Module Name.
+        :param name: Dotted module name.
+        :return: Matching entries in registration order.
+        """
+        entries = []
+        nodes = [self]
+        for segment in name.split("."):
+            next_nodes = []
+            for node in nodes:
+                entries.extend(node.descendant_hooks)
+                child = node.children.get(segment)
+                if child is not None:
+                    next_nodes.append(child)
+                for wildcard, child in node.wildcards.items():
+                    if fnmatchcase(segment, wildcard):
+                        next_nodes.append(child)
+            nodes = next_nodes
+            if not nodes:
+                break
+        for node in nodes:
+            entries.extend(node.hooks)
+        entries.sort(key=lambda entry: entry[0])
+        return entries
+
+
+def _has_wildcard(segment: AnyStr) -> bool:
+    """
+    :return: True if the pattern segment contains glob characters.
+    """
+    return any(character in segment for character in "*?[")
+
+
+class _HookLoader(ObjectProxy):
+    """
+    Loader Proxy which Runs Matching Hooks after Module Execution.
+
+    """
+
+    def __init__(self, loader, registry):
+        """Initialize Hook Loader.
+        :param loader: Wrapped loader.
+        :param registry: Owning ImportHookRegistry.
+        """
+        super().__init__(loader)
+        self._self_registry = registry
+
+    def exec_module(self, module):
+        """Execute Module with the Wrapped Loader then Dispatch Hooks.
+        :param module:
+        :return:
+        """
+        try:
+            self.__wrapped__.exec_module(module)
+        finally:
+            _restore_loader(module, self)
+        self._self_registry.dispatch(sys.modules.get(module.__name__, module))
+
+
+class ImportHookRegistry:
+    """
+    Pattern-Indexed Post-Import Hook Registry.
+
+    Hooks are registered for dotted patterns: literal names match one module,
+    segments with glob characters match a single segment, and a final `*`
+    segment matches every submodule of the prefix, so `myorg.plugins.*`
+    matches `myorg.plugins.a` and `myorg.plugins.a.b`. Patterns are kept in a
+    trie keyed by segment, so the cost of matching a module does not grow with
+    the number of registered hooks.
+
+    """
+
+    def __init__(self):
+        """Initialize Import Hook Registry."""
+        self._root = _HookNode()
+        self._lock = RLock()
+        self._count = 0
+        self._timings = {}
+
+    def __len__(self):
+        """
+        :return: Number of registered hooks.
+        """
+        return self._count
+
+    @property
+    def enabled(self) -> bool:
+        """
+        :return: True if the registry is installed on sys.meta_path.
+        """
+        return any(finder is self for finder in sys.meta_path)
+
+    def enable(self):
+        """Start Dispatching Hooks for New Imports."""
+        if not self.enabled:
+            sys.meta_path.insert(0, self)
+
+    def disable(self):
+        """Stop Dispatching Hooks for New Imports."""
+        sys.meta_path[:] = [finder for finder in sys.meta_path if finder is not self]
+
+    def register(self, pattern: AnyStr, hook: Callable[[Any], None]):
+        """Register Hook for Modules Matching a Pattern.
+        :param pattern: Dotted module pattern.
+        :param hook: Function called with each matching module once imported.
+        """
+        self.register_many(((pattern, hook),))
+
+    def register_many(self, hooks):
+        """Register Many Hooks at Once.
+        Already imported modules are matched against the new hooks with a
+        single pass over sys.modules.
+        :param hooks: Mapping or iterable of (pattern, hook) pairs.
+        """
+        if isinstance(hooks, Mapping):
+            hooks = hooks.items()
+        batch = _HookNode()
+        with self._lock:
+            for pattern, hook in hooks:
+                entry = (self._count, hook)
+                self._root.insert(pattern, entry)
+                batch.insert(pattern, entry)
+                self._count += 1
+        self.enable()
+        for name, module in list(sys.modules.items()):
+            if module is not None and not isinstance(module, LazyModule):
+                self._run(name, module, batch.match(name))
+
+    def when_imported(self, pattern: AnyStr):
+        """Decorator Registering a Hook for a Pattern.
+        :param pattern: Dotted module pattern.
+        :return: Decorator.
+        """
+
+        def register(hook):
+            self.register(pattern, hook)
+            return hook
+
+        return register
+
+    def matches(self, name: AnyStr) -> List[Callable[[Any], None]]:
+        """Get Hooks Matching a Module Name.
+        :param name: Dotted module name.
+        :return: Hooks in registration order.
+        """
+        return [hook for _, hook in self._root.match(name)]
+
+    def dispatch(self, module):
+        """Run all Hooks Matching a Loaded Module.
+        :param module: Loaded module.
+        """
+        self._run(module.__name__, module, self._root.match(module.__name__))
+
+    def _run(self, name, module, entries):
+        """Run Hook Entries for Module and Record the Time Spent.
+        :param name: Module name.
+        :param module: Loaded module.
+        :param entries: Matching hook entries.
+        """
+        if not entries:
+            return
+        start = perf_counter()
+        try:
+            for _, hook in entries:
+                hook(module)
+        finally:
+            with self._lock:
+                self._timings[name] = self._timings.get(name, 0.0) + (
+                    perf_counter() - start
+                )
+
+    @property
+    def timings(self) -> dict:
+        """
+        :return: Seconds spent running hooks, per module name.
+        """
+        with self._lock:
+            return dict(self._timings)
+
+    def find_spec(self, name, path=None, target=None):
+        """Find Spec with the Remaining Finders and Wrap Matching Loaders.
+        :param name:
+        :param path:
+        :param target:
+        :return:
+        """
+        if not self._root.match(name):
+            return None
+        spec = _find_spec_after(self, name, path, target)
+        if spec is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        if type(spec.loader) is _HookLoader and spec.loader._self_registry is self:
+            return spec
+        spec.loader = _HookLoader(spec.loader, self)
+        return spec
+
+
+_MANIFEST_LOADERS = {
+    "source": SourceFileLoader,
+    "sourceless": SourcelessFileLoader,
+    "extension": ExtensionFileLoader,
+}
+
+
+class ImportManifest:
+    """
+    Frozen Import Manifest.
+
+    Records the origin of every file-based module imported while recording is
+    enabled and, once installed, serves specs for those modules straight from
+    the manifest so that later starts skip the `sys.path` search. Modules
+    missing from the manifest, or whose file has disappeared, are imported
+    normally.
+
+    """
+
+    def __init__(self, entries: dict = None):
+        """Initialize Import Manifest.
+        :param entries: Mapping of module names to recorded spec data.
+        """
+        self.entries = value_or(entries, {})
+        self._recording = False
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        """
+        :return: Number of recorded modules.
+        """
+        return len(self.entries)
+
+    def __contains__(self, name):
+        """
+        :return: True if the module is in the manifest.
+        """
+        return name in self.entries
+
+    @property
+    def stats(self) -> dict:
+        """
+        :return: Replay hits and misses.
+        """
+        return {
+            "entries": len(self.entries),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+    def add(self, spec):
+        """Record Module Spec if it is Backed by a File.
+        Loaders wrapped by the profiler or the hook registry are unwrapped.
+        :param spec: Module spec.
+        """
+        if not spec.has_location:
+            return
+        loader = spec.loader
+        while isinstance(loader, ObjectProxy):
+            loader = loader.__wrapped__
+        for kind, loader_type in _MANIFEST_LOADERS.items():
+            if type(loader) is loader_type:
+                break
+        else:
+            return
+        locations = spec.submodule_search_locations
+        self.entries[spec.name] = {
+            "origin": spec.origin,
+            "loader": kind,
+            "search_locations": list(locations) if locations is not None else None,
+        }
+
+    def snapshot(self, modules: Iterable = None):
+        """Record Specs of Already Imported Modules.
+        :param modules: Module names, defaults to everything in sys.modules.
+        """
+        for name in list(value_or(modules, sys.modules)):
+            spec = getattr(sys.modules.get(name), "__spec__", None)
+            if spec is not None and not isinstance(sys.modules[name], LazyModule):
+                self.add(spec)
+
+    @contextmanager
+    def record(self):
+        """Record Specs of every Module Imported in a Block.
+        :return: This manifest.
+        """
+        self._recording = True
+        sys.meta_path.insert(0, self)
+        try:
+            yield self
+        finally:
+            self._recording = False
+            self.uninstall()
+
+    def install(self):
+        """Serve Specs from the Manifest for Subsequent Imports."""
+        if not any(finder is self for finder in sys.meta_path):
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        """Stop Serving Specs from the Manifest."""
+        sys.meta_path[:] = [finder for finder in sys.meta_path if finder is not self]
+
+    def find_spec(self, name, path=None, target=None):
+        """Find Spec in the Manifest or, when Recording, with the Other Finders.
+        :param name:
+        :param path:
+        :param target:
+        :return:
+        """
+        if self._recording:
+            spec = _find_spec_after(self, name, path, target)
+            if spec is not None:
+                self.add(spec)
+            return spec
+        entry = self.entries.get(name)
+        if entry is None or not os.path.exists(entry["origin"]):
+            self._misses += 1
+            return None
+        self._hits += 1
+        origin = entry["origin"]
+        return spec_from_file_location(
+            name,
+            origin,
+            loader=_MANIFEST_LOADERS[entry["loader"]](name, origin),
+            submodule_search_locations=entry["search_locations"],
+        )
+
+    def freeze(self, path: AnyStr):
+        """Write Manifest to Disk.
+        :param path: Manifest file.
+        """
+        data = {
+            "version": sys.version,
+            "cache_tag": sys.implementation.cache_tag,
+            "entries": self.entries,
+        }
+        import json
+
+        temporary_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(temporary_path, "w") as manifest_file:
+            json.dump(data, manifest_file)
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: AnyStr, install: bool = False):
+        """Load Manifest from Disk.
+        A manifest written by another interpreter version loads empty.
+        :param path: Manifest file.
+        :param install: Install the manifest on sys.meta_path.
+        :return: Import manifest.
+        """
+        import json
+
+        try:
+            with open(path, "r") as manifest_file:
+                data = json.load(manifest_file)
+        except (OSError, ValueError):
+            data = {}
+        entries = None
+        if (
+            data.get("version") == sys.version
+            and data.get("cache_tag") == sys.implementation.cache_tag
+        ):
+            entries = data.get("entries")
+        manifest = cls(entries)
+        if install:
+            manifest.install()
+        return manifest
+
+
+def _resident_memory() -> Union[int, None]:
+    """
+    :return: Resident set size of the current process in bytes, if available.
+    """
+    try:
+        with open("/proc/self/statm", "r") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def _compile_module(module, workers: int) -> bool:
+    """Byte-Compile the Source Files of a Module or Package.
+    :param module: Imported module.
+    :param workers: Number of compiler processes for packages.
+    :return: True if every file compiled.
+    """
+    spec = getattr(module, "__spec__", None)
+    if spec is None or not spec.has_location:
+        return False
+    import compileall
+
+    if spec.submodule_search_locations:
+        return all(
+            compileall.compile_dir(location, quiet=1, workers=workers)
+            for location in spec.submodule_search_locations
+        )
+    if spec.origin.endswith(".py"):
+        return bool(compileall.compile_file(spec.origin, quiet=1))
+    return False
+
+
+def warm_imports(
+    names: Sequence[AnyStr],
+    package: AnyStr = None,
+    *,
+    compile: bool = True,
+    workers: int = None,
+    freeze_gc: bool = False,
+    log_error: Callable[[Any], None] = lambda s: None,
+    log_success: Callable[[Any], None] = lambda s: None
+) -> dict:
+    """Preimport Modules in a Prefork Parent.
+    Importing, and optionally byte-compiling, modules before forking lets the
+    children share the resulting pages copy-on-write instead of importing them
+    again after fork.
+    :param names: Names to import.
+    :param package: Anchor Package for relative imports.
+    :param compile: Byte-compile the packages of the imported modules.
+    :param workers: Number of compiler processes, defaults to the CPU count.
+    :param freeze_gc: Collect garbage and move all tracked objects into the
+        permanent generation (gc.freeze), so that collections in the children
+        do not touch them. This changes global interpreter state.
+    :param log_error: Log function for logging errors.
+    :param log_success: Log function for logging successes.
+    :return: Mapping from name to its success flag, import seconds, resident
+        memory delta in bytes and compilation flag.
+    """
+    report = {}
+    for name in names:
+        memory = _resident_memory()
+        start = perf_counter()
+        module, success = try_import(
+            name, package, log_error=log_error, log_success=log_success
+        )
+        elapsed = perf_counter() - start
+        after = _resident_memory()
+        report[name] = {
+            "module": module,
+            "success": success,
+            "seconds": elapsed,
+            "memory": after - memory if None not in (memory, after) else None,
+            "compiled": False,
+        }
+    if compile:
+        workers = value_or(workers, os.cpu_count() or 1)
+        for entry in report.values():
+            if entry["success"]:
+                entry["compiled"] = _compile_module(entry["module"], workers)
+    if freeze_gc and hasattr(gc, "freeze"):
+        gc.collect()
+        gc.freeze()
+    return report